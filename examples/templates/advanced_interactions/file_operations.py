@@ -12,6 +12,7 @@ import shutil
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from urllib.parse import urljoin
 
 # Add parent directory to path to import ga_scrap
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -80,84 +81,34 @@ class FileOperationsScraper:
             
             scraper.log(f"🔗 Found {len(download_links)} download links", "info")
             
-            # Download each file
-            for i, link in enumerate(download_links):
-                try:
-                    scraper.log(f"📥 Downloading file {i+1}/{len(download_links)}: {link}", "info")
-                    
-                    # Make link absolute if needed
-                    if link.startswith("/"):
-                        base_url = f"{scraper.page.url.split('/')[0]}//{scraper.page.url.split('/')[2]}"
-                        link = base_url + link
-                    elif not link.startswith("http"):
-                        base_url = "/".join(scraper.page.url.split("/")[:-1])
-                        link = f"{base_url}/{link}"
-                    
-                    # Download file
-                    download_result = self._download_file(scraper, link)
-                    self.downloaded_files.append(download_result)
-                    
-                    if download_result["success"]:
-                        scraper.log(f"✅ Downloaded: {download_result['filename']}", "success")
-                    else:
-                        scraper.log(f"❌ Failed to download: {link}", "error")
-                    
-                except Exception as e:
-                    scraper.log(f"❌ Error downloading {link}: {e}", "error")
-                    self.downloaded_files.append({
-                        "url": link,
-                        "success": False,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
+            # Make links absolute
+            page_url = scraper.page.url
+            download_links = [urljoin(page_url, link) for link in download_links]
+            
+            # Download in parallel with the browser's cookies (resumes partial files, skips finished ones)
+            results = scraper.download_files(download_links, concurrency=4, output_dir=str(self.downloads_dir))
+            for result in results:
+                download_result = {
+                    "url": result["url"],
+                    "success": result["error"] is None,
+                    "timestamp": datetime.now().isoformat()
+                }
+                if result["error"] is None:
+                    download_result.update({
+                        "filename": Path(result["path"]).name,
+                        "filepath": result["path"],
+                        "file_size": result["size"],
+                        "checksum": result["checksum"]
                     })
+                    scraper.log(f"✅ Downloaded: {download_result['filename']}", "success")
+                else:
+                    download_result["error"] = result["error"]
+                    scraper.log(f"❌ Failed to download: {result['url']}", "error")
+                self.downloaded_files.append(download_result)
             
             scraper.log(f"📥 Download complete! {len([f for f in self.downloaded_files if f['success']])} files downloaded", "success")
             return self.downloaded_files
     
-    def _download_file(self, scraper: SyncGAScrap, url: str) -> Dict[str, Any]:
-        """Download a single file"""
-        try:
-            # Start download
-            with scraper.page.expect_download() as download_info:
-                scraper.page.goto(url)
-            
-            download = download_info.value
-            
-            # Generate filename
-            suggested_filename = download.suggested_filename
-            if not suggested_filename:
-                # Extract filename from URL
-                suggested_filename = url.split("/")[-1].split("?")[0]
-                if not suggested_filename or "." not in suggested_filename:
-                    suggested_filename = f"download_{int(time.time())}.bin"
-            
-            # Save file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{timestamp}_{suggested_filename}"
-            filepath = self.downloads_dir / filename
-            
-            download.save_as(str(filepath))
-            
-            # Get file info
-            file_size = filepath.stat().st_size if filepath.exists() else 0
-            
-            return {
-                "url": url,
-                "filename": filename,
-                "filepath": str(filepath),
-                "file_size": file_size,
-                "success": True,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            return {
-                "url": url,
-                "success": False,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
-    
     def upload_files_to_form(self, url: str, upload_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Upload files to a web form
@@ -14,7 +14,8 @@ from typing import List, Dict, Any, Optional, Callable
 # Add parent directory to path to import ga_scrap
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from ga_scrap import SyncGAScrap
+from ga_scrap import SyncGAScrap, BloomFilter
+from ga_scrap.dedup import canonicalize_url
 
 class InfiniteScrollScraper:
     """Template for scraping infinite scroll and dynamic content"""
@@ -28,7 +29,8 @@ class InfiniteScrollScraper:
         """
         self.scroll_config = scroll_config or self._get_default_scroll_config()
         self.scraped_items = []
-        self.seen_items = set()
+        # Bloom filter keeps memory flat on feeds with millions of items
+        self.seen_items = BloomFilter(capacity=self.scroll_config.get("expected_items", 1_000_000))
         
     def _get_default_scroll_config(self) -> Dict[str, Any]:
         """Get default scrolling configuration"""
@@ -37,6 +39,7 @@ class InfiniteScrollScraper:
             "scroll_pause": 2.0,  # Seconds to wait after each scroll
             "max_scrolls": 10,  # Maximum number of scrolls
             "scroll_pixels": 1000,  # Pixels to scroll (if method is "pixels")
+            "expected_items": 1_000_000,  # Sizes the duplicate filter
             "load_timeout": 10.0,  # Timeout for content to load
             "duplicate_threshold": 3,  # Stop if this many consecutive duplicates
             "content_selector": ".item, .post, .product",  # Selector for content items
@@ -85,8 +88,7 @@ class InfiniteScrollScraper:
                 new_unique_items = 0
                 for item in new_items:
                     item_id = self._generate_item_id(item)
-                    if item_id not in self.seen_items:
-                        self.seen_items.add(item_id)
+                    if self.seen_items.add(item_id):
                         self.scraped_items.append(item)
                         new_unique_items += 1
                 
@@ -191,7 +193,11 @@ class InfiniteScrollScraper:
         # Common fields that might be unique
         for field in ["title", "url", "id", "link", "text"]:
             if field in item and item[field]:
-                id_fields.append(str(item[field])[:100])  # Limit length
+                value = str(item[field])
+                if field in ("url", "link"):
+                    # Tracking params and fragments would make the same item look new
+                    value = canonicalize_url(value)
+                id_fields.append(value[:100])  # Limit length
         
         if not id_fields:
             # Fallback to all non-metadata fields
@@ -17,6 +17,7 @@ import uuid
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from ga_scrap import SyncGAScrap
+from ga_scrap.sinks import ParquetSink, SQLiteSink
 
 class DatabaseExporter:
     """Template for scraping data and exporting to databases"""
@@ -32,6 +33,7 @@ class DatabaseExporter:
         self.db_type = db_type
         self.connection_params = connection_params or {}
         self.scraped_data = []
+        self.sqlite_sinks: Dict[str, SQLiteSink] = {}
         
         # Initialize database connection
         self.connection = self._init_database()
@@ -53,10 +55,17 @@ class DatabaseExporter:
         """Initialize SQLite database"""
         db_path = self.connection_params.get("database", "scraped_data.db")
         conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
         
         # Create tables if they don't exist
         self._create_sqlite_tables(conn)
         
+        # Inserts go through background writers that batch rows into transactions
+        self.sqlite_sinks = {
+            "scraped_data": SQLiteSink(db_path, table="scraped_data", key="id"),
+            "data_fields": SQLiteSink(db_path, table="data_fields", key="id")
+        }
+        
         print(f"✅ Connected to SQLite database: {db_path}")
         return conn
     
@@ -335,37 +344,28 @@ class DatabaseExporter:
             return False
     
     def _export_to_sqlite(self, data: Dict[str, Any]) -> bool:
-        """Export data to SQLite"""
-        cursor = self.connection.cursor()
-        
-        # Insert main record
-        cursor.execute("""
-            INSERT INTO scraped_data (id, url, title, content, scraped_at, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            data["id"],
-            data["url"],
-            data.get("title"),
-            data.get("content"),
-            data["scraped_at"],
-            json.dumps(data.get("metadata", {}))
-        ))
+        """Export data to SQLite (queued - committed in batches by the sink)"""
+        self.sqlite_sinks["scraped_data"].write({
+            "id": data["id"],
+            "url": data["url"],
+            "title": data.get("title"),
+            "content": data.get("content"),
+            "scraped_at": data["scraped_at"],
+            "metadata": json.dumps(data.get("metadata", {}))
+        })
         
         # Insert extracted fields
-        for field_name, field_value in data.get("extracted_fields", {}).items():
-            if field_value is not None:
-                cursor.execute("""
-                    INSERT INTO data_fields (id, scraped_data_id, field_name, field_value, field_type)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    str(uuid.uuid4()),
-                    data["id"],
-                    field_name,
-                    str(field_value) if not isinstance(field_value, list) else json.dumps(field_value),
-                    type(field_value).__name__
-                ))
-        
-        self.connection.commit()
+        self.sqlite_sinks["data_fields"].write_many(
+            {
+                "id": str(uuid.uuid4()),
+                "scraped_data_id": data["id"],
+                "field_name": field_name,
+                "field_value": str(field_value) if not isinstance(field_value, list) else json.dumps(field_value),
+                "field_type": type(field_value).__name__
+            }
+            for field_name, field_value in data.get("extracted_fields", {}).items()
+            if field_value is not None
+        )
         return True
     
     def _export_to_mysql(self, data: Dict[str, Any]) -> bool:
@@ -475,8 +475,49 @@ class DatabaseExporter:
         print(f"💾 Exported {len(data)} records to {filename}")
         return filename
     
+    def export_to_parquet(self, filename: str = None, row_group_size: int = 50000) -> str:
+        """Export scraped data to a compressed Parquet file (requires pyarrow)"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"scraped_data_{timestamp}.parquet"
+        
+        # Rows are streamed into row groups instead of loaded all at once
+        with ParquetSink(filename, row_group_size=row_group_size, background=False) as sink:
+            for record in self._iter_all_data(batch_size=row_group_size):
+                sink.write(record)
+        
+        print(f"💾 Exported {sink.records_written} records to {', '.join(str(f) for f in sink.files)}")
+        return filename
+    
+    def _iter_all_data(self, batch_size: int = 1000):
+        """Iterate over all data in the database without loading it at once"""
+        self._flush_sinks()
+        if self.db_type in ["sqlite", "mysql", "postgresql"]:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT * FROM scraped_data")
+            
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+        
+        elif self.db_type == "mongodb":
+            collection = self.connection["scraped_data"]
+            for document in collection.find({}):
+                document["_id"] = str(document["_id"])
+                yield document
+    
+    def _flush_sinks(self):
+        """Commit rows still queued in the SQLite writers"""
+        for sink in self.sqlite_sinks.values():
+            sink.flush()
+    
     def _get_all_data(self) -> List[Dict[str, Any]]:
         """Get all data from database"""
+        self._flush_sinks()
         if self.db_type in ["sqlite", "mysql", "postgresql"]:
             cursor = self.connection.cursor()
             cursor.execute("SELECT * FROM scraped_data")
@@ -495,6 +536,8 @@ class DatabaseExporter:
     def close_connection(self):
         """Close database connection"""
         if self.connection:
+            for sink in self.sqlite_sinks.values():
+                sink.close()
             if self.db_type in ["sqlite", "mysql", "postgresql"]:
                 self.connection.close()
             elif self.db_type == "mongodb":
@@ -7,9 +7,8 @@ import asyncio
 import sys
 import os
 import json
-import time
 import smtplib
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -17,7 +16,7 @@ from email.mime.multipart import MIMEMultipart
 # Add parent directory to path to import ga_scrap
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from ga_scrap import SyncGAScrap
+from ga_scrap import SyncGAScrap, JobScheduler
 
 class PriceMonitor:
     """Template for monitoring product prices and sending alerts"""
@@ -120,49 +119,49 @@ class PriceMonitor:
         print(f"⏰ Check interval: {self.config['check_interval_minutes']} minutes")
         print("Press Ctrl+C to stop monitoring")
         
-        try:
-            while True:
-                self._check_all_prices()
-                
-                # Wait for next check
-                wait_seconds = self.config["check_interval_minutes"] * 60
-                print(f"⏳ Waiting {self.config['check_interval_minutes']} minutes until next check...")
-                time.sleep(wait_seconds)
-                
-        except KeyboardInterrupt:
-            print("\n👋 Stopping price monitoring...")
+        # The scheduler keeps one browser warm between checks instead of
+        # launching a new one every cycle
+        scheduler = JobScheduler(headless=True, state_path="price_monitor_jobs.json")
+        scheduler.add_job(
+            self._check_all_prices,
+            self.config["check_interval_minutes"] * 60,
+            name="price_check",
+            start_now=True,
+            scraper_options={"sandbox_mode": True}
+        )
+        scheduler.start()
+        print("\n👋 Stopping price monitoring...")
     
-    def _check_all_prices(self):
+    def _check_all_prices(self, scraper: SyncGAScrap):
         """Check prices for all monitored products"""
         print(f"\n🔍 Checking prices at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         alerts = []
         
-        with SyncGAScrap(headless=True, sandbox_mode=True) as scraper:
-            for product in self.config["products"]:
-                if not product.get("active", True):
-                    continue
+        for product in self.config["products"]:
+            if not product.get("active", True):
+                continue
+                
+            try:
+                price_data = self._check_single_price(scraper, product)
+                if price_data:
+                    # Store price history
+                    product_id = product["name"]
+                    if product_id not in self.price_history:
+                        self.price_history[product_id] = []
                     
-                try:
-                    price_data = self._check_single_price(scraper, product)
-                    if price_data:
-                        # Store price history
-                        product_id = product["name"]
-                        if product_id not in self.price_history:
-                            self.price_history[product_id] = []
-                        
-                        self.price_history[product_id].append(price_data)
+                    self.price_history[product_id].append(price_data)
+                    
+                    # Check for price alert
+                    if price_data["price"] <= product["target_price"]:
+                        alerts.append({
+                            "product": product,
+                            "price_data": price_data
+                        })
                         
-                        # Check for price alert
-                        if price_data["price"] <= product["target_price"]:
-                            alerts.append({
-                                "product": product,
-                                "price_data": price_data
-                            })
-                            
-                except Exception as e:
-                    print(f"❌ Error checking {product['name']}: {e}")
-        
+            except Exception as e:
+                print(f"❌ Error checking {product['name']}: {e}")
+    
         # Save updated price history
         self._save_price_history()
         
@@ -19,7 +19,7 @@ import urllib.parse
 # Add parent directory to path to import ga_scrap
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from ga_scrap import SyncGAScrap
+from ga_scrap import SyncGAScrap, JobScheduler
 
 @dataclass
 class ScrapingMetric:
@@ -46,6 +46,7 @@ class ScrapingMonitor:
         self.metrics = []
         self.alerts = []
         self.is_monitoring = False
+        self.scheduler: Optional[JobScheduler] = None
         
         # Initialize database
         self._init_database()
@@ -231,78 +232,87 @@ class ScrapingMonitor:
         print(f"⏰ Check interval: {check_interval} seconds")
         print("Press Ctrl+C to stop monitoring")
         
-        try:
-            while self.is_monitoring:
-                self._monitor_urls(urls, selectors)
-                
-                if self.is_monitoring:  # Check again in case it was stopped
-                    print(f"⏳ Waiting {check_interval} seconds until next check...")
-                    time.sleep(check_interval)
-                    
-        except KeyboardInterrupt:
-            print("\n👋 Stopping monitoring...")
-            self.is_monitoring = False
+        # One warm browser serves every check; the scheduler never lets a slow
+        # check overlap the next one
+        self.scheduler = JobScheduler(headless=True, state_path=None)
+        self.scheduler.add_job(
+            self._monitor_urls,
+            check_interval,
+            name="url_monitor",
+            start_now=True,
+            args=(urls, selectors),
+            scraper_options={"sandbox_mode": True, "debug": False}
+        )
+        self.scheduler.start()
+        
+        print("\n👋 Stopping monitoring...")
+        self.is_monitoring = False
+    
+    def stop_monitoring(self):
+        """Stop monitoring after the running check finishes"""
+        self.is_monitoring = False
+        if self.scheduler is not None:
+            self.scheduler.stop()
     
-    def _monitor_urls(self, urls: List[str], selectors: Dict[str, str]):
+    def _monitor_urls(self, scraper: SyncGAScrap, urls: List[str], selectors: Dict[str, str]):
         """Monitor a batch of URLs"""
         print(f"\n🔍 Monitoring check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        with SyncGAScrap(headless=True, sandbox_mode=True, debug=False) as scraper:
-            for url in urls:
-                start_time = time.time()
+        for url in urls:
+            start_time = time.time()
+            
+            try:
+                # Navigate to URL
+                scraper.goto(url)
                 
-                try:
-                    # Navigate to URL
-                    scraper.goto(url)
-                    
-                    # Extract data to verify page is working
-                    data_extracted = False
-                    for field_name, selector in selectors.items():
-                        try:
-                            value = scraper.get_text(selector)
-                            if value:
-                                data_extracted = True
-                                break
-                        except:
-                            continue
-                    
-                    duration = time.time() - start_time
-                    
-                    # Get page size (approximate)
+                # Extract data to verify page is working
+                data_extracted = False
+                for field_name, selector in selectors.items():
                     try:
-                        content_length = len(scraper.page.content())
+                        value = scraper.get_text(selector)
+                        if value:
+                            data_extracted = True
+                            break
                     except:
-                        content_length = 0
-                    
-                    # Record successful metric
-                    metric = ScrapingMetric(
-                        timestamp=datetime.now().isoformat(),
-                        url=url,
-                        success=data_extracted,
-                        duration=duration,
-                        response_size=content_length,
-                        status_code=200 if data_extracted else None
-                    )
-                    
-                    self.record_metric(metric)
-                    
-                    status = "✅" if data_extracted else "⚠️"
-                    print(f"{status} {url} - {duration:.2f}s")
-                    
-                except Exception as e:
-                    duration = time.time() - start_time
-                    
-                    # Record failed metric
-                    metric = ScrapingMetric(
-                        timestamp=datetime.now().isoformat(),
-                        url=url,
-                        success=False,
-                        duration=duration,
-                        error_message=str(e)
-                    )
-                    
-                    self.record_metric(metric)
-                    print(f"❌ {url} - {str(e)[:50]}...")
+                        continue
+                
+                duration = time.time() - start_time
+                
+                # Get page size (approximate)
+                try:
+                    content_length = len(scraper.page.content())
+                except:
+                    content_length = 0
+                
+                # Record successful metric
+                metric = ScrapingMetric(
+                    timestamp=datetime.now().isoformat(),
+                    url=url,
+                    success=data_extracted,
+                    duration=duration,
+                    response_size=content_length,
+                    status_code=200 if data_extracted else None
+                )
+                
+                self.record_metric(metric)
+                
+                status = "✅" if data_extracted else "⚠️"
+                print(f"{status} {url} - {duration:.2f}s")
+                
+            except Exception as e:
+                duration = time.time() - start_time
+                
+                # Record failed metric
+                metric = ScrapingMetric(
+                    timestamp=datetime.now().isoformat(),
+                    url=url,
+                    success=False,
+                    duration=duration,
+                    error_message=str(e)
+                )
+                
+                self.record_metric(metric)
+                print(f"❌ {url} - {str(e)[:50]}...")
     
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Get data for monitoring dashboard"""
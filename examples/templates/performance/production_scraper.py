@@ -18,7 +18,9 @@ from enum import Enum
 # Add parent directory to path to import ga_scrap
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from ga_scrap import SyncGAScrap
+from ga_scrap import SyncGAScrap, TokenBucket
+from ga_scrap.politeness import get_host
+from ga_scrap.sinks import NDJSONSink
 
 class ScrapingStatus(Enum):
     """Enumeration for scraping status"""
@@ -50,6 +52,7 @@ class ProductionScraper:
         """
         self.config = config or self._get_default_config()
         self.results = []
+        self.host_buckets: Dict[str, TokenBucket] = {}
         self.stats = {
             "total_urls": 0,
             "successful": 0,
@@ -124,6 +127,7 @@ class ProductionScraper:
         """
         self.stats["total_urls"] = len(urls)
         self.stats["start_time"] = datetime.now()
+        self._open_sinks()
         
         self.logger.info(f"Starting production scraping of {len(urls)} URLs")
         
@@ -134,6 +138,13 @@ class ProductionScraper:
             timeout=self.config["timeout"]
         ) as scraper:
             
+            # Error screenshots: compact JPEGs encoded off the scraping loop, repeats stored once
+            scraper.configure_screenshots(
+                output_dir=self.config["output_dir"],
+                format="jpeg",
+                quality=self.config.get("screenshot_quality", 60)
+            )
+            
             for i, url in enumerate(urls):
                 # Check error threshold
                 if self._should_stop_due_to_errors():
@@ -141,20 +152,17 @@ class ProductionScraper:
                     break
                 
                 self.logger.info(f"Processing URL {i+1}/{len(urls)}: {url}")
+
+                # Rate limiting - only waits if this host was requested too recently
+                self._wait_for_host(url)
                 
                 # Scrape single URL with retries
                 result = self._scrape_single_url_with_retries(scraper, url, selectors, custom_handler)
                 self.results.append(result)
+                self._stream_result(result)
                 
                 # Update statistics
                 self._update_stats(result)
-                
-                # Rate limiting
-                if i < len(urls) - 1:  # Don't delay after last URL
-                    delay = self._calculate_delay()
-                    if delay > 0:
-                        self.logger.debug(f"Waiting {delay:.2f} seconds before next request")
-                        time.sleep(delay)
         
         self.stats["end_time"] = datetime.now()
         self._log_final_stats()
@@ -314,10 +322,9 @@ class ProductionScraper:
         """Save screenshot on error"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"error_{timestamp}_{attempt}_{url.replace('/', '_').replace(':', '')[:50]}.png"
-            filepath = os.path.join(self.config["output_dir"], filename)
-            scraper.screenshot(filepath)
-            self.logger.debug(f"Error screenshot saved: {filepath}")
+            name = f"error_{timestamp}_{attempt}_{url.replace('/', '_').replace(':', '')[:50]}"
+            filepath = scraper.capture_screenshot(name)
+            self.logger.debug(f"Error screenshot queued: {filepath}")
         except Exception as e:
             self.logger.warning(f"Could not save error screenshot: {e}")
     
@@ -336,14 +343,22 @@ class ProductionScraper:
         except Exception as e:
             self.logger.warning(f"Could not save error HTML: {e}")
     
-    def _calculate_delay(self) -> float:
-        """Calculate delay between requests"""
-        base_delay = self.config["request_delay"]
-        
-        # Add random jitter to avoid being detected as bot
-        jitter = random.uniform(0.5, 1.5)
-        
-        return base_delay * jitter
+    def _wait_for_host(self, url: str):
+        """Rate limit per host, so other hosts are not held back by this one"""
+        host = get_host(url)
+        bucket = self.host_buckets.get(host)
+        if bucket is None:
+            delay = self.config["request_delay"]
+            bucket = self.host_buckets[host] = TokenBucket(rate=1.0 / delay if delay > 0 else 0)
+
+        wait = bucket.wait_time()
+        if wait > 0:
+            # Add random jitter to avoid being detected as bot
+            wait *= random.uniform(1.0, 1.5)
+            self.logger.debug(f"Waiting {wait:.2f} seconds before next request to {host}")
+            time.sleep(wait)
+
+        bucket.try_acquire()
     
     def _should_stop_due_to_errors(self) -> bool:
         """Check if scraping should stop due to high error rate"""
@@ -385,42 +400,38 @@ class ProductionScraper:
         avg_attempts = total_attempts / len(self.results) if self.results else 0
         self.logger.info(f"Average Attempts per URL: {avg_attempts:.1f}")
     
-    def _save_results(self):
-        """Save scraping results to files"""
+    def _open_sinks(self):
+        """Open streaming output files so results hit the disk as they complete"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save detailed results
-        results_file = os.path.join(self.config["output_dir"], f"results_{timestamp}.json")
-        results_data = {
-            "stats": self.stats,
-            "config": self.config,
-            "results": [
-                {
-                    "url": r.url,
-                    "status": r.status.value,
-                    "data": r.data,
-                    "error": r.error,
-                    "attempts": r.attempts,
-                    "duration": r.duration,
-                    "timestamp": r.timestamp
-                }
-                for r in self.results
-            ]
-        }
-        
-        with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(results_data, f, indent=2, ensure_ascii=False, default=str)
-        
-        self.logger.info(f"Results saved to: {results_file}")
-        
-        # Save successful data only
-        successful_data = [r.data for r in self.results if r.status == ScrapingStatus.SUCCESS and r.data]
-        if successful_data:
-            data_file = os.path.join(self.config["output_dir"], f"data_{timestamp}.json")
-            with open(data_file, "w", encoding="utf-8") as f:
-                json.dump(successful_data, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"Successful data saved to: {data_file}")
+        output_dir = self.config["output_dir"]
+        self.stats_file = os.path.join(output_dir, f"stats_{timestamp}.json")
+        self.results_sink = NDJSONSink(os.path.join(output_dir, f"results_{timestamp}.jsonl"))
+        self.data_sink = NDJSONSink(os.path.join(output_dir, f"data_{timestamp}.jsonl"))
+    
+    def _stream_result(self, result: ScrapingResult):
+        """Write one result to the output files"""
+        self.results_sink.write({
+            "url": result.url,
+            "status": result.status.value,
+            "data": result.data,
+            "error": result.error,
+            "attempts": result.attempts,
+            "duration": result.duration,
+            "timestamp": result.timestamp
+        })
+        if result.status == ScrapingStatus.SUCCESS and result.data:
+            self.data_sink.write(result.data)
+    
+    def _save_results(self):
+        """Close the streaming output files and save run statistics"""
+        self.results_sink.close()
+        self.data_sink.close()
+        self.logger.info(f"Results saved to: {self.results_sink.path}")
+        if self.data_sink.records_written:
+            self.logger.info(f"Successful data saved to: {self.data_sink.path}")
+        
+        with open(self.stats_file, "w", encoding="utf-8") as f:
+            json.dump({"stats": self.stats, "config": self.config}, f, indent=2, ensure_ascii=False, default=str)
     
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate performance report"""
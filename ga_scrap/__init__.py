@@ -7,8 +7,25 @@ __author__ = "Grandpa Academy"
 
 from .core import GAScrap
 from .app_manager import AppManager
-from .hot_reload import HotReloader
+from .hot_reload import HotReloader, InProcessReloader
 from .simple import SimpleScraper, scrape, scrape_all, scrape_data
 from .translator import SyncGAScrap, create_scraper
+from .politeness import PolitenessScheduler, TokenBucket
+from .frontier import Frontier
+from .dedup import URLCanonicalizer, URLDeduplicator, BloomFilter, canonicalize_url
+from .screenshots import ScreenshotPipeline
+from .capture import ResponseCapture
+from .downloads import DownloadManager
+from .app_host import AppHost, BrowserPool
+from .jobs import JobScheduler, CronTrigger, IntervalTrigger
+from .workers import WorkerPool
+from .distributed import Coordinator, RemoteWorker
+from .sinks import NDJSONSink, GzipNDJSONSink, CSVSink, ParquetSink, SQLiteSink, open_sink
 
-__all__ = ["GAScrap", "SyncGAScrap", "create_scraper", "AppManager", "HotReloader", "SimpleScraper", "scrape", "scrape_all", "scrape_data"]
+__all__ = ["GAScrap", "SyncGAScrap", "create_scraper", "AppManager", "HotReloader", "InProcessReloader", "SimpleScraper", "scrape", "scrape_all", "scrape_data",
+           "PolitenessScheduler", "TokenBucket", "Frontier",
+           "URLCanonicalizer", "URLDeduplicator", "BloomFilter", "canonicalize_url",
+           "NDJSONSink", "GzipNDJSONSink", "CSVSink", "ParquetSink", "SQLiteSink", "open_sink",
+           "ScreenshotPipeline", "ResponseCapture", "DownloadManager", "AppHost", "BrowserPool",
+           "JobScheduler", "CronTrigger", "IntervalTrigger", "WorkerPool",
+           "Coordinator", "RemoteWorker"]
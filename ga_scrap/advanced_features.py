@@ -6,6 +6,8 @@ Contains every advanced Playwright feature for comprehensive web scraping
 import asyncio
 import json
 import base64
+import hashlib
+import time
 import mimetypes
 import re
 from typing import Optional, Dict, Any, List, Union, Callable, Pattern
@@ -15,6 +17,36 @@ from playwright.async_api import (
     Page, BrowserContext, ElementHandle, Locator, Request, Response,
     Route, Download, Video, CDPSession, FileChooser, Dialog
 )
+from .downloads import DownloadManager
+
+
+# Constant sources: the selector and names travel as arguments, so the browser
+# compiles each script once and quotes in selectors cannot break it
+_ATTRIBUTES_JS = """
+(elements, options) => elements.slice(0, options.limit == null ? elements.length : options.limit).map(element => {
+    const attrs = {};
+    if (options.names) {
+        for (const name of options.names) {
+            const value = element.getAttribute(name);
+            if (value !== null) attrs[name] = value;
+        }
+    } else {
+        for (const attr of element.attributes) attrs[attr.name] = attr.value;
+    }
+    return attrs;
+})
+"""
+
+_STYLES_JS = """
+(elements, options) => elements.slice(0, options.limit == null ? elements.length : options.limit).map(element => {
+    const computed = window.getComputedStyle(element);
+    const styles = {};
+    for (const name of options.names || Array.from(computed)) {
+        styles[name] = computed.getPropertyValue(name);
+    }
+    return styles;
+})
+"""
 
 
 class AdvancedPlaywrightFeatures:
@@ -44,7 +76,7 @@ class AdvancedPlaywrightFeatures:
                 # Continue with original request
                 await route.continue_()
         
-        await self.context.route(url_pattern, default_handler)
+        await self._register_route(url_pattern, default_handler)
         self.log(f"🕸️ Request interception set up for: {url_pattern}", "info")
     
     async def block_requests(self, resource_types: List[str] = None, url_patterns: List[str] = None):
@@ -78,7 +110,7 @@ class AdvancedPlaywrightFeatures:
             # Continue if not blocked
             await route.continue_()
         
-        await self.context.route("**/*", block_handler)
+        await self._register_route("**/*", block_handler)
         self.log(f"🚫 Request blocking enabled", "info")
     
     async def modify_responses(self, url_pattern: str, modifier: Callable):
@@ -105,7 +137,7 @@ class AdvancedPlaywrightFeatures:
             )
             self.log(f"✏️ Modified response: {request.url}", "debug")
         
-        await self.context.route(url_pattern, response_modifier)
+        await self._register_route(url_pattern, response_modifier)
         self.log(f"✏️ Response modification set up for: {url_pattern}", "info")
     
     # ==================== FILE OPERATIONS ====================
@@ -158,6 +190,61 @@ class AdvancedPlaywrightFeatures:
             self.log(f"Could not download file: {e}", "error")
             return None
     
+    async def create_download_manager(self, **options) -> DownloadManager:
+        """
+        Create a download manager that shares the browser's cookies, user agent,
+        proxy and ignore_https_errors setting
+        
+        Args:
+            **options: DownloadManager options (concurrency, max_per_host, content_addressed, ...)
+            
+        Returns:
+            DownloadManager instance
+        """
+        options.setdefault("output_dir", self.downloads_path)
+        options["concurrency"] = self._apply_quota(options.get("concurrency", 4))
+        options.setdefault("proxy", self.proxy)
+        options.setdefault("ignore_https_errors", self.ignore_https_errors)
+        headers = dict(options.pop("headers", None) or {})
+        
+        if self.context:
+            options.setdefault("cookies", await self.context.cookies())
+        if "User-Agent" not in headers:
+            user_agent = self.user_agent
+            if not user_agent and self.page and not self.page.is_closed():
+                user_agent = await self.page.evaluate("navigator.userAgent")
+            if user_agent:
+                headers["User-Agent"] = user_agent
+        
+        return DownloadManager(headers=headers, **options)
+    
+    async def download_files(self, items: List[Union[str, Dict[str, Any]]], concurrency: int = 4,
+                             **options) -> List[Dict[str, Any]]:
+        """
+        Download many files in parallel over HTTP, outside the page
+        
+        Args:
+            items: URLs, or dicts {'url', 'filename', 'checksum'}
+            concurrency: Maximum transfers at once (capped by max_concurrency)
+            **options: DownloadManager options (max_per_host, content_addressed, retries, ...)
+            
+        Returns:
+            Results {'url', 'path', 'size', 'checksum', 'skipped', 'error'} in input order
+        """
+        manager = await self.create_download_manager(concurrency=concurrency, **options)
+        try:
+            results = await manager.download_all(items)
+        finally:
+            manager.close()
+        
+        stats = manager.stats
+        self.log(
+            f"⬇️ Downloaded {stats['downloaded']} files ({stats['bytes'] / 1048576:.1f} MB), "
+            f"{stats['skipped']} skipped, {stats['resumed']} resumed, {stats['failed']} failed",
+            "success" if not stats["failed"] else "warning"
+        )
+        return results
+    
     async def save_page_as_pdf(self, filename: str = None, options: Dict[str, Any] = None, page: Optional[Page] = None) -> str:
         """
         Save page as PDF
@@ -193,6 +280,92 @@ class AdvancedPlaywrightFeatures:
             self.log(f"Could not save PDF: {e}", "error")
             return None
     
+    @staticmethod
+    def _pdf_filename(url: str) -> str:
+        """Stable, filesystem-safe PDF filename for a URL"""
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", re.sub(r"^https?://", "", url)).strip("_")[:80]
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
+        return f"{slug}_{digest}.pdf"
+    
+    async def save_pdfs(self, urls: List[str], concurrency: int = 4, options: Dict[str, Any] = None,
+                        output_dir: str = None, max_retries: int = 2, rate_per_host: float = 2.0,
+                        skip_existing: bool = True, filename_func: Callable = None,
+                        on_result: Callable = None) -> Dict[str, Any]:
+        """
+        Render many URLs to PDF concurrently over a pool of pages (Chromium only)
+        
+        Args:
+            urls: URLs to render
+            concurrency: Pages rendering at once (capped by max_concurrency)
+            options: PDF generation options (format, margin, print_background, ...)
+            output_dir: Directory for the PDFs (default: downloads path)
+            max_retries: Retries per URL after an error
+            rate_per_host: Requests per second allowed for each host
+            skip_existing: Skip URLs whose PDF already exists (resume an interrupted run)
+            filename_func: Function url -> filename (default: slug + hash of the URL)
+            on_result: Callback (sync or async) receiving each result as it completes
+            
+        Returns:
+            Summary {'saved', 'failed', 'skipped', 'bytes', 'elapsed', 'pages_per_second'}
+        """
+        output_path = Path(output_dir) if output_dir else Path(self.downloads_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+        filename_func = filename_func or self._pdf_filename
+        
+        pdf_options = {"format": "A4", "print_background": True, **(options or {})}
+        pdf_options.pop("path", None)
+        
+        summary = {"saved": 0, "failed": [], "skipped": 0, "bytes": 0}
+        pending = []
+        for url in urls:
+            if skip_existing and (output_path / filename_func(url)).exists():
+                summary["skipped"] += 1
+            else:
+                pending.append(url)
+        
+        async def render(page: Page, url: str) -> str:
+            target = output_path / filename_func(url)
+            partial = target.with_name(target.name + ".part")
+            # Chromium writes the PDF straight to disk; rename so partial files never look finished
+            await page.pdf(path=str(partial), **pdf_options)
+            partial.replace(target)
+            return str(target)
+        
+        async def collect(result: Dict[str, Any]):
+            if result["error"]:
+                summary["failed"].append({"url": result["url"], "error": result["error"]})
+            else:
+                summary["saved"] += 1
+                summary["bytes"] += Path(result["data"]).stat().st_size
+            if on_result is not None:
+                outcome = on_result(result)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+        
+        concurrency = self._apply_quota(concurrency)
+        started_at = time.time()
+        if pending:
+            await self.crawl(
+                pending,
+                handler=render,
+                concurrency=concurrency,
+                rate_per_host=rate_per_host,
+                max_per_host=concurrency,
+                max_retries=max_retries,
+                on_result=collect
+            )
+        
+        elapsed = max(time.time() - started_at, 1e-6)
+        summary["elapsed"] = elapsed
+        summary["pages_per_second"] = summary["saved"] / elapsed
+        self.log(
+            f"📄 Saved {summary['saved']} PDFs ({summary['bytes'] / 1048576:.1f} MB) in {elapsed:.1f}s "
+            f"- {summary['pages_per_second']:.2f} pages/s, {len(summary['failed'])} failed, "
+            f"{summary['skipped']} skipped",
+            "success"
+        )
+        return summary
+    
     # ==================== ADVANCED INTERACTIONS ====================
     
     async def drag_and_drop(self, source_selector: str, target_selector: str, page: Optional[Page] = None):
@@ -283,68 +456,80 @@ class AdvancedPlaywrightFeatures:
     
     # ==================== ADVANCED ELEMENT OPERATIONS ====================
     
-    async def get_element_attributes(self, selector: str, page: Optional[Page] = None) -> Dict[str, str]:
+    async def get_element_attributes(self, selector: str, page: Optional[Page] = None,
+                                     attributes: List[str] = None) -> Dict[str, str]:
         """
         Get all attributes of an element
         
         Args:
             selector: CSS selector
             page: Page to use (default: main page)
+            attributes: Only return these attributes
             
         Returns:
             Dictionary of attributes
         """
-        target_page = page or self.page
+        results = await self.get_elements_attributes(selector, attributes, page=page, limit=1)
+        return results[0] if results else {}
+    
+    async def get_elements_attributes(self, selector: str, attributes: List[str] = None,
+                                      page: Optional[Page] = None, limit: int = None) -> List[Dict[str, str]]:
+        """
+        Get the attributes of every element matching a selector in one browser call
         
+        Args:
+            selector: CSS selector
+            attributes: Only return these attributes (keeps the payload small)
+            page: Page to use (default: main page)
+            limit: Maximum number of elements
+            
+        Returns:
+            One dictionary of attributes per element, in document order
+        """
         try:
-            attributes = await target_page.evaluate(f"""
-                () => {{
-                    const element = document.querySelector('{selector}');
-                    if (!element) return {{}};
-                    
-                    const attrs = {{}};
-                    for (let attr of element.attributes) {{
-                        attrs[attr.name] = attr.value;
-                    }}
-                    return attrs;
-                }}
-            """)
-            return attributes
+            locator = self.cached_locator("css", selector, page=page)
+            return await locator.evaluate_all(_ATTRIBUTES_JS, {"names": attributes, "limit": limit})
         except Exception as e:
             self.log(f"Could not get attributes for '{selector}': {e}", "warning")
-            return {}
+            return []
     
-    async def get_element_styles(self, selector: str, page: Optional[Page] = None) -> Dict[str, str]:
+    async def get_element_styles(self, selector: str, page: Optional[Page] = None,
+                                 properties: List[str] = None) -> Dict[str, str]:
         """
         Get computed styles of an element
         
         Args:
             selector: CSS selector
             page: Page to use (default: main page)
+            properties: Only return these CSS properties
             
         Returns:
             Dictionary of computed styles
         """
-        target_page = page or self.page
+        results = await self.get_elements_styles(selector, properties, page=page, limit=1)
+        return results[0] if results else {}
+    
+    async def get_elements_styles(self, selector: str, properties: List[str] = None,
+                                  page: Optional[Page] = None, limit: int = None) -> List[Dict[str, str]]:
+        """
+        Get computed styles of every element matching a selector in one browser call
         
+        Args:
+            selector: CSS selector
+            properties: CSS properties to read, e.g. ['color', 'display'] (default: all of them,
+                        several hundred per element)
+            page: Page to use (default: main page)
+            limit: Maximum number of elements
+            
+        Returns:
+            One dictionary of computed styles per element, in document order
+        """
         try:
-            styles = await target_page.evaluate(f"""
-                () => {{
-                    const element = document.querySelector('{selector}');
-                    if (!element) return {{}};
-                    
-                    const computedStyles = window.getComputedStyle(element);
-                    const styles = {{}};
-                    for (let prop of computedStyles) {{
-                        styles[prop] = computedStyles.getPropertyValue(prop);
-                    }}
-                    return styles;
-                }}
-            """)
-            return styles
+            locator = self.cached_locator("css", selector, page=page)
+            return await locator.evaluate_all(_STYLES_JS, {"names": properties, "limit": limit})
         except Exception as e:
             self.log(f"Could not get styles for '{selector}': {e}", "warning")
-            return {}
+            return []
     
     async def wait_for_network_idle(self, timeout: int = 30000, page: Optional[Page] = None):
         """
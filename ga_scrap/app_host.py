@@ -0,0 +1,385 @@
+"""
+GA-Scrap App Host Module
+Run many workspace apps in one process over a shared browser pool
+"""
+
+import asyncio
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+import yaml
+from playwright.async_api import async_playwright, Browser, Playwright
+from colorama import Fore, Style
+from .core import GAScrap
+from .simple import SimpleScraper
+
+
+class BrowserPool:
+    """
+    Pool of shared browsers handing out isolated contexts
+
+    Every acquired scraper gets its own browser context (cookies, storage,
+    cache), so apps cannot see each other's sessions, while the expensive
+    browser processes are launched only once.
+    """
+
+    def __init__(
+        self,
+        browsers: int = 1,
+        headless: bool = True,
+        browser_type: str = "chromium",
+        profile: str = None,
+        **launch_settings
+    ):
+        """
+        Initialize browser pool
+
+        Args:
+            browsers: Number of browser processes to spread contexts over
+            headless: Run the browsers in headless mode
+            browser_type: Browser type ('chromium', 'firefox', 'webkit')
+            profile: Performance profile for the browsers and their contexts
+            **launch_settings: Further GAScrap options (launch_args, proxy, slow_mo, ...)
+        """
+        self.size = browsers
+        self.settings = {"headless": headless, "browser_type": browser_type, "profile": profile, **launch_settings}
+        # Builds the launch options exactly the way a standalone GAScrap would
+        self._template = GAScrap(**self.settings)
+
+        self.playwright: Optional[Playwright] = None
+        self.browsers: List[Optional[Browser]] = []
+        self._leases: Dict[int, int] = {}
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def start(self) -> "BrowserPool":
+        """Start Playwright and launch the browsers"""
+        self._lock = asyncio.Lock()
+        self.playwright = await async_playwright().start()
+        self.browsers = [None] * self.size
+        for slot in range(self.size):
+            await self._launch(slot)
+        return self
+
+    async def _launch(self, slot: int) -> Browser:
+        """Launch (or relaunch) the browser in a slot"""
+        launcher = getattr(self.playwright, self._template.browser_type, None)
+        if launcher is None:
+            raise ValueError(f"Unsupported browser type: {self._template.browser_type}")
+        browser = await launcher.launch(**self._template._build_launch_options())
+        self.browsers[slot] = browser
+        self._leases[slot] = 0
+        return browser
+
+    async def acquire(self, **options) -> GAScrap:
+        """
+        Get a started scraper with a fresh context on the least busy browser
+
+        Args:
+            **options: GAScrap options for this scraper (viewport, timeout, max_concurrency, ...)
+
+        Returns:
+            Started GAScrap; hand it back with release()
+        """
+        if self.playwright is None:
+            raise RuntimeError("Browser pool not started. Call start() first.")
+
+        async with self._lock:
+            slot = min(range(self.size), key=lambda i: self._leases.get(i, 0))
+            browser = self.browsers[slot]
+            if browser is None or not browser.is_connected():
+                browser = await self._launch(slot)
+            self._leases[slot] += 1
+
+        scraper = GAScrap(**{**self.settings, **options})
+        scraper._pool_slot = slot
+        try:
+            await scraper.start(browser=browser, playwright=self.playwright)
+        except Exception:
+            self._leases[slot] -= 1
+            raise
+        return scraper
+
+    async def release(self, scraper: GAScrap):
+        """
+        Close a scraper's context and return its browser slot
+
+        Args:
+            scraper: Scraper returned by acquire()
+        """
+        slot = getattr(scraper, "_pool_slot", None)
+        try:
+            await scraper.stop()
+        finally:
+            if slot is not None and self._leases.get(slot, 0) > 0:
+                self._leases[slot] -= 1
+
+    async def close(self):
+        """Close all browsers and stop Playwright"""
+        for browser in self.browsers:
+            if browser is not None:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+        self.browsers = []
+        self._leases = {}
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+
+class HostedApp:
+    """An app directory loaded as a module with a `run(scraper)` entry point"""
+
+    def __init__(self, path: Union[str, Path], concurrency: int = None, entry_point: str = "run"):
+        """
+        Initialize hosted app
+
+        Args:
+            path: App directory (containing main.py) or script file
+            concurrency: Pages the app may use at once (default: config.yaml 'host.concurrency' or 2)
+            entry_point: Name of the async function to run
+        """
+        path = Path(path).resolve()
+        self.script = path / "main.py" if path.is_dir() else path
+        self.directory = self.script.parent
+        self.name = self.directory.name if path.is_dir() else self.script.stem
+        self.entry_point = entry_point
+        self.config = self._read_config()
+
+        host_config = self.config.get("host") or {}
+        self.concurrency = concurrency or host_config.get("concurrency", 2)
+        self.module = None
+
+    def _read_config(self) -> Dict[str, Any]:
+        """Read the app's config.yaml (if any)"""
+        config_file = self.directory / "config.yaml"
+        if not config_file.exists():
+            return {}
+        try:
+            return yaml.safe_load(config_file.read_text()) or {}
+        except Exception:
+            return {}
+
+    def scraper_options(self) -> Dict[str, Any]:
+        """GAScrap options for this app's context"""
+        browser = self.config.get("browser") or {}
+        options = {"max_concurrency": self.concurrency}
+        if browser.get("viewport"):
+            options["viewport"] = browser["viewport"]
+        if browser.get("timeout"):
+            options["timeout"] = browser["timeout"]
+        return options
+
+    def load(self):
+        """
+        Import the app's main script
+
+        The app's own modules are taken out of sys.modules after the import, so
+        two apps with a 'utils.py' each keep the module they imported. The app
+        directory stays on sys.path until unload(), so imports inside the entry
+        point still work (modules first imported there are shared by name).
+        """
+        if not self.script.exists():
+            raise FileNotFoundError(f"Script not found: {self.script}")
+
+        before = set(sys.modules)
+        if str(self.directory) not in sys.path:
+            sys.path.insert(0, str(self.directory))
+        try:
+            spec = importlib.util.spec_from_file_location(f"ga_scrap_app_{self.name}", self.script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            if not callable(getattr(module, self.entry_point, None)):
+                raise AttributeError(
+                    f"{self.script.name} has no '{self.entry_point}(scraper)' function - "
+                    f"move the scraping code of main() into 'async def {self.entry_point}(scraper)'"
+                )
+        except Exception:
+            self.unload()
+            raise
+        finally:
+            for name in set(sys.modules) - before:
+                module_file = getattr(sys.modules[name], "__file__", None)
+                if module_file and self.directory in Path(module_file).resolve().parents:
+                    del sys.modules[name]
+
+        self.module = module
+        return module
+
+    def unload(self):
+        """Take the app directory off sys.path again"""
+        if str(self.directory) in sys.path:
+            sys.path.remove(str(self.directory))
+
+    async def run(self, scraper: GAScrap):
+        """Run the app's entry point against a scraper"""
+        result = getattr(self.module, self.entry_point)(SimpleScraper(scraper=scraper))
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+
+class AppHost:
+    """
+    Host that runs many GA-Scrap apps in one process
+
+    Features:
+    - Apps are imported as modules instead of started as separate processes
+    - All apps share the browsers of one BrowserPool, each in its own context
+    - Per-app concurrency quotas (GAScrap.max_concurrency) and a cap on apps running at once
+    - Optional interval for running the apps again and again; only the last
+      round's results are kept, with per-app run counters in `stats`
+    """
+
+    def __init__(
+        self,
+        apps: List[Union[str, Path]],
+        pool: Optional[BrowserPool] = None,
+        max_apps: int = 4,
+        quotas: Dict[str, int] = None,
+        interval: Optional[float] = None,
+        entry_point: str = "run"
+    ):
+        """
+        Initialize app host
+
+        Args:
+            apps: App directories (or script files)
+            pool: Shared browser pool (default: one headless Chromium)
+            max_apps: Apps running at the same time
+            quotas: Concurrency quota per app name (overrides config.yaml)
+            interval: Seconds between rounds; None runs every app once
+            entry_point: Name of the async function each app defines
+        """
+        quotas = quotas or {}
+        self.apps = []
+        for app in apps:
+            hosted = HostedApp(app, entry_point=entry_point)
+            if hosted.name in quotas:
+                hosted.concurrency = quotas[hosted.name]
+            self.apps.append(hosted)
+
+        self.pool = pool or BrowserPool()
+        self.max_apps = max_apps
+        self.interval = interval
+        self.results: List[Dict[str, Any]] = []
+        self.stats: Dict[str, Dict[str, int]] = {app.name: {"runs": 0, "failed": 0} for app in self.apps}
+        self._load_errors: List[Dict[str, Any]] = []
+        self._stop_event: Optional[asyncio.Event] = None
+
+    def _log(self, message: str, level: str = "info"):
+        """Log message with color coding"""
+        colors = {
+            'info': Fore.CYAN,
+            'warning': Fore.YELLOW,
+            'error': Fore.RED,
+            'success': Fore.GREEN,
+            'debug': Fore.MAGENTA
+        }
+        color = colors.get(level, Fore.WHITE)
+        print(f"{color}[App Host] {message}{Style.RESET_ALL}")
+
+    def load(self) -> List[HostedApp]:
+        """
+        Import every app; apps that fail to import are reported and left out
+
+        Returns:
+            Apps that are ready to run
+        """
+        ready = []
+        for app in self.apps:
+            try:
+                app.load()
+                ready.append(app)
+            except Exception as e:
+                self._log(f"❌ {app.name}: {e}", "error")
+                self._load_errors.append({"app": app.name, "ok": False, "error": str(e), "elapsed": 0.0})
+        self.results = list(self._load_errors)
+        self.apps = ready
+        return ready
+
+    async def _run_app(self, app: HostedApp, limiter: asyncio.Semaphore) -> Dict[str, Any]:
+        """Run one app in its own context"""
+        async with limiter:
+            started = time.perf_counter()
+            scraper = None
+            try:
+                scraper = await self.pool.acquire(**app.scraper_options())
+                await app.run(scraper)
+                result = {"app": app.name, "ok": True, "error": None}
+                self._log(f"✅ {app.name} finished in {time.perf_counter() - started:.1f}s", "success")
+            except Exception as e:
+                result = {"app": app.name, "ok": False, "error": str(e)}
+                self._log(f"❌ {app.name} failed: {e}", "error")
+            finally:
+                if scraper is not None:
+                    await self.pool.release(scraper)
+            result["elapsed"] = time.perf_counter() - started
+            stats = self.stats.setdefault(app.name, {"runs": 0, "failed": 0})
+            stats["runs"] += 1
+            stats["failed"] += int(not result["ok"])
+            return result
+
+    async def run_round(self) -> List[Dict[str, Any]]:
+        """
+        Run every loaded app once
+
+        Returns:
+            One result per app {'app', 'ok', 'error', 'elapsed'}
+        """
+        limiter = asyncio.Semaphore(self.max_apps)
+        results = list(await asyncio.gather(*(self._run_app(app, limiter) for app in self.apps)))
+        # Only the latest round is kept, so a long-running host does not grow
+        self.results = self._load_errors + results
+        return results
+
+    async def run(self) -> List[Dict[str, Any]]:
+        """
+        Load the apps, start the pool and run the apps (once, or every `interval` seconds)
+
+        Returns:
+            Results of the last round (and of apps that failed to load)
+        """
+        if not self.load():
+            return self.results
+
+        self._log(f"🚀 Hosting {len(self.apps)} apps on {self.pool.size} shared browser(s)", "info")
+        self._stop_event = asyncio.Event()
+        await self.pool.start()
+        try:
+            while True:
+                round_started = time.monotonic()
+                await self.run_round()
+                if self.interval is None or self._stop_event.is_set():
+                    break
+                delay = max(0.0, self.interval - (time.monotonic() - round_started))
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.pool.close()
+            for app in self.apps:
+                app.unload()
+
+        runs = sum(stats["runs"] for stats in self.stats.values())
+        failed = sum(stats["failed"] for stats in self.stats.values())
+        self._log(f"📊 {runs - failed} runs succeeded, {failed} failed", "info")
+        return self.results
+
+    def stop(self):
+        """Finish the current round and stop"""
+        if self._stop_event is not None:
+            self._stop_event.set()
@@ -157,37 +157,41 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ga_scrap import SimpleScraper
 
-async def main():
-    """Main scraper function - Super Easy!"""
+async def run(scraper):
+    """Scraping logic - `ga-scrap dev --in-process` re-runs this on every save"""
 
-    # Use SimpleScraper for the easiest experience
-    async with SimpleScraper() as scraper:
+    # Navigate to a website
+    await scraper.go("https://quotes.toscrape.com")
+
+    # Get page title (super easy!)
+    title = await scraper.get("title")
+    scraper.log(f"Page title: {{title}}")
 
-        # Navigate to a website
-        await scraper.go("https://quotes.toscrape.com")
+    # Get the first quote
+    first_quote = await scraper.get(".quote .text")
+    scraper.log(f"First quote: {{first_quote}}")
 
-        # Get page title (super easy!)
-        title = await scraper.get("title")
-        scraper.log(f"Page title: {{title}}")
+    # Get all quotes (even easier!)
+    all_quotes = await scraper.get_all(".quote .text")
+    scraper.log(f"Found {{len(all_quotes)}} quotes")
 
-        # Get the first quote
-        first_quote = await scraper.get(".quote .text")
-        scraper.log(f"First quote: {{first_quote}}")
+    # Show first few quotes
+    for i, quote in enumerate(all_quotes[:3], 1):
+        scraper.log(f"Quote {{i}}: {{quote[:50]}}...")
 
-        # Get all quotes (even easier!)
-        all_quotes = await scraper.get_all(".quote .text")
-        scraper.log(f"Found {{len(all_quotes)}} quotes")
+    # Get all authors
+    authors = await scraper.get_all(".quote .author")
+    scraper.log(f"Found {{len(authors)}} authors")
 
-        # Show first few quotes
-        for i, quote in enumerate(all_quotes[:3], 1):
-            scraper.log(f"Quote {{i}}: {{quote[:50]}}...")
+    # Take a screenshot
+    await scraper.screenshot("my_scraper_screenshot.png")
 
-        # Get all authors
-        authors = await scraper.get_all(".quote .author")
-        scraper.log(f"Found {{len(authors)}} authors")
+async def main():
+    """Main scraper function - Super Easy!"""
 
-        # Take a screenshot
-        await scraper.screenshot("my_scraper_screenshot.png")
+    # Use SimpleScraper for the easiest experience
+    async with SimpleScraper() as scraper:
+        await run(scraper)
 
         # Pause to see the browser in action
         await scraper.pause("Scraping complete! Check the browser. Press Enter to finish...")
@@ -271,6 +275,7 @@ Edit `config.yaml` to customize the scraper behavior.
 - Easy configuration
 - Built-in logging and error handling
 - Hot reload support (when using GA-Scrap CLI)
+- `ga-scrap dev --in-process` keeps the browser open and re-runs `run(scraper)` on every save
 
 ## Usage
 
@@ -301,9 +306,10 @@ Advanced scraping utilities
 """
 
 import json
-import csv
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
+from ga_scrap.sinks import open_sink, CSVSink, ParquetSink
+from ga_scrap.tables import read_tables
 
 class DataExporter:
     """Export scraped data to various formats"""
@@ -312,24 +318,39 @@ class DataExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
     
-    def to_json(self, data: List[Dict[Any, Any]], filename: str):
-        """Export data to JSON"""
+    def stream(self, filename: str, fmt: str = "jsonl", **options):
+        """Open a streaming sink (jsonl, jsonl.gz, csv, parquet) - write records as they are scraped"""
+        filepath = self.output_dir / f"{filename}.{fmt}"
+        print(f"Streaming data to {filepath}")
+        return open_sink(filepath, **options)
+    
+    def to_json(self, data: Iterable[Dict[Any, Any]], filename: str):
+        """Export data to JSON (records are written one by one, so generators work too)"""
         filepath = self.output_dir / f"{filename}.json"
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("[")
+            for i, record in enumerate(data):
+                f.write(",\\n" if i else "\\n")
+                f.write(json.dumps(record, ensure_ascii=False, default=str))
+            f.write("\\n]\\n")
         print(f"Data exported to {filepath}")
     
-    def to_csv(self, data: List[Dict[Any, Any]], filename: str):
-        """Export data to CSV"""
-        if not data:
-            return
-        
+    def to_parquet(self, data: Iterable[Dict[Any, Any]], filename: str, **options):
+        """Export data to compressed Parquet (requires pyarrow) - schema is inferred from the records"""
+        filepath = self.output_dir / f"{filename}.parquet"
+        with ParquetSink(filepath, background=False, **options) as sink:
+            for record in data:
+                sink.write(record)
+        print(f"Data exported to {', '.join(str(f) for f in sink.files)}")
+    
+    def to_csv(self, data: Iterable[Dict[Any, Any]], filename: str):
+        """Export data to CSV (columns come from the first record)"""
         filepath = self.output_dir / f"{filename}.csv"
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-        print(f"Data exported to {filepath}")
+        with CSVSink(filepath, background=False) as sink:
+            for record in data:
+                sink.write(record)
+        if sink.records_written:
+            print(f"Data exported to {filepath}")
 
 class ScrapingUtils:
     """Utility functions for scraping"""
@@ -338,37 +359,16 @@ class ScrapingUtils:
     async def wait_for_element(page, selector: str, timeout: int = 10000):
         """Wait for element to appear"""
         try:
-            await page.wait_for_selector(selector, timeout=timeout)
+            await page.locator(selector).first.wait_for(timeout=timeout)
             return True
         except:
             return False
     
     @staticmethod
     async def extract_table_data(page, table_selector: str) -> List[Dict[str, str]]:
-        """Extract data from HTML table"""
-        rows = await page.query_selector_all(f"{table_selector} tr")
-        if not rows:
-            return []
-        
-        # Get headers
-        header_cells = await rows[0].query_selector_all("th, td")
-        headers = []
-        for cell in header_cells:
-            text = await cell.inner_text()
-            headers.append(text.strip())
-        
-        # Get data rows
-        data = []
-        for row in rows[1:]:
-            cells = await row.query_selector_all("td")
-            if len(cells) == len(headers):
-                row_data = {}
-                for i, cell in enumerate(cells):
-                    text = await cell.inner_text()
-                    row_data[headers[i]] = text.strip()
-                data.append(row_data)
-        
-        return data
+        """Extract data from HTML table - the whole table is read in one browser call"""
+        tables = await read_tables(page, table_selector, limit=1)
+        return tables[0] if tables else []
 '''
         
         (app_dir / "utils.py").write_text(advanced_py)
@@ -401,18 +401,14 @@ async def scrape_product_details(scraper, product_url: str) -> dict:
     for field, selector in selectors.items():
         try:
             if field == 'images':
-                elements = await scraper.page.query_selector_all(selector)
-                urls = []
-                for img in elements[:5]:  # Limit to 5 images
-                    src = await img.get_attribute('src')
-                    if src:
-                        urls.append(src)
-                product_data[field] = urls
+                sources = await scraper.page.locator(selector).evaluate_all(
+                    "imgs => imgs.map(img => img.getAttribute('src'))"
+                )
+                product_data[field] = [src for src in sources if src][:5]  # Limit to 5 images
             else:
-                element = await scraper.page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
-                    product_data[field] = text.strip()
+                texts = await scraper.page.locator(selector).first.all_inner_texts()
+                if texts:
+                    product_data[field] = texts[0].strip()
         except Exception as e:
             scraper.log(f"Could not extract {field}: {e}", "warning")
     
@@ -424,11 +420,12 @@ async def scrape_product_list(scraper, category_url: str, max_products: int = 50
     await scraper.goto(category_url)
     
     products = []
-    product_links = await scraper.page.query_selector_all('a[href*="product"], .product-link')
+    product_links = await scraper.page.locator('a[href*="product"], .product-link').evaluate_all(
+        "links => links.map(link => link.getAttribute('href'))"
+    )
     
-    for i, link in enumerate(product_links[:max_products]):
+    for i, href in enumerate(product_links[:max_products]):
         try:
-            href = await link.get_attribute('href')
             if href:
                 # Convert relative URLs to absolute
                 if href.startswith('/'):
@@ -483,11 +480,13 @@ async def scrape_social_posts(scraper, profile_url: str, max_posts: int = 20) ->
     ]
     
     for selector in post_selectors:
-        post_elements = await scraper.page.query_selector_all(selector)
-        if post_elements:
-            scraper.log(f"Found {len(post_elements)} posts with selector: {selector}", "info")
+        post_elements = scraper.page.locator(selector)
+        post_count = await post_elements.count()
+        if post_count:
+            scraper.log(f"Found {post_count} posts with selector: {selector}", "info")
             
-            for i, post in enumerate(post_elements[:max_posts]):
+            for i in range(min(post_count, max_posts)):
+                post = post_elements.nth(i)
                 try:
                     # Extract post data
                     post_data = await extract_post_data(post)
@@ -501,41 +500,28 @@ async def scrape_social_posts(scraper, profile_url: str, max_posts: int = 20) ->
     
     return posts
 
-async def extract_post_data(post_element) -> dict:
-    """Extract data from a single post element"""
+async def extract_post_data(post) -> dict:
+    """Extract data from a single post (a locator - no element handles are pinned)"""
     
     post_data = {}
+    fields = {
+        'text': 'p, .text, .content',
+        'author': '.author, .username, .name',
+        'timestamp': 'time, .timestamp, .date',
+        'likes': '.likes, [aria-label*="like"]'  # Engagement metrics
+    }
     
     try:
-        # Text content
-        text_element = await post_element.query_selector('p, .text, .content')
-        if text_element:
-            post_data['text'] = await text_element.inner_text()
-        
-        # Author
-        author_element = await post_element.query_selector('.author, .username, .name')
-        if author_element:
-            post_data['author'] = await author_element.inner_text()
-        
-        # Timestamp
-        time_element = await post_element.query_selector('time, .timestamp, .date')
-        if time_element:
-            post_data['timestamp'] = await time_element.inner_text()
-        
-        # Engagement metrics
-        likes_element = await post_element.query_selector('.likes, [aria-label*="like"]')
-        if likes_element:
-            post_data['likes'] = await likes_element.inner_text()
+        for field, selector in fields.items():
+            texts = await post.locator(selector).first.all_inner_texts()
+            if texts:
+                post_data[field] = texts[0]
         
         # Images
-        img_elements = await post_element.query_selector_all('img')
-        if img_elements:
-            images = []
-            for img in img_elements:
-                src = await img.get_attribute('src')
-                if src and 'profile' not in src.lower():  # Skip profile images
-                    images.append(src)
-            post_data['images'] = images
+        sources = await post.locator('img').evaluate_all("imgs => imgs.map(img => img.getAttribute('src'))")
+        if sources:
+            # Skip profile images
+            post_data['images'] = [src for src in sources if src and 'profile' not in src.lower()]
         
     except Exception as e:
         print(f"Error extracting post data: {e}")
@@ -0,0 +1,235 @@
+"""
+GA-Scrap Capture Module
+Capture XHR/fetch JSON responses as a data source
+"""
+
+import asyncio
+import inspect
+import json
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List, Callable, Union, Pattern, Set, Iterable
+from playwright.async_api import Response
+
+
+# Bodies larger than this are parsed in a worker thread instead of on the event loop
+_THREAD_PARSE_BYTES = 256 * 1024
+
+
+class ResponseCapture:
+    """
+    Response capture
+
+    Features:
+    - Filters responses by URL, content type, resource type and status
+      before touching the body
+    - Reads and parses matching bodies in background tasks, so the
+      response listener never blocks the page
+    - Streams parsed records to a callback (sync or async), a sink, or
+      keeps the latest ones in memory
+    """
+
+    def __init__(
+        self,
+        url: Union[str, Pattern, Callable[[Response], bool], None] = None,
+        content_types: Iterable[str] = ("json",),
+        resource_types: Optional[Iterable[str]] = ("xhr", "fetch"),
+        ok_only: bool = True,
+        callback: Optional[Callable] = None,
+        sink: Any = None,
+        max_body_bytes: Optional[int] = None,
+        max_records: int = 1000
+    ):
+        """
+        Initialize response capture
+
+        Args:
+            url: URL substring, regex or predicate(response) a response must match
+            content_types: Content-type substrings to accept (any if empty)
+            resource_types: Request resource types to accept (None for any)
+            ok_only: Skip responses without a 2xx status
+            callback: Called with every record (sync or async)
+            sink: Object with a write(record) method (e.g. an NDJSONSink)
+            max_body_bytes: Skip bodies larger than this
+            max_records: Records kept in memory when there is no callback or sink
+        """
+        self.url = url
+        self.content_types = tuple(content_type.lower() for content_type in content_types)
+        self.resource_types = set(resource_types) if resource_types is not None else None
+        self.ok_only = ok_only
+        self.callback = callback
+        self.sink = sink
+        self.max_body_bytes = max_body_bytes
+        self.records: deque = deque(maxlen=max_records)
+
+        self.stats = {"seen": 0, "matched": 0, "captured": 0, "skipped": 0, "failed": 0, "bytes": 0}
+        self.last_error: Optional[BaseException] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def matches(self, response: Response) -> bool:
+        """Check a response against the filters (headers only, no body read)"""
+        if self.ok_only and not response.ok:
+            return False
+        # Redirects have no body to read
+        if 300 <= response.status < 400:
+            return False
+        if self.resource_types is not None and response.request.resource_type not in self.resource_types:
+            return False
+
+        headers = response.headers
+        if self.content_types:
+            content_type = headers.get("content-type", "").lower()
+            if not any(accepted in content_type for accepted in self.content_types):
+                return False
+        if self.max_body_bytes is not None:
+            length = headers.get("content-length")
+            if length and length.isdigit() and int(length) > self.max_body_bytes:
+                return False
+
+        if self.url is None:
+            return True
+        if callable(self.url):
+            return bool(self.url(response))
+        if isinstance(self.url, str):
+            return self.url in response.url
+        return bool(self.url.search(response.url))
+
+    def on_response(self, response: Response):
+        """Response listener: queue matching responses for reading"""
+        self.stats["seen"] += 1
+        try:
+            if not self.matches(response):
+                return
+        except Exception as e:
+            # Predicates and headers of torn-down responses may raise
+            self.stats["failed"] += 1
+            self.last_error = e
+            return
+
+        self.stats["matched"] += 1
+        task = asyncio.ensure_future(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response: Response):
+        """Read, parse and deliver one response body"""
+        try:
+            body = await response.body()
+            if self.max_body_bytes is not None and len(body) > self.max_body_bytes:
+                self.stats["skipped"] += 1
+                return
+            if len(body) > _THREAD_PARSE_BYTES:
+                data = await asyncio.get_running_loop().run_in_executor(None, json.loads, body)
+            else:
+                data = json.loads(body)
+        except Exception as e:
+            # Body gone (page closed, navigated) or not JSON after all
+            self.stats["failed"] += 1
+            self.last_error = e
+            return
+
+        request = response.request
+        try:
+            post_data = request.post_data
+        except Exception:
+            post_data = "<binary data>"
+
+        record = {
+            "url": response.url,
+            "status": response.status,
+            "method": request.method,
+            "resource_type": request.resource_type,
+            "post_data": post_data,
+            "timestamp": time.time(),
+            "data": data,
+        }
+        self.stats["captured"] += 1
+        self.stats["bytes"] += len(body)
+
+        try:
+            await self._deliver(record)
+        except Exception as e:
+            self.stats["failed"] += 1
+            self.last_error = e
+
+    async def _deliver(self, record: Dict[str, Any]):
+        """Hand a record to the callback and/or sink, or keep it in memory"""
+        if self.callback is not None:
+            result = self.callback(record)
+            if inspect.isawaitable(result):
+                await result
+        if self.sink is not None:
+            self.sink.write(record)
+        if self.callback is None and self.sink is None:
+            self.records.append(record)
+
+    @property
+    def pending(self) -> int:
+        """Responses still being read"""
+        return len(self._pending)
+
+    async def drain(self):
+        """Wait until every matched response has been read and delivered"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def data(self) -> List[Any]:
+        """Parsed bodies of the records kept in memory"""
+        return [record["data"] for record in self.records]
+
+
+class ResponseCaptureFeatures:
+    """Mixin class for capturing JSON API responses"""
+
+    # ==================== RESPONSE CAPTURE ====================
+
+    def capture_responses(
+        self,
+        url: Union[str, Pattern, Callable[[Response], bool], None] = None,
+        content_types: Iterable[str] = ("json",),
+        resource_types: Optional[Iterable[str]] = ("xhr", "fetch"),
+        callback: Optional[Callable] = None,
+        sink: Any = None,
+        **options
+    ) -> ResponseCapture:
+        """
+        Start capturing JSON responses of every page in the context
+
+        The capture survives context recycling and crash recovery. Stop it
+        with stop_capture().
+
+        Args:
+            url: URL substring, regex or predicate(response) a response must match
+            content_types: Content-type substrings to accept (default: anything JSON)
+            resource_types: Request resource types to accept (default: XHR and fetch)
+            callback: Called with every record (sync or async)
+            sink: Object with a write(record) method (e.g. an NDJSONSink)
+            **options: ResponseCapture options (ok_only, max_body_bytes, max_records)
+
+        Returns:
+            ResponseCapture; records are {'url', 'status', 'method', 'resource_type',
+            'post_data', 'timestamp', 'data'}
+        """
+        capture = ResponseCapture(url, content_types, resource_types, callback=callback, sink=sink, **options)
+        self.on_context_event("response", capture.on_response)
+        self._response_captures.append(capture)
+        self.log(f"📡 Capturing responses{f' for {url}' if url else ''}", "info")
+        return capture
+
+    async def stop_capture(self, capture: ResponseCapture) -> Dict[str, int]:
+        """
+        Stop a response capture once its pending responses are delivered
+
+        Args:
+            capture: Capture returned by capture_responses()
+
+        Returns:
+            The capture's statistics
+        """
+        self.off_context_event("response", capture.on_response)
+        if capture in self._response_captures:
+            self._response_captures.remove(capture)
+        await capture.drain()
+        self.log(f"📡 Response capture stopped ({capture.stats['captured']} captured, "
+                 f"{capture.stats['failed']} failed)", "info")
+        return dict(capture.stats)
@@ -154,7 +154,9 @@ def delete(app_name):
 
 @cli.command()
 @click.option('--app-dir', '-d', default='.', help='App directory (default: current directory)')
-def dev(app_dir):
+@click.option('--in-process', is_flag=True, help="Keep the browser open and re-run main.py's run(scraper) on changes")
+@click.option('--profile', '-p', default=None, help='Performance profile (see: ga-scrap profiles)')
+def dev(app_dir, in_process, profile):
     """Start development server with hot reload"""
     app_path = Path(app_dir).resolve()
     
@@ -166,8 +168,11 @@ def dev(app_dir):
         print(f"{Fore.YELLOW}💡 Or create a new app with: ga-scrap create <app_name>{Style.RESET_ALL}")
         return
     
+    if not use_profile(profile):
+        return
+    
     try:
-        dev_server = DevServer(str(app_path))
+        dev_server = DevServer(str(app_path), in_process=in_process)
         dev_server.start()
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}👋 Development server stopped{Style.RESET_ALL}")
@@ -177,7 +182,9 @@ def dev(app_dir):
 @cli.command()
 @click.argument('script_path')
 @click.option('--watch-dir', '-w', multiple=True, help='Additional directories to watch')
-def run(script_path, watch_dir):
+@click.option('--in-process', is_flag=True, help="Keep the browser open and re-run the script's run(scraper) on changes")
+@click.option('--profile', '-p', default=None, help='Performance profile (see: ga-scrap profiles)')
+def run(script_path, watch_dir, in_process, profile):
     """Run a Python script with hot reload"""
     script = Path(script_path)
     
@@ -185,16 +192,160 @@ def run(script_path, watch_dir):
         print(f"{Fore.RED}❌ Script not found: {script_path}{Style.RESET_ALL}")
         return
     
+    if not use_profile(profile):
+        return
+    
     watch_dirs = list(watch_dir) if watch_dir else None
     
     try:
         print(f"{Fore.GREEN}🔥 Running {script_path} with hot reload{Style.RESET_ALL}")
-        run_with_hot_reload(str(script), watch_dirs)
+        run_with_hot_reload(str(script), watch_dirs, in_process=in_process)
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}👋 Script stopped{Style.RESET_ALL}")
     except Exception as e:
         print(f"{Fore.RED}❌ Error running script: {e}{Style.RESET_ALL}")
 
+@cli.command('run-many')
+@click.argument('apps', nargs=-1)
+@click.option('--all', 'run_all', is_flag=True, help='Run every app in the workspace')
+@click.option('--browsers', '-b', default=1, help='Shared browser processes (default: 1)')
+@click.option('--max-apps', '-m', default=4, help='Apps running at the same time (default: 4)')
+@click.option('--quota', '-q', multiple=True, help='Per-app concurrency quota, e.g. -q news=4')
+@click.option('--interval', '-i', type=float, default=None, help='Run all apps again every N seconds')
+@click.option('--headful', is_flag=True, help='Show the shared browsers')
+@click.option('--profile', '-p', default=None, help='Performance profile (see: ga-scrap profiles)')
+def run_many(apps, run_all, browsers, max_apps, quota, interval, headful, profile):
+    """Run several apps in one process over a shared browser pool"""
+    import asyncio
+    from .app_host import AppHost, BrowserPool
+    
+    if not use_profile(profile):
+        return
+    
+    manager = AppManager()
+    app_paths = []
+    if run_all:
+        app_paths = [app["path"] for app in manager.list_apps()]
+    for app in apps:
+        info = manager.get_app_info(app)
+        app_paths.append(info["path"] if info else app)
+    
+    missing = [path for path in app_paths if not Path(path).exists()]
+    for path in missing:
+        print(f"{Fore.RED}❌ App not found: {path}{Style.RESET_ALL}")
+    app_paths = [path for path in app_paths if path not in missing]
+    if not app_paths:
+        print(f"{Fore.YELLOW}💡 Pass app names or directories, or use --all{Style.RESET_ALL}")
+        return
+    
+    quotas = {}
+    for item in quota:
+        name, _, value = item.partition("=")
+        if not value.isdigit():
+            print(f"{Fore.RED}❌ Invalid quota '{item}' (use name=N){Style.RESET_ALL}")
+            return
+        quotas[name] = int(value)
+    
+    host = AppHost(
+        app_paths,
+        pool=BrowserPool(browsers=browsers, headless=not headful, profile=profile),
+        max_apps=max_apps,
+        quotas=quotas,
+        interval=interval
+    )
+    
+    try:
+        results = asyncio.run(host.run())
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}👋 App host stopped{Style.RESET_ALL}")
+        return
+    
+    if any(not result["ok"] for result in results):
+        sys.exit(1)
+
+@cli.command()
+@click.option('--frontier', '-f', 'frontier_path', default='frontier.db', help='Frontier database (default: frontier.db)')
+@click.option('--seed', '-s', type=click.Path(exists=True), default=None, help='File with URLs to add, one per line')
+@click.option('--host', default='127.0.0.1', help='Interface to listen on (0.0.0.0 for other machines)')
+@click.option('--port', default=8765, help='TCP port (default: 8765)')
+@click.option('--batch-size', '-b', default=50, help='URLs leased per claim (default: 50)')
+@click.option('--lease-timeout', default=120.0, help='Seconds a lease lasts without a heartbeat (default: 120)')
+@click.option('--heartbeat-timeout', default=30.0, help='Seconds before a silent worker is dropped (default: 30)')
+@click.option('--token', envvar='GA_SCRAP_TOKEN', default=None, help='Shared secret workers must send')
+@click.option('--until-finished', is_flag=True, help='Exit once every URL is done or failed')
+def coordinator(frontier_path, seed, host, port, batch_size, lease_timeout, heartbeat_timeout, token, until_finished):
+    """Hand out frontier URLs to ga-scrap workers on other machines"""
+    from .frontier import Frontier
+    from .distributed import Coordinator
+
+    frontier = Frontier(frontier_path)
+    if seed:
+        with open(seed, encoding='utf-8') as f:
+            added = frontier.add(line.strip() for line in f if line.strip() and not line.startswith('#'))
+        print(f"{Fore.GREEN}🌱 Added {added} URLs to {frontier_path}{Style.RESET_ALL}")
+
+    server = Coordinator(frontier, host=host, port=port, batch_size=batch_size,
+                         lease_timeout=lease_timeout, heartbeat_timeout=heartbeat_timeout, token=token)
+    print(f"{Fore.YELLOW}💡 Start workers with: ga-scrap worker {server.url}{Style.RESET_ALL}")
+    try:
+        server.serve_forever(until_finished=until_finished)
+    finally:
+        stats = frontier.stats()
+        frontier.close()
+        print(f"{Fore.CYAN}📊 {stats['done']} done, {stats['failed']} failed, "
+              f"{stats['pending'] + stats['in_flight']} left{Style.RESET_ALL}")
+
+@cli.command()
+@click.argument('coordinator_url')
+@click.option('--handler', default=None, help='Extraction function as module:function or file.py:function')
+@click.option('--concurrency', '-c', default=4, help='Pages crawling at once (default: 4)')
+@click.option('--name', '-n', default=None, help='Worker name shown by the coordinator')
+@click.option('--token', envvar='GA_SCRAP_TOKEN', default=None, help='Shared secret of the coordinator')
+@click.option('--headful', is_flag=True, help='Show the browser')
+@click.option('--profile', '-p', default=None, help='Performance profile (see: ga-scrap profiles)')
+def worker(coordinator_url, handler, concurrency, name, token, headful, profile):
+    """Crawl URLs leased from a ga-scrap coordinator"""
+    import asyncio
+    from .distributed import RemoteWorker
+
+    if not use_profile(profile):
+        return
+
+    handler_func = None
+    if handler:
+        try:
+            handler_func = load_handler(handler)
+        except Exception as e:
+            print(f"{Fore.RED}❌ Cannot load handler '{handler}': {e}{Style.RESET_ALL}")
+            return
+
+    remote = RemoteWorker(coordinator_url, handler_func, concurrency=concurrency, name=name,
+                          token=token, headless=not headful, profile=profile)
+    try:
+        asyncio.run(remote.run())
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}👋 Worker stopped{Style.RESET_ALL}")
+    except ConnectionError as e:
+        print(f"{Fore.RED}❌ {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+def load_handler(spec):
+    """Import a handler given as module:function or path/to/file.py:function"""
+    import importlib
+    import importlib.util
+
+    target, _, func_name = spec.rpartition(':')
+    if not target or not func_name:
+        raise ValueError("use module:function or file.py:function")
+    if target.endswith('.py'):
+        module_spec = importlib.util.spec_from_file_location(Path(target).stem, target)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        sys.path.insert(0, os.getcwd())
+        module = importlib.import_module(target)
+    return getattr(module, func_name)
+
 @cli.command()
 def templates():
     """Show available app templates"""
@@ -256,6 +407,8 @@ def examples():
    cd ga_scrap_apps/my-scraper
    ga-scrap dev                      # Start with hot reload
    ga-scrap run my_script.py         # Run any script with hot reload
+   ga-scrap dev --profile throughput # Use a performance profile (ga-scrap profiles)
+   ga-scrap run-many --all           # Run all apps in one process, shared browser
 
 {Fore.YELLOW}💡 Tips:{Style.RESET_ALL}
 - Use 'ga-scrap quick' for instant scraping
@@ -273,10 +426,14 @@ def examples():
 @click.argument('selector')
 @click.option('--headless', is_flag=True, help='Run in headless mode')
 @click.option('--all', 'get_all', is_flag=True, help='Get all matching elements')
-def quick(url, selector, headless, get_all):
+@click.option('--profile', '-p', default=None, help='Performance profile (see: ga-scrap profiles)')
+def quick(url, selector, headless, get_all, profile):
     """Quick scrape - get text from a website instantly"""
     import asyncio
     from .simple import scrape, scrape_all
+    
+    if not use_profile(profile):
+        return
 
     async def do_scrape():
         try:
@@ -292,6 +449,31 @@ def quick(url, selector, headless, get_all):
 
     asyncio.run(do_scrape())
 
+def use_profile(profile):
+    """Validate a --profile option and pass it to every GAScrap (including app processes)"""
+    if not profile:
+        return True
+    try:
+        config.get_profile(profile)
+    except ValueError as e:
+        print(f"{Fore.RED}❌ {e}{Style.RESET_ALL}")
+        return False
+    os.environ["GA_SCRAP_PROFILE"] = profile
+    print(f"{Fore.CYAN}⚡ Performance profile: {profile}{Style.RESET_ALL}")
+    return True
+
+@cli.command()
+def profiles():
+    """Show available performance profiles"""
+    print(f"{Fore.GREEN}⚡ Performance Profiles:{Style.RESET_ALL}\n")
+    for name in config.list_profiles():
+        profile = config.get_profile(name)
+        print(f"{Fore.CYAN}{name}{Style.RESET_ALL} - {profile.get('description', '')}")
+        print(f"   listeners: {profile.get('listeners', 'full')}, timeout: {profile.get('timeout', 30000)} ms, "
+              f"blocked: {', '.join(profile.get('block_resources') or []) or 'nothing'}")
+    print(f"\n{Fore.YELLOW}💡 Use: ga-scrap dev --profile throughput  or  GAScrap(profile='throughput'){Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}💡 Override in ~/.ga_scrap/config.yaml under 'profiles'{Style.RESET_ALL}")
+
 @cli.group()
 def config_cmd():
     """Manage GA-Scrap configuration"""
@@ -163,8 +163,7 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
-        return target_page.locator(selector)
+        return self.cached_locator("css", selector, page=page)
     
     def get_locator_by_text(self, text: str, exact: bool = False, page: Optional[Page] = None) -> Locator:
         """
@@ -178,11 +177,10 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
         if exact:
-            return target_page.get_by_text(text, exact=True)
+            return self.cached_locator("text", text, page=page, exact=True)
         else:
-            return target_page.get_by_text(text)
+            return self.cached_locator("text", text, page=page)
     
     def get_locator_by_role(self, role: str, name: str = None, page: Optional[Page] = None) -> Locator:
         """
@@ -196,11 +194,10 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
         if name:
-            return target_page.get_by_role(role, name=name)
+            return self.cached_locator("role", role, page=page, name=name)
         else:
-            return target_page.get_by_role(role)
+            return self.cached_locator("role", role, page=page)
     
     def get_locator_by_label(self, label: str, exact: bool = False, page: Optional[Page] = None) -> Locator:
         """
@@ -214,8 +211,7 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
-        return target_page.get_by_label(label, exact=exact)
+        return self.cached_locator("label", label, page=page, exact=exact)
     
     def get_locator_by_placeholder(self, placeholder: str, exact: bool = False, page: Optional[Page] = None) -> Locator:
         """
@@ -229,8 +225,7 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
-        return target_page.get_by_placeholder(placeholder, exact=exact)
+        return self.cached_locator("placeholder", placeholder, page=page, exact=exact)
     
     def get_locator_by_test_id(self, test_id: str, page: Optional[Page] = None) -> Locator:
         """
@@ -243,8 +238,7 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
-        return target_page.get_by_test_id(test_id)
+        return self.cached_locator("test_id", test_id, page=page)
     
     def get_locator_by_title(self, title: str, exact: bool = False, page: Optional[Page] = None) -> Locator:
         """
@@ -258,8 +252,7 @@ class ComprehensivePlaywrightFeatures:
         Returns:
             Locator object
         """
-        target_page = page or self.page
-        return target_page.get_by_title(title, exact=exact)
+        return self.cached_locator("title", title, page=page, exact=exact)
     
     # ==================== FRAME OPERATIONS ====================
     
@@ -3,12 +3,23 @@ GA-Scrap Configuration Manager
 Handles global configuration and user preferences
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from colorama import Fore, Style
 
+# Chromium flags that stop background tabs and timers from being slowed down
+_NO_THROTTLING_ARGS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+
+# Listener tiers understood by GAScrap(listeners=...)
+LISTENER_TIERS = ("full", "minimal")
+
 class ConfigManager:
     """
     Manages GA-Scrap global configuration
@@ -18,6 +29,7 @@ class ConfigManager:
     - User preferences
     - Workspace configuration
     - Browser settings
+    - Named performance profiles (GAScrap(profile=...))
     """
     
     def __init__(self):
@@ -52,6 +64,44 @@ class ConfigManager:
                 "install_browsers": True,
                 "create_workspace": True,
                 "create_welcome_app": True
+            },
+            "profiles": {
+                "throughput": {
+                    "description": "Many pages per minute: no background throttling, no GPU, heavy resources blocked",
+                    "launch_args": _NO_THROTTLING_ARGS + [
+                        "--disable-gpu",
+                        "--disable-extensions",
+                        "--mute-audio",
+                        "--no-first-run"
+                    ],
+                    "block_resources": ["image", "media", "font"],
+                    "viewport": {"width": 1280, "height": 720},
+                    "listeners": "minimal",
+                    "timeout": 15000
+                },
+                "low-memory": {
+                    "description": "Small footprint: few renderer processes, capped JS heap, context recycling",
+                    "launch_args": _NO_THROTTLING_ARGS + [
+                        "--disable-gpu",
+                        "--disable-extensions",
+                        "--renderer-process-limit=2",
+                        "--js-flags=--max-old-space-size=256",
+                        "--disable-features=site-per-process"
+                    ],
+                    "block_resources": ["image", "media", "font", "stylesheet"],
+                    "viewport": {"width": 1024, "height": 768},
+                    "listeners": "minimal",
+                    "timeout": 30000,
+                    "recycle_policy": {"max_navigations": 200, "max_js_heap_mb": 256}
+                },
+                "fidelity": {
+                    "description": "Pages exactly as users see them: everything loads, full monitoring",
+                    "launch_args": [],
+                    "block_resources": [],
+                    "viewport": {"width": 1920, "height": 1080},
+                    "listeners": "full",
+                    "timeout": 60000
+                }
             }
         }
         
@@ -65,7 +115,7 @@ class ConfigManager:
                     user_config = yaml.safe_load(f) or {}
                 
                 # Merge with defaults
-                config = self.default_config.copy()
+                config = copy.deepcopy(self.default_config)
                 config.update(user_config)
                 return config
                 
@@ -73,7 +123,7 @@ class ConfigManager:
                 print(f"{Fore.YELLOW}Warning: Could not load config: {e}{Style.RESET_ALL}")
                 print(f"{Fore.YELLOW}Using default configuration{Style.RESET_ALL}")
         
-        return self.default_config.copy()
+        return copy.deepcopy(self.default_config)
     
     def save_config(self) -> bool:
         """Save configuration to file"""
@@ -113,6 +163,36 @@ class ConfigManager:
         config[keys[-1]] = value
         return self.save_config()
     
+    def list_profiles(self) -> List[str]:
+        """Get the names of all performance profiles (built-in and user-defined)"""
+        names = list(self.default_config["profiles"])
+        for name in self.get("profiles", {}) or {}:
+            if name not in names:
+                names.append(name)
+        return names
+    
+    def get_profile(self, name: str) -> Dict[str, Any]:
+        """
+        Get a performance profile
+        
+        User settings in config.yaml ('profiles.<name>') override the built-in values
+        key by key, so a profile can be tweaked without repeating it.
+        
+        Args:
+            name: Profile name ('throughput', 'low-memory', 'fidelity' or a user-defined one)
+        
+        Returns:
+            Profile settings (launch_args, block_resources, viewport, listeners, timeout, ...)
+        """
+        builtin = self.default_config["profiles"].get(name)
+        user = (self.get("profiles", {}) or {}).get(name)
+        if builtin is None and user is None:
+            raise ValueError(f"Unknown profile: {name} (available: {', '.join(self.list_profiles())})")
+        
+        profile = dict(builtin or {})
+        profile.update(user or {})
+        return profile
+    
     def get_workspace_dir(self) -> Path:
         """Get workspace directory path"""
         workspace = self.get("workspace_dir", "~/ga_scrap_apps")
@@ -120,7 +200,7 @@ class ConfigManager:
     
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults"""
-        self.config = self.default_config.copy()
+        self.config = copy.deepcopy(self.default_config)
         return self.save_config()
     
     def show_config(self):
@@ -153,6 +233,12 @@ class ConfigManager:
         if not isinstance(timeout, int) or timeout < 1000:
             issues.append("Browser timeout must be an integer >= 1000ms")
         
+        # Check performance profiles
+        for name in self.list_profiles():
+            listeners = self.get_profile(name).get("listeners", "full")
+            if listeners not in LISTENER_TIERS:
+                issues.append(f"Profile '{name}': listeners must be one of {', '.join(LISTENER_TIERS)}")
+        
         # Check dev server port
         port = self.get("dev_server.port", 8000)
         if not isinstance(port, int) or port < 1024 or port > 65535:
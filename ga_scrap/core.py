@@ -6,7 +6,9 @@ Enhanced with EVERY Playwright feature for comprehensive web scraping
 
 import asyncio
 import logging
+import os
 import time
+import weakref
 import base64
 import mimetypes
 from typing import Optional, Dict, Any, List, Callable, Union, Tuple, Pattern
@@ -24,11 +26,22 @@ from playwright.async_api import (
 from colorama import Fore, Style, init
 from .advanced_features import AdvancedPlaywrightFeatures
 from .comprehensive_features import ComprehensivePlaywrightFeatures
+from .recycling import ContextRecyclingFeatures
+from .supervisor import CrashRecoveryFeatures
+from .crawler import CrawlFeatures
+from .screenshots import ScreenshotFeatures
+from .locators import LocatorCacheFeatures
+from .tables import TableFeatures
+from .frames import FrameExtractionFeatures
+from .capture import ResponseCaptureFeatures
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
-class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
+class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures,
+             ContextRecyclingFeatures, CrashRecoveryFeatures, CrawlFeatures,
+             ScreenshotFeatures, LocatorCacheFeatures, TableFeatures,
+             FrameExtractionFeatures, ResponseCaptureFeatures):
     """
     GA-Scrap: A comprehensive Playwright-based scraper helper with EVERY feature
 
@@ -47,6 +60,13 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
     - Accessibility testing
     - Network throttling
     - Request/response modification
+    - Automatic context recycling
+    - Crash and disconnect recovery
+    - Concurrent crawling with per-host politeness
+    - Non-blocking screenshot pipeline
+    - Named performance profiles (throughput, low-memory, fidelity)
+    - Per-page locator cache for selectors used in hot loops
+    - Single-call table extraction (colspan/rowspan aware)
     - And much more!
     """
 
@@ -56,8 +76,8 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         browser_type: str = "chromium",
         viewport: Dict[str, int] = None,
         user_agent: str = None,
-        timeout: int = 30000,
-        slow_mo: int = 0,
+        timeout: int = None,
+        slow_mo: int = None,
         debug: bool = False,
         # Advanced browser options
         proxy: Dict[str, str] = None,
@@ -83,7 +103,16 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         # Force prefers-color-scheme
         forced_colors: str = None,
         # Sandbox mode - don't shutdown on errors
-        sandbox_mode: bool = False
+        sandbox_mode: bool = False,
+        # Context recycling - bound renderer memory in long sessions
+        recycle_policy: Dict[str, Any] = None,
+        # Performance tuning
+        profile: str = None,
+        launch_args: List[str] = None,
+        block_resources: List[str] = None,
+        listeners: str = None,
+        max_concurrency: int = None,
+        locator_cache_size: int = 256
     ):
         """
         Initialize GA-Scrap with comprehensive Playwright features
@@ -91,10 +120,10 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         Args:
             headless: Run browser in headless mode (default: False - visible browser)
             browser_type: Browser type ('chromium', 'firefox', 'webkit')
-            viewport: Browser viewport size {'width': 1920, 'height': 1080}
+            viewport: Browser viewport size (default: profile, else {'width': 1920, 'height': 1080})
             user_agent: Custom user agent string
-            timeout: Default timeout for operations in milliseconds
-            slow_mo: Slow down operations by specified milliseconds
+            timeout: Default timeout for operations in milliseconds (default: profile, else 30000)
+            slow_mo: Slow down operations by specified milliseconds (default: profile, else 0)
             debug: Enable debug logging
             proxy: Proxy configuration {'server': 'http://proxy:8080', 'username': 'user', 'password': 'pass'}
             downloads_path: Directory for downloads
@@ -112,7 +141,44 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
             reduced_motion: 'reduce' or 'no-preference'
             forced_colors: 'active' or 'none'
             sandbox_mode: Don't shutdown on errors, just log and continue (default: False)
+            recycle_policy: Recreate the context transparently when a limit is reached
+                            {'max_navigations': 500, 'max_age_minutes': 30, 'max_js_heap_mb': 512,
+                             'max_dom_nodes': 200000, 'memory_check_interval': 10};
+                            {} turns off the recycling a profile would enable
+            profile: Performance profile from the GA-Scrap config ('throughput', 'low-memory',
+                     'fidelity' or user-defined; default: $GA_SCRAP_PROFILE). It fills in the
+                     launch args, resource blocking, viewport, listeners, timeout and recycle
+                     policy that are not passed explicitly
+            launch_args: Extra browser command line flags
+            block_resources: Resource types to abort for every page ('image', 'media', 'font', ...)
+            listeners: 'full' (record requests, console, frames, ...) or 'minimal' (crash,
+                       close, download, dialog and popup handling only)
+            max_concurrency: Quota for pages and transfers at once: caps crawl() (including a
+                             scheduler passed to it), save_pdfs(), download_files() and the
+                             pages open besides the main page (new_page() raises beyond it)
+            locator_cache_size: Locators cached per page for repeated selectors (0 disables the cache)
         """
+        # Performance profile
+        self.profile = profile or os.environ.get("GA_SCRAP_PROFILE") or None
+        settings = self._load_profile(self.profile) if self.profile else {}
+        # Explicit arguments win over the profile, the profile over the built-in defaults
+        if viewport is None:
+            viewport = settings.get("viewport")
+        if timeout is None:
+            timeout = settings.get("timeout", 30000)
+        if slow_mo is None:
+            slow_mo = settings.get("slow_mo", 0)
+        if recycle_policy is None:
+            recycle_policy = settings.get("recycle_policy")
+        if block_resources is None:
+            block_resources = settings.get("block_resources", [])
+        listeners = listeners or settings.get("listeners", "full")
+        if listeners not in ("full", "minimal"):
+            raise ValueError(f"Unsupported listener tier: {listeners}")
+        check_interval = (recycle_policy or {}).get("memory_check_interval", 10)
+        if not isinstance(check_interval, int) or check_interval < 1:
+            raise ValueError(f"memory_check_interval must be a positive number of navigations: {check_interval}")
+
         # Basic configuration
         self.headless = headless
         self.browser_type = browser_type
@@ -139,6 +205,12 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         self.reduced_motion = reduced_motion
         self.forced_colors = forced_colors
         self.sandbox_mode = sandbox_mode
+        self.recycle_policy = recycle_policy or {}
+        self.launch_args = list(dict.fromkeys(settings.get("launch_args", []) + (launch_args or [])))
+        self.block_resources = list(block_resources)
+        self.listeners = listeners
+        self.max_concurrency = max_concurrency
+        self.locator_cache_size = locator_cache_size
 
         # Internal state
         self.playwright: Optional[Playwright] = None
@@ -155,6 +227,33 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         self.websockets: List[WebSocket] = []
         self.routes: List[Route] = []
         self.cdp_sessions: List[CDPSession] = []
+        self._registered_routes: List[Tuple[Union[str, Pattern], Callable]] = []
+        self._context_listeners: List[Tuple[str, Callable]] = []
+
+        # Context lifecycle tracking
+        self._navigation_count = 0
+        self._context_created_at: Optional[float] = None
+        self.recycle_count = 0
+
+        # Crash recovery state
+        self._owns_browser = True
+        self._page_crashed = False
+        # Crashed pages other than the main one; crawl workers replace theirs
+        self._crashed_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+        self._browser_disconnected = False
+        self._stopping = False
+        self._last_storage_state: Optional[Dict[str, Any]] = None
+        self.recovery_count = 0
+
+        # Screenshot pipeline (created on first capture_screenshot())
+        self.screenshot_pipeline = None
+
+        # Response captures started with capture_responses()
+        self._response_captures: List[Any] = []
+
+        # Locator caches per page (created on first use)
+        self._locator_caches: Dict[Page, Any] = {}
+        self._retired_locator_stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
 
         # Performance tracking
         self.performance_metrics = {}
@@ -179,6 +278,24 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
             self.log("🎥 Video recording enabled", "info")
         if record_har:
             self.log("📊 HAR recording enabled", "info")
+        if self.recycle_policy:
+            self.log(f"♻️ Context recycling enabled: {self.recycle_policy}", "info")
+        if self.profile:
+            self.log(f"⚡ Performance profile: {self.profile}", "info")
+
+    @staticmethod
+    def _load_profile(name: str) -> Dict[str, Any]:
+        """
+        Look up a performance profile in the GA-Scrap configuration
+
+        Args:
+            name: Profile name
+
+        Returns:
+            Profile settings
+        """
+        from .config_manager import config
+        return config.get_profile(name)
     
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -272,99 +389,40 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         else:
             self.logger.info(message)
     
-    async def start(self) -> 'GAScrap':
+    async def start(self, browser: Optional[Browser] = None, playwright: Optional[Playwright] = None) -> 'GAScrap':
         """
         Start the browser and create initial context with all advanced features
 
+        Args:
+            browser: Running browser to share (e.g. from a BrowserPool); only a context is
+                     created and stop() leaves the browser running
+            playwright: Playwright instance the shared browser belongs to
+
         Returns:
             Self for method chaining
         """
         try:
+            if browser is not None:
+                if playwright is None:
+                    raise ValueError("playwright is required when sharing a browser")
+                self.playwright = playwright
+                self.browser = browser
+                self._owns_browser = False
+                self.browser.on("disconnected", self._on_browser_disconnected)
+                self._browser_disconnected = False
+                await self._create_context()
+                self.log("✅ Context started on shared browser", "success")
+                return self
+
             self.log("🔧 Starting Playwright...", "info")
+            self._owns_browser = True
             self.playwright = await async_playwright().start()
 
-            # Get browser launcher
-            if self.browser_type == "chromium":
-                browser_launcher = self.playwright.chromium
-            elif self.browser_type == "firefox":
-                browser_launcher = self.playwright.firefox
-            elif self.browser_type == "webkit":
-                browser_launcher = self.playwright.webkit
-            else:
-                raise ValueError(f"Unsupported browser type: {self.browser_type}")
-
-            # Prepare browser launch options
-            launch_options = {
-                "headless": self.headless,
-                "slow_mo": self.slow_mo,
-                "proxy": self.proxy,
-                "downloads_path": self.downloads_path,
-                "ignore_default_args": [],
-                "args": []
-            }
-
-            # Add browser-specific arguments
-            if self.browser_type == "chromium":
-                launch_options["args"].extend([
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox" if self.headless else ""
-                ])
-
-            # Remove None values and empty strings
-            launch_options = {k: v for k, v in launch_options.items() if v is not None and v != ""}
-            launch_options["args"] = [arg for arg in launch_options["args"] if arg]
-
             # Launch browser
-            self.log(f"🌐 Launching {self.browser_type} browser...", "info")
-            self.browser = await browser_launcher.launch(**launch_options)
-
-            # Prepare context options with ALL Playwright features
-            context_options = {
-                "viewport": self.viewport,
-                "user_agent": self.user_agent,
-                "ignore_https_errors": self.ignore_https_errors,
-                "java_script_enabled": self.java_script_enabled,
-                "accept_downloads": self.accept_downloads,
-                "proxy": self.proxy,
-                "locale": self.locale,
-                "timezone_id": self.timezone_id,
-                "geolocation": self.geolocation,
-                "permissions": self.permissions,
-                "color_scheme": self.color_scheme,
-                "reduced_motion": self.reduced_motion,
-                "forced_colors": self.forced_colors,
-                "record_video_dir": str(Path(self.downloads_path) / "videos") if self.record_video else None,
-                "record_video_size": self.viewport if self.record_video else None,
-                "record_har_path": str(Path(self.downloads_path) / f"session_{int(time.time())}.har") if self.record_har else None,
-                "record_har_omit_content": False if self.record_har else None
-            }
-
-            # Device emulation
-            if self.device_name:
-                device = self.playwright.devices.get(self.device_name)
-                if device:
-                    context_options.update(device)
-                    self.log(f"📱 Emulating device: {self.device_name}", "info")
-                else:
-                    self.log(f"⚠️  Unknown device: {self.device_name}", "warning")
+            await self._launch_browser()
 
-            # Remove None values
-            context_options = {k: v for k, v in context_options.items() if v is not None}
-
-            # Create context
-            self.context = await self.browser.new_context(**context_options)
-            self.context.set_default_timeout(self.timeout)
-
-            # Set up event listeners for comprehensive monitoring
-            await self._setup_event_listeners()
-
-            # Create initial page
-            self.page = await self.context.new_page()
-            self.pages.append(self.page)
-
-            # Set up page-specific event listeners
-            await self._setup_page_listeners(self.page)
+            # Create context, listeners and initial page
+            await self._create_context()
 
             self.log("✅ Browser started successfully!", "success")
             return self
@@ -374,20 +432,187 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
             await self.stop()
             raise
     
+    async def _launch_browser(self):
+        """Launch the configured browser and watch it for disconnects"""
+        # Get browser launcher
+        if self.browser_type == "chromium":
+            browser_launcher = self.playwright.chromium
+        elif self.browser_type == "firefox":
+            browser_launcher = self.playwright.firefox
+        elif self.browser_type == "webkit":
+            browser_launcher = self.playwright.webkit
+        else:
+            raise ValueError(f"Unsupported browser type: {self.browser_type}")
+
+        self.log(f"🌐 Launching {self.browser_type} browser...", "info")
+        self.browser = await browser_launcher.launch(**self._build_launch_options())
+        self.browser.on("disconnected", self._on_browser_disconnected)
+        self._browser_disconnected = False
+
+    def _build_launch_options(self) -> Dict[str, Any]:
+        """Build browser launch options from the current configuration"""
+        launch_options = {
+            "headless": self.headless,
+            "slow_mo": self.slow_mo,
+            "proxy": self.proxy,
+            "downloads_path": self.downloads_path,
+            "ignore_default_args": [],
+            "args": []
+        }
+
+        # Add browser-specific arguments
+        if self.browser_type == "chromium":
+            launch_options["args"].extend([
+                "--disable-blink-features=AutomationControlled",
+                "--disable-dev-shm-usage",
+                "--no-sandbox" if self.headless else ""
+            ])
+            # Profile / user flags (Chromium command line switches)
+            launch_options["args"].extend(
+                arg for arg in self.launch_args if arg not in launch_options["args"]
+            )
+
+        # Remove None values and empty strings
+        launch_options = {k: v for k, v in launch_options.items() if v is not None and v != ""}
+        launch_options["args"] = [arg for arg in launch_options["args"] if arg]
+        return launch_options
+
+    def _build_context_options(self) -> Dict[str, Any]:
+        """Build browser context options with ALL Playwright features"""
+        context_options = {
+            "viewport": self.viewport,
+            "user_agent": self.user_agent,
+            "ignore_https_errors": self.ignore_https_errors,
+            "java_script_enabled": self.java_script_enabled,
+            "accept_downloads": self.accept_downloads,
+            "proxy": self.proxy,
+            "locale": self.locale,
+            "timezone_id": self.timezone_id,
+            "geolocation": self.geolocation,
+            "permissions": self.permissions,
+            "color_scheme": self.color_scheme,
+            "reduced_motion": self.reduced_motion,
+            "forced_colors": self.forced_colors,
+            "record_video_dir": str(Path(self.downloads_path) / "videos") if self.record_video else None,
+            "record_video_size": self.viewport if self.record_video else None,
+            "record_har_path": str(Path(self.downloads_path) / f"session_{int(time.time())}.har") if self.record_har else None,
+            "record_har_omit_content": False if self.record_har else None
+        }
+
+        # Device emulation
+        if self.device_name:
+            device = self.playwright.devices.get(self.device_name)
+            if device:
+                context_options.update(device)
+                self.log(f"📱 Emulating device: {self.device_name}", "info")
+            else:
+                self.log(f"⚠️  Unknown device: {self.device_name}", "warning")
+
+        # Remove None values
+        return {k: v for k, v in context_options.items() if v is not None}
+
+    async def _create_context(self, storage_state: Dict[str, Any] = None):
+        """
+        Create the main browser context and page, wiring up listeners and routes
+
+        Args:
+            storage_state: Storage state (cookies, localStorage) to seed the context with
+        """
+        context_options = self._build_context_options()
+        if storage_state:
+            context_options["storage_state"] = storage_state
+
+        # Create context
+        self.context = await self.browser.new_context(**context_options)
+        self.context.set_default_timeout(self.timeout)
+
+        # Set up event listeners for comprehensive monitoring
+        await self._setup_event_listeners()
+
+        # Resource blocking from the profile / constructor
+        if self.block_resources:
+            await self.context.route("**/*", self._block_resource_route)
+
+        # Re-apply routes registered through GA-Scrap helpers
+        for url_pattern, handler in self._registered_routes:
+            await self.context.route(url_pattern, handler)
+
+        # Create initial page
+        self.page = await self.context.new_page()
+        self.pages.append(self.page)
+
+        # Set up page-specific event listeners
+        await self._setup_page_listeners(self.page)
+
+        self._navigation_count = 0
+        self._context_created_at = time.time()
+        self._page_crashed = False
+
+    async def _block_resource_route(self, route: Route, request: Request):
+        """Abort requests for blocked resource types, hand the rest to other routes"""
+        if request.resource_type in self.block_resources:
+            await route.abort()
+        else:
+            await route.fallback()
+
+    async def _register_route(self, url_pattern: Union[str, Pattern], handler: Callable):
+        """
+        Register a context route and remember it so it survives context recreation
+
+        Args:
+            url_pattern: URL pattern to route
+            handler: Route handler
+        """
+        self._registered_routes.append((url_pattern, handler))
+        await self.context.route(url_pattern, handler)
+
+    def on_context_event(self, event: str, handler: Callable):
+        """
+        Register a context event listener that survives context recreation
+
+        Args:
+            event: Context event name ('request', 'response', 'page', etc.)
+            handler: Event handler
+        """
+        self._context_listeners.append((event, handler))
+        if self.context:
+            self.context.on(event, handler)
+
+    def off_context_event(self, event: str, handler: Callable):
+        """
+        Remove a context event listener registered with on_context_event()
+
+        Args:
+            event: Context event name
+            handler: Event handler
+        """
+        if (event, handler) in self._context_listeners:
+            self._context_listeners.remove((event, handler))
+        if self.context:
+            self.context.remove_listener(event, handler)
+
     async def _setup_event_listeners(self):
         """Set up comprehensive event listeners for monitoring"""
         if not self.context:
             return
 
+        # Page events
+        self.context.on("page", self._on_new_page)
+
+        # User listeners registered through on_context_event()
+        for event, handler in self._context_listeners:
+            self.context.on(event, handler)
+
+        if self.listeners == "minimal":
+            self.log("🔗 Event listeners configured (minimal)", "debug")
+            return
+
         # Request/Response monitoring
         self.context.on("request", self._on_request)
         self.context.on("response", self._on_response)
         self.context.on("requestfailed", self._on_request_failed)
         self.context.on("requestfinished", self._on_request_finished)
 
-        # Page events
-        self.context.on("page", self._on_new_page)
-
         # Background page events (for service workers)
         self.context.on("backgroundpage", self._on_background_page)
 
@@ -398,27 +623,33 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
 
     async def _setup_page_listeners(self, page: Page):
         """Set up page-specific event listeners"""
-        # Console messages
-        page.on("console", self._on_console)
-
         # Dialog handling
         page.on("dialog", self._on_dialog)
 
-        # File chooser
-        page.on("filechooser", self._on_file_chooser)
-
         # Download handling
         page.on("download", self._on_download)
 
-        # Page errors
-        page.on("pageerror", self._on_page_error)
-
         # Crash handling
         page.on("crash", self._on_page_crash)
 
         # Close handling
         page.on("close", self._on_page_close)
 
+        # Popup handling
+        page.on("popup", self._on_popup)
+
+        if self.listeners == "minimal":
+            return
+
+        # Console messages
+        page.on("console", self._on_console)
+
+        # File chooser
+        page.on("filechooser", self._on_file_chooser)
+
+        # Page errors
+        page.on("pageerror", self._on_page_error)
+
         # DOM content loaded
         page.on("domcontentloaded", self._on_dom_content_loaded)
 
@@ -436,13 +667,11 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         # WebSocket events
         page.on("websocket", self._on_websocket)
 
-        # Popup handling
-        page.on("popup", self._on_popup)
-
         self.log(f"📄 Page listeners configured for page {len(self.pages)}", "debug")
 
     async def stop(self):
         """Stop the browser and cleanup resources"""
+        self._stopping = True
         try:
             # Save performance metrics if available
             if self.page and self.performance_metrics:
@@ -454,6 +683,21 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
                     else:
                         self.log(f"⚠️ Could not save performance metrics: {e}", "warning")
 
+            # Finish queued screenshot writes
+            if self.screenshot_pipeline is not None:
+                try:
+                    await self.screenshot_pipeline.close()
+                except Exception as e:
+                    self.log(f"⚠️ Could not finish screenshots: {e}", "warning")
+                self.screenshot_pipeline = None
+
+            # Deliver responses still being read
+            for capture in list(self._response_captures):
+                try:
+                    await capture.drain()
+                except Exception as e:
+                    self.log(f"⚠️ Could not finish response capture: {e}", "warning")
+
             # Close all pages
             for page in self.pages:
                 try:
@@ -474,6 +718,13 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
                     else:
                         self.log(f"⚠️ Error closing context: {e}", "warning")
 
+            # A shared browser belongs to its pool
+            if not self._owns_browser:
+                if self.browser:
+                    self.browser.remove_listener("disconnected", self._on_browser_disconnected)
+                self.browser = None
+                self.playwright = None
+
             # Close browser
             if self.browser:
                 try:
@@ -511,13 +762,24 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
             self.websockets = []
             self.routes = []
             self.cdp_sessions = []
+            self._registered_routes = []
+            self._navigation_count = 0
+            self._context_created_at = None
 
         except Exception as e:
             if self.sandbox_mode:
                 self.log(f"🏖️ Cleanup completed with minor issues (sandbox mode): {str(e)}", "debug")
             else:
                 self.log(f"⚠️ Error during cleanup: {str(e)}", "warning")
+        finally:
+            self._stopping = False
     
+    def _apply_quota(self, concurrency: int) -> int:
+        """Cap a concurrency by the quota set by the host this scraper runs in"""
+        if self.max_concurrency:
+            return min(concurrency, self.max_concurrency)
+        return concurrency
+
     async def new_page(self) -> Page:
         """
         Create a new page in the current context
@@ -527,6 +789,11 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         """
         if not self.context:
             raise RuntimeError("Browser not started. Call start() first.")
+        if self.max_concurrency:
+            open_pages = [p for p in self.pages if p is not self.page and not p.is_closed()]
+            if len(open_pages) >= self.max_concurrency:
+                raise RuntimeError(f"Page quota reached: {len(open_pages)} pages open "
+                                   f"besides the main page (max_concurrency={self.max_concurrency})")
         
         page = await self.context.new_page()
         self.pages.append(page)
@@ -544,6 +811,10 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         Returns:
             Page instance
         """
+        # Recycle the main context before navigating if the policy says so
+        if page is None and self.recycle_policy and self.context:
+            await self._maybe_recycle_context()
+
         target_page = page or self.page
         if not target_page:
             if self.sandbox_mode:
@@ -555,6 +826,8 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
 
         async def _navigate():
             self.log(f"🔗 Navigating to: {url}", "info")
+            if target_page is self.page:
+                self._navigation_count += 1
             await target_page.goto(url)
             self.log(f"✅ Successfully navigated to: {url}", "success")
             return target_page
@@ -572,11 +845,11 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         Returns:
             Text content or empty string if not found
         """
-        target_page = page or self.page
         try:
-            element = await target_page.query_selector(selector)
-            if element:
-                return await element.inner_text()
+            # all_inner_texts() does not wait and leaves no element handle behind
+            texts = await self.cached_locator("css", selector, page=page, first=True).all_inner_texts()
+            if texts:
+                return texts[0]
         except Exception as e:
             self.log(f"Could not get text for '{selector}': {e}", "warning")
         return ""
@@ -592,13 +865,10 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         Returns:
             List of text contents
         """
-        target_page = page or self.page
         texts = []
         try:
-            elements = await target_page.query_selector_all(selector)
-            for element in elements:
-                text = await element.inner_text()
-                texts.append(text)
+            # One round trip for all matches instead of one per element
+            texts = await self.cached_locator("css", selector, page=page).all_inner_texts()
         except Exception as e:
             self.log(f"Could not get texts for '{selector}': {e}", "warning")
         return texts
@@ -614,7 +884,7 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         target_page = page or self.page
 
         async def _click():
-            await target_page.click(selector)
+            await self.cached_locator("css", selector, page=target_page, first=True).click()
             self.log(f"✅ Clicked: {selector}", "info")
 
         return await self._safe_execute_async("click", _click)
@@ -631,7 +901,7 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         target_page = page or self.page
 
         async def _type():
-            await target_page.fill(selector, text)
+            await self.cached_locator("css", selector, page=target_page, first=True).fill(text)
             self.log(f"✅ Typed text in: {selector}", "info")
 
         return await self._safe_execute_async("type_text", _type)
@@ -648,7 +918,7 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
         target_page = page or self.page
         timeout = timeout or self.timeout
         try:
-            await target_page.wait_for_selector(selector, timeout=timeout)
+            await self.cached_locator("css", selector, page=target_page, first=True).wait_for(timeout=timeout)
             self.log(f"✅ Element appeared: {selector}", "info")
         except Exception as e:
             self.log(f"Element did not appear '{selector}': {e}", "warning")
@@ -768,12 +1038,24 @@ class GAScrap(AdvancedPlaywrightFeatures, ComprehensivePlaywrightFeatures):
 
     def _on_page_crash(self, page: Page):
         """Handle page crashes"""
-        self.log("💥 Page crashed!", "error")
+        if page is self.page:
+            self._page_crashed = True
+        else:
+            self._crashed_pages.add(page)
+        self.log(f"💥 Page crashed: {page.url}", "error")
+
+    def _on_browser_disconnected(self, browser: Browser):
+        """Handle browser disconnects"""
+        if self._stopping:
+            return
+        self._browser_disconnected = True
+        self.log("💥 Browser disconnected!", "error")
 
     def _on_page_close(self, page: Page):
         """Handle page close events"""
         if page in self.pages:
             self.pages.remove(page)
+        self._drop_locator_cache(page)
         self.log(f"🔒 Page closed (remaining: {len(self.pages)})", "info")
 
     def _on_dom_content_loaded(self, page: Page):
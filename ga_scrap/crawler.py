@@ -0,0 +1,220 @@
+"""
+GA-Scrap Crawler Module
+Concurrent crawling over a pool of pages with per-host politeness
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Callable, Iterable, Set
+from playwright.async_api import Page
+from .politeness import PolitenessScheduler
+from .frontier import Frontier
+
+
+class CrawlFeatures:
+    """Mixin class for concurrent, polite crawling"""
+
+    # ==================== CRAWLING ====================
+
+    async def _default_crawl_handler(self, page: Page, url: str) -> Dict[str, Any]:
+        """Default crawl handler - returns the page title"""
+        return {"title": await page.title()}
+
+    async def _new_worker_page(self) -> Page:
+        """Create a page for a crawl worker in the current context"""
+        return await self.context.new_page()
+
+    async def _replace_worker_page(self, page: Page) -> Page:
+        """Close a crashed or stale worker page and open a fresh one"""
+        self._crashed_pages.discard(page)
+        if not page.is_closed():
+            try:
+                await page.close()
+            except Exception as e:
+                self.log(f"Could not close worker page: {e}", "debug")
+        return await self._new_worker_page()
+
+    async def _feed_from_frontier(self, frontier: Frontier, scheduler: PolitenessScheduler,
+                                  batch_size: int, leased: Set[str]):
+        """
+        Keep the scheduler topped up with batches claimed from the frontier
+
+        URLs can wait in the politeness queue for longer than the frontier's
+        lease, so the leases of every claimed but unfinished URL (`leased`,
+        shrunk by the workers as results come in) are extended regularly.
+        Otherwise the next claim would hand them out again.
+        """
+        heartbeat_interval = frontier.lease_timeout / 3
+        last_heartbeat = time.monotonic()
+        while True:
+            batch = []
+            if scheduler.pending < batch_size:
+                batch = frontier.claim(batch_size)
+                leased.update(batch)
+                scheduler.add_many(batch)
+
+            if leased and time.monotonic() - last_heartbeat >= heartbeat_interval:
+                frontier.extend_lease(leased)
+                last_heartbeat = time.monotonic()
+
+            if not batch and scheduler.pending == 0 and scheduler.active == 0:
+                # Failed attempts go back to 'pending' in the frontier, so check it again
+                if frontier.count(Frontier.PENDING) == 0:
+                    break
+
+            await asyncio.sleep(0 if batch else 0.2)
+
+        frontier.flush()
+        scheduler.close()
+
+    async def crawl(
+        self,
+        urls: Iterable[str] = None,
+        handler: Callable = None,
+        concurrency: int = 4,
+        rate_per_host: float = 1.0,
+        max_per_host: int = 2,
+        max_retries: int = 1,
+        scheduler: Optional[PolitenessScheduler] = None,
+        on_result: Callable = None,
+        frontier: Optional[Frontier] = None,
+        batch_size: int = 100,
+        resume: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Crawl URLs concurrently, one page per worker, with per-host rate limits
+
+        Args:
+            urls: URLs to crawl
+            handler: Async function handler(page, url) returning the extracted data
+            concurrency: Number of pages crawling at once
+            rate_per_host: Requests per second allowed for each host
+            max_per_host: Maximum in-flight requests per host
+            max_retries: Retries per URL after an error
+            scheduler: Custom PolitenessScheduler (overrides the rate/limit arguments;
+                       the number of workers is still capped by the scraper's quota)
+            on_result: Callback (sync or async) receiving each result as it completes;
+                       when given, results are streamed instead of collected
+            frontier: Persistent Frontier to claim URLs from and checkpoint results into;
+                      `urls` are added to it first and retries follow its max_attempts
+            batch_size: URLs claimed from the frontier at a time
+            resume: Requeue URLs left in flight by an interrupted run of this frontier
+
+        Returns:
+            List of results {'url', 'data', 'error', 'attempts'}
+            (empty when on_result or frontier is used)
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        handler = handler or self._default_crawl_handler
+        # A passed-in scheduler is left as it is: only `concurrency` workers acquire from it
+        concurrency = self._apply_quota(concurrency)
+        scheduler = scheduler or PolitenessScheduler(
+            rate_per_host=rate_per_host,
+            max_per_host=max_per_host,
+            max_concurrency=concurrency
+        )
+        if frontier is not None:
+            if urls:
+                frontier.add(urls)
+            if resume:
+                frontier.requeue_in_flight()
+        else:
+            scheduler.add_many(urls or [])
+            scheduler.close()
+
+        results: List[Dict[str, Any]] = []
+        attempts: Dict[str, int] = {}
+        leased: Set[str] = set()
+        recover_lock = asyncio.Lock()
+        stats = {"done": 0, "failed": 0}
+        started_at = time.time()
+
+        async def emit(result: Dict[str, Any]):
+            if result["error"]:
+                stats["failed"] += 1
+            else:
+                stats["done"] += 1
+
+            if frontier is not None:
+                leased.discard(result["url"])
+                if result["error"]:
+                    frontier.fail(result["url"], result["error"])
+                else:
+                    frontier.complete(result["url"], result["data"])
+            elif on_result is None:
+                results.append(result)
+
+            if on_result is None:
+                return
+            outcome = on_result(result)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+
+        async def worker():
+            page = await self._new_worker_page()
+            try:
+                while True:
+                    url = await scheduler.acquire()
+                    if url is None:
+                        break
+
+                    result = None
+                    try:
+                        # The page may have crashed, or the context been replaced by a recovery or recycle
+                        if page.is_closed() or page.context is not self.context or page in self._crashed_pages:
+                            page = await self._replace_worker_page(page)
+
+                        await page.goto(url)
+                        data = await handler(page, url)
+                        result = {"url": url, "data": data, "error": None,
+                                  "attempts": attempts.get(url, 0) + 1}
+
+                    except Exception as e:
+                        attempts[url] = attempts.get(url, 0) + 1
+                        self.log(f"⚠️ Crawl error for {url}: {e}", "warning")
+
+                        if self.needs_recovery(e):
+                            # The crash event may not have been delivered yet
+                            if page is not self.page:
+                                self._crashed_pages.add(page)
+                            async with recover_lock:
+                                if self.needs_recovery():
+                                    await self.recover()
+
+                        # The frontier tracks attempts itself and requeues failures
+                        if frontier is not None or attempts[url] > max_retries:
+                            result = {"url": url, "data": None, "error": str(e),
+                                      "attempts": attempts[url]}
+
+                    finally:
+                        scheduler.release(url)
+
+                    if result is None:
+                        scheduler.add(url)
+                        continue
+
+                    attempts.pop(url, None)
+                    await emit(result)
+            finally:
+                if not page.is_closed():
+                    await page.close()
+
+        self.log(f"🕷️ Crawling with {concurrency} workers", "info")
+        tasks = [worker() for _ in range(concurrency)]
+        if frontier is not None:
+            tasks.append(self._feed_from_frontier(frontier, scheduler, batch_size, leased))
+        await asyncio.gather(*tasks)
+
+        if frontier is not None:
+            frontier.checkpoint()
+
+        elapsed = max(time.time() - started_at, 1e-6)
+        total = stats["done"] + stats["failed"]
+        self.log(
+            f"🕷️ Crawl finished: {stats['done']} ok, {stats['failed']} failed "
+            f"in {elapsed:.1f}s ({total / elapsed:.2f} pages/s)",
+            "success"
+        )
+        return results
@@ -0,0 +1,381 @@
+"""
+GA-Scrap Dedup Module
+URL canonicalization and a memory-compact Bloom filter for large crawls
+"""
+
+import hashlib
+import math
+import mmap
+import re
+import struct
+from pathlib import Path
+from typing import Optional, List, Iterable, Union
+from urllib.parse import urlsplit, urlunsplit, quote, unquote_plus
+
+
+# Query parameters that only track the visitor and never change the content
+DEFAULT_TRACKING_PARAMS = [
+    r"utm_.*", "gclid", "dclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "igshid", "ref_src", "spm", "_hsenc", "_hsmi", "mkt_tok",
+]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_PERCENT_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_UNRESERVED = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+
+
+def _normalize_escape(match) -> str:
+    """Decode escapes of unreserved characters and upper-case the rest"""
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else "%" + match.group(1).upper()
+
+
+class URLCanonicalizer:
+    """
+    URL canonicalizer with configurable rules
+
+    Features:
+    - Lower-cases scheme and host, removes default ports
+    - Drops fragments and tracking parameters
+    - Sorts query parameters
+    - Normalizes percent-encoding and dot segments
+    """
+
+    def __init__(
+        self,
+        drop_fragment: bool = True,
+        sort_query: bool = True,
+        remove_params: List[str] = None,
+        keep_params: List[str] = None,
+        remove_default_port: bool = True,
+        strip_www: bool = False,
+        strip_trailing_slash: bool = False,
+        drop_empty_params: bool = False
+    ):
+        """
+        Initialize canonicalizer
+
+        Args:
+            drop_fragment: Remove '#fragment'
+            sort_query: Sort query parameters by name (then value)
+            remove_params: Regexes of parameter names to drop (default: common tracking params)
+            keep_params: If set, only these parameter names are kept
+            remove_default_port: Drop ':80' / ':443'
+            strip_www: Treat 'www.example.com' as 'example.com'
+            strip_trailing_slash: Treat '/path/' as '/path'
+            drop_empty_params: Drop parameters without a value
+        """
+        self.drop_fragment = drop_fragment
+        self.sort_query = sort_query
+        patterns = DEFAULT_TRACKING_PARAMS if remove_params is None else remove_params
+        self._remove_re = re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE) if patterns else None
+        self.keep_params = set(keep_params) if keep_params else None
+        self.remove_default_port = remove_default_port
+        self.strip_www = strip_www
+        self.strip_trailing_slash = strip_trailing_slash
+        self.drop_empty_params = drop_empty_params
+
+    def _keep_param(self, name: str, value: str) -> bool:
+        """Check whether a query parameter survives canonicalization"""
+        if self.keep_params is not None and name not in self.keep_params:
+            return False
+        if self._remove_re is not None and self._remove_re.fullmatch(name):
+            return False
+        if self.drop_empty_params and not value:
+            return False
+        return True
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """Resolve dot segments and normalize percent-encoding"""
+        segments = []
+        for segment in path.split("/"):
+            if segment == "..":
+                if len(segments) > 1:
+                    segments.pop()
+            elif segment != ".":
+                segments.append(segment)
+        path = _PERCENT_ESCAPE.sub(_normalize_escape, "/".join(segments))
+        return quote(path, safe="/:@!$&'()*+,;=-._~%") or "/"
+
+    @staticmethod
+    def _normalize_query_part(part: str) -> str:
+        """Normalize percent-encoding of a query parameter name or value"""
+        part = _PERCENT_ESCAPE.sub(_normalize_escape, part)
+        return quote(part, safe="/?:@!$'()*+,;-._~%")
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Canonicalize a URL
+
+        Args:
+            url: URL to canonicalize
+
+        Returns:
+            Canonical URL string
+        """
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+
+        host = (parts.hostname or "").rstrip(".")
+        if ":" in host:
+            host = f"[{host}]"  # IPv6 literal
+        if self.strip_www and host.startswith("www."):
+            host = host[4:]
+        port = parts.port
+        if port and not (self.remove_default_port and _DEFAULT_PORTS.get(scheme) == port):
+            host = f"{host}:{port}"
+        if parts.username:
+            credentials = parts.username + (f":{parts.password}" if parts.password else "")
+            host = f"{credentials}@{host}"
+
+        path = self._normalize_path(parts.path) if scheme in _DEFAULT_PORTS else parts.path
+        if self.strip_trailing_slash and len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+
+        # Parameters keep their bytes: escapes are only normalized and raw
+        # characters encoded as UTF-8, the way the browser sends them
+        params = []
+        for pair in parts.query.split("&"):
+            if not pair:
+                continue
+            name, _, value = pair.partition("=")
+            if self._keep_param(unquote_plus(name), value):
+                params.append((self._normalize_query_part(name), self._normalize_query_part(value)))
+        if self.sort_query:
+            params.sort()
+        query = "&".join(f"{name}={value}" for name, value in params)
+
+        fragment = "" if self.drop_fragment else parts.fragment
+        return urlunsplit((scheme, host, path, query, fragment))
+
+    def __call__(self, url: str) -> str:
+        """Canonicalize a URL"""
+        return self.canonicalize(url)
+
+
+_default_canonicalizer = URLCanonicalizer()
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize a URL with the default rules
+
+    Args:
+        url: URL to canonicalize
+
+    Returns:
+        Canonical URL string
+    """
+    return _default_canonicalizer.canonicalize(url)
+
+
+class BloomFilter:
+    """
+    Bloom filter with an optional memory-mapped, persisted bitset
+
+    100M items at a 1% false positive rate need about 120 MB.
+    """
+
+    _MAGIC = b"GABLOOM1"
+    _HEADER = struct.Struct("<8sQIQ")  # magic, bit count, hash count, item count
+    _HEADER_SIZE = 64
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01, path: Optional[str] = None):
+        """
+        Initialize Bloom filter
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Acceptable false positive rate
+            path: File to persist the bitset to (reopened if it already exists)
+        """
+        if capacity <= 0:
+            raise ValueError(f"Bloom filter capacity must be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Bloom filter error_rate must be between 0 and 1, got {error_rate}")
+
+        self.path = Path(path) if path else None
+        self._file = None
+        self._mmap = None
+
+        if self.path and self.path.exists():
+            self._open_existing()
+            return
+
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        num_bytes = (self.num_bits + 7) // 8
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(self._pack_header())
+                f.truncate(self._HEADER_SIZE + num_bytes)
+            self._map_file()
+        else:
+            self._bits = bytearray(num_bytes)
+
+    def _pack_header(self) -> bytes:
+        """Encode the file header"""
+        return self._HEADER.pack(self._MAGIC, self.num_bits, self.num_hashes, self.count).ljust(
+            self._HEADER_SIZE, b"\0"
+        )
+
+    def _open_existing(self):
+        """Open a persisted filter"""
+        with open(self.path, "rb") as f:
+            magic, self.num_bits, self.num_hashes, self.count = self._HEADER.unpack(
+                f.read(self._HEADER.size)
+            )
+        if magic != self._MAGIC:
+            raise ValueError(f"Not a GA-Scrap Bloom filter file: {self.path}")
+        self._map_file()
+
+    def _map_file(self):
+        """Memory-map the bitset so it is paged in by the OS instead of loaded"""
+        self._file = open(self.path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._bits = memoryview(self._mmap)[self._HEADER_SIZE:]
+
+    def _positions(self, item: Union[str, bytes]) -> Iterable[int]:
+        """Bit positions for an item (double hashing)"""
+        if isinstance(item, str):
+            item = item.encode("utf-8")
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: Union[str, bytes]) -> bool:
+        """
+        Add an item
+
+        Args:
+            item: Item to add
+
+        Returns:
+            True if the item was not seen before (False may be a false positive)
+        """
+        bits = self._bits
+        new = False
+        for position in self._positions(item):
+            index, mask = position >> 3, 1 << (position & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, item: Union[str, bytes]) -> bool:
+        """Check whether an item was (probably) added"""
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def __len__(self) -> int:
+        """Approximate number of items added"""
+        return self.count
+
+    def flush(self):
+        """Write the bitset and header to disk"""
+        if self._mmap is not None:
+            self._mmap[:self._HEADER_SIZE] = self._pack_header()
+            self._mmap.flush()
+
+    def save(self, path: str):
+        """
+        Save an in-memory filter to a file
+
+        Args:
+            path: Destination file
+        """
+        if self._mmap is not None:
+            self.flush()
+            return
+        with open(path, "wb") as f:
+            f.write(self._pack_header())
+            f.write(self._bits)
+
+    def close(self):
+        """Flush and release the memory map"""
+        if self._mmap is not None:
+            self.flush()
+            self._bits.release()
+            self._mmap.close()
+            self._file.close()
+            self._mmap = None
+            self._file = None
+            self._bits = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+
+class URLDeduplicator:
+    """
+    Canonicalize URLs and remember them in a Bloom filter
+
+    Usage:
+        dedup = URLDeduplicator(capacity=100_000_000, path="seen.bloom")
+        if dedup.add(url):
+            ...  # first time we see this URL
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        path: Optional[str] = None,
+        canonicalizer: Optional[URLCanonicalizer] = None
+    ):
+        """
+        Initialize deduplicator
+
+        Args:
+            capacity: Expected number of URLs
+            error_rate: Acceptable false positive rate
+            path: File to persist the filter to
+            canonicalizer: URL canonicalizer (default rules if not provided)
+        """
+        self.canonicalizer = canonicalizer or URLCanonicalizer()
+        self.bloom = BloomFilter(capacity, error_rate, path)
+
+    def canonicalize(self, url: str) -> str:
+        """Canonicalize a URL"""
+        return self.canonicalizer.canonicalize(url)
+
+    def add(self, url: str) -> bool:
+        """
+        Remember a URL
+
+        Args:
+            url: URL to remember
+
+        Returns:
+            True if the URL (after canonicalization) is new
+        """
+        return self.bloom.add(self.canonicalize(url))
+
+    def seen(self, url: str) -> bool:
+        """Check whether a URL (after canonicalization) was probably seen"""
+        return self.canonicalize(url) in self.bloom
+
+    def __contains__(self, url: str) -> bool:
+        """Check whether a URL was probably seen"""
+        return self.seen(url)
+
+    def flush(self):
+        """Persist the filter"""
+        self.bloom.flush()
+
+    def close(self):
+        """Persist and close the filter"""
+        self.bloom.close()
@@ -0,0 +1,559 @@
+"""
+GA-Scrap Distributed Module
+Coordinator/worker protocol for crawls spread over several machines
+"""
+
+import asyncio
+import hmac
+import itertools
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Callable, Set
+from colorama import Fore, Style
+from .core import GAScrap
+from .frontier import Frontier
+
+
+TOKEN_HEADER = "X-GA-Scrap-Token"
+
+
+def _log(prefix: str, message: str, level: str = "info"):
+    """Log message with color coding"""
+    colors = {
+        'info': Fore.CYAN,
+        'warning': Fore.YELLOW,
+        'error': Fore.RED,
+        'success': Fore.GREEN,
+        'debug': Fore.MAGENTA
+    }
+    color = colors.get(level, Fore.WHITE)
+    print(f"{color}[{prefix}] {message}{Style.RESET_ALL}")
+
+
+class _CoordinatorHandler(BaseHTTPRequestHandler):
+    """HTTP/JSON front end of a Coordinator"""
+
+    routes = {
+        ("POST", "/register"): "register",
+        ("POST", "/claim"): "claim",
+        ("POST", "/heartbeat"): "heartbeat",
+        ("POST", "/results"): "upload",
+        ("POST", "/release"): "release",
+        ("GET", "/stats"): "status",
+    }
+
+    def _dispatch(self, method: str):
+        coordinator: "Coordinator" = self.server.coordinator
+        action = self.routes.get((method, self.path.rstrip("/") or "/"))
+        if action is None:
+            return self._reply(404, {"error": f"unknown endpoint {method} {self.path}"})
+        if coordinator.token and not hmac.compare_digest(
+            (self.headers.get(TOKEN_HEADER) or "").encode("utf-8"), coordinator.token.encode("utf-8")
+        ):
+            return self._reply(401, {"error": "invalid token"})
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}") if length else {}
+            if method == "GET":
+                body = getattr(coordinator, action)()
+            else:
+                body = getattr(coordinator, action)(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            return self._reply(400, {"error": str(e)})
+        except Exception as e:
+            coordinator._log(f"❌ {action} failed: {e}", "error")
+            return self._reply(500, {"error": str(e)})
+        self._reply(200, body)
+
+    def _reply(self, status: int, body: Dict[str, Any]):
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def log_message(self, format, *args):
+        # Request lines would drown the coordinator's own log
+        pass
+
+
+class Coordinator:
+    """
+    Crawl coordinator holding the frontier for remote workers
+
+    Features:
+    - Hands out leased batches of URLs from a Frontier over HTTP/JSON
+    - Heartbeats extend a worker's leases; workers that stop sending them are
+      dropped and their URLs requeued without waiting for the lease to expire
+    - Results are uploaded in batches and checkpointed into the frontier
+    - Standard library only - no external queue service or broker
+    """
+
+    def __init__(
+        self,
+        frontier: Frontier,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        batch_size: int = 50,
+        lease_timeout: float = 120.0,
+        heartbeat_timeout: float = 30.0,
+        token: Optional[str] = None
+    ):
+        """
+        Initialize coordinator
+
+        Args:
+            frontier: Frontier to hand out URLs from and store results in
+            host: Interface to listen on ('0.0.0.0' for other machines)
+            port: TCP port (0 picks a free one)
+            batch_size: Maximum URLs handed out per claim
+            lease_timeout: Seconds a claimed URL stays leased without a heartbeat
+            heartbeat_timeout: Seconds of silence before a worker is considered dead
+            token: Shared secret workers must send (recommended outside localhost)
+        """
+        self.frontier = frontier
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.lease_timeout = lease_timeout
+        self.heartbeat_timeout = heartbeat_timeout
+        self.token = token
+
+        self.workers: Dict[str, Dict[str, Any]] = {}
+        self._worker_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stopped = threading.Event()
+
+    def _log(self, message: str, level: str = "info"):
+        """Log message with color coding"""
+        _log("Coordinator", message, level)
+
+    @property
+    def url(self) -> str:
+        """Base URL workers connect to"""
+        host = socket.gethostname() if self.host in ("0.0.0.0", "") else self.host
+        return f"http://{host}:{self.port}"
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> "Coordinator":
+        """Start serving in background threads"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _CoordinatorHandler)
+        self._server.daemon_threads = True
+        self._server.coordinator = self
+        self.port = self._server.server_address[1]
+        self._stopped.clear()
+
+        threading.Thread(target=self._server.serve_forever, name="ga-scrap-coordinator", daemon=True).start()
+        threading.Thread(target=self._reap_loop, name="ga-scrap-coordinator-reaper", daemon=True).start()
+
+        self._log(f"🛰️ Coordinator listening on {self.url} ({self.frontier.count(Frontier.PENDING)} URLs pending)", "info")
+        if self.host in ("0.0.0.0", "", "::") and not self.token:
+            self._log("⚠️ Listening on all interfaces without a token - anyone who can reach this port "
+                      "can claim URLs and upload results (set a token / --token)", "warning")
+        return self
+
+    def serve_forever(self, until_finished: bool = False):
+        """
+        Serve until stop() (or Ctrl+C)
+
+        Args:
+            until_finished: Also stop once no URL is pending or in flight
+        """
+        if self._server is None:
+            self.start()
+        try:
+            while not self._stopped.wait(1.0):
+                if until_finished and self.frontier.is_finished():
+                    self._log("✅ Frontier finished", "success")
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop serving and checkpoint the frontier"""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.frontier.checkpoint()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.stop()
+
+    # ==================== WORKERS ====================
+
+    def _touch(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Record that a registered worker is alive
+
+        Returns:
+            The worker, or None if it is unknown (never registered or dropped by reap())
+        """
+        worker = self.workers.get(worker_id)
+        if worker is not None:
+            worker["last_seen"] = time.time()
+        return worker
+
+    def _reap_loop(self):
+        """Drop workers that stopped sending heartbeats"""
+        while not self._stopped.wait(max(self.heartbeat_timeout / 2, 0.05)):
+            self.reap()
+
+    def reap(self) -> List[str]:
+        """
+        Drop silent workers and requeue their URLs
+
+        Returns:
+            IDs of the dropped workers
+        """
+        deadline = time.time() - self.heartbeat_timeout
+        with self._lock:
+            dead = [worker_id for worker_id, worker in self.workers.items() if worker["last_seen"] < deadline]
+            for worker_id in dead:
+                leased = self.workers.pop(worker_id)["leased"]
+                requeued = self.frontier.release(leased) if leased else 0
+                self._log(f"⚠️ Worker {worker_id} missed its heartbeats, requeued {requeued} URLs", "warning")
+        return dead
+
+    # ==================== PROTOCOL ====================
+
+    def register(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Register a worker and tell it the crawl settings"""
+        with self._lock:
+            worker_id = f"{payload.get('name') or 'worker'}-{next(self._worker_ids)}"
+            now = time.time()
+            self.workers[worker_id] = {"leased": set(), "done": 0, "failed": 0,
+                                       "registered_at": now, "last_seen": now}
+        self._log(f"👷 {worker_id} joined", "info")
+        return {
+            "worker_id": worker_id,
+            "batch_size": self.batch_size,
+            "lease_timeout": self.lease_timeout,
+            "heartbeat_interval": self.heartbeat_timeout / 3,
+        }
+
+    def claim(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Lease a batch of URLs to a worker"""
+        worker_id = payload["worker_id"]
+        limit = min(int(payload.get("limit") or self.batch_size), self.batch_size)
+        with self._lock:
+            worker = self._touch(worker_id)
+            if worker is None:
+                return {"urls": [], "finished": False, "known": False}
+            urls = self.frontier.claim(limit, self.lease_timeout)
+            worker["leased"].update(urls)
+        finished = not urls and self.frontier.is_finished()
+        return {"urls": urls, "finished": finished, "known": True}
+
+    def heartbeat(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Extend the leases of the URLs a worker is still working on"""
+        worker_id = payload["worker_id"]
+        with self._lock:
+            worker = self._touch(worker_id)
+            if worker is None:
+                return {"ok": True, "known": False, "extended": 0}
+            urls = [url for url in payload.get("urls", []) if url in worker["leased"]]
+            if urls:
+                self.frontier.extend_lease(urls, self.lease_timeout)
+        return {"ok": True, "known": True, "extended": len(urls)}
+
+    def upload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store results {'url', 'data', 'error'} uploaded by a worker
+
+        Only results for URLs the worker still holds are accepted; the others
+        were requeued when it was dropped and may belong to another worker now.
+        """
+        worker_id = payload["worker_id"]
+        results = payload.get("results", [])
+        accepted = 0
+        with self._lock:
+            worker = self._touch(worker_id)
+            if worker is None:
+                return {"accepted": 0, "rejected": len(results), "known": False}
+            for result in results:
+                url = result["url"]
+                if url not in worker["leased"]:
+                    continue
+                worker["leased"].discard(url)
+                accepted += 1
+                if result.get("error"):
+                    self.frontier.fail(url, result["error"])
+                    worker["failed"] += 1
+                else:
+                    self.frontier.complete(url, result.get("data"))
+                    worker["done"] += 1
+            self.frontier.flush()
+        return {"accepted": accepted, "rejected": len(results) - accepted, "known": True}
+
+    def release(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Take back URLs a stopping worker will not process"""
+        worker_id = payload["worker_id"]
+        with self._lock:
+            worker = self._touch(worker_id)
+            if worker is None:
+                return {"released": 0, "known": False}
+            urls = [url for url in payload.get("urls", []) if url in worker["leased"]]
+            worker["leased"].difference_update(urls)
+            released = self.frontier.release(urls) if urls else 0
+            if payload.get("leaving"):
+                self.workers.pop(worker_id, None)
+                self._log(f"👋 {worker_id} left", "info")
+        return {"released": released, "known": True}
+
+    def status(self) -> Dict[str, Any]:
+        """Frontier counts and per-worker progress"""
+        now = time.time()
+        with self._lock:
+            workers = [
+                {"worker_id": worker_id, "leased": len(worker["leased"]), "done": worker["done"],
+                 "failed": worker["failed"], "last_seen": round(now - worker["last_seen"], 1)}
+                for worker_id, worker in self.workers.items()
+            ]
+        return {"frontier": self.frontier.stats(), "workers": workers}
+
+
+class RemoteWorker:
+    """
+    Worker that crawls URL batches leased from a Coordinator
+
+    Each batch runs through GAScrap.crawl() on this worker's browser while a
+    heartbeat keeps the leases alive; results are uploaded as they complete.
+    Failed URLs are reported to the coordinator, whose frontier decides
+    about retries. A worker the coordinator dropped for missing heartbeats
+    abandons its batch (the URLs went back to the queue) and registers again.
+    """
+
+    def __init__(
+        self,
+        coordinator_url: str,
+        handler: Callable = None,
+        concurrency: int = 4,
+        batch_size: Optional[int] = None,
+        upload_every: int = 20,
+        poll_interval: float = 2.0,
+        name: Optional[str] = None,
+        token: Optional[str] = None,
+        headless: bool = True,
+        profile: str = None,
+        scraper_factory: Callable = None,
+        **scraper_options
+    ):
+        """
+        Initialize remote worker
+
+        Args:
+            coordinator_url: Base URL of the coordinator (http://host:port)
+            handler: Async function handler(page, url) returning the extracted data
+            concurrency: Pages crawling at once
+            batch_size: URLs to claim at a time (default: the coordinator's batch size)
+            upload_every: Results buffered before they are uploaded
+            poll_interval: Seconds to wait when no URL is available yet
+            name: Worker name shown by the coordinator (default: host name)
+            token: Shared secret of the coordinator
+            headless: Run the browser in headless mode
+            profile: Performance profile for the browser
+            scraper_factory: Callable building the scraper from the settings (default: GAScrap)
+            **scraper_options: Further GAScrap options
+        """
+        self.coordinator_url = coordinator_url.rstrip("/")
+        self.handler = handler
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.upload_every = upload_every
+        self.poll_interval = poll_interval
+        self.name = name or socket.gethostname()
+        self.token = token
+        self.scraper_factory = scraper_factory or GAScrap
+        self.settings = {"headless": headless, "profile": profile, **scraper_options}
+
+        self.worker_id: Optional[str] = None
+        self.heartbeat_interval = 10.0
+        self.stats = {"batches": 0, "done": 0, "failed": 0, "abandoned": 0}
+        self._in_flight: Set[str] = set()
+        self._stop_requested = False
+        self._batch_task: Optional[asyncio.Future] = None
+        self._dropped = False
+
+    def _log(self, message: str, level: str = "info"):
+        """Log message with color coding"""
+        _log(f"Worker {self.worker_id or self.name}", message, level)
+
+    # ==================== TRANSPORT ====================
+
+    def _request(self, path: str, payload: Optional[Dict[str, Any]] = None, retries: int = 3) -> Dict[str, Any]:
+        """Send a JSON request to the coordinator (blocking)"""
+        data = json.dumps(payload, default=str).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers[TOKEN_HEADER] = self.token
+
+        for attempt in range(retries + 1):
+            request = urllib.request.Request(self.coordinator_url + path, data=data, headers=headers,
+                                             method="POST" if data is not None else "GET")
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    return json.loads(response.read() or b"{}")
+            except urllib.error.HTTPError as e:
+                # The coordinator answered; retrying will not change its mind
+                raise RuntimeError(f"Coordinator rejected {path}: {e.code} {e.read().decode('utf-8', 'replace')}")
+            except (urllib.error.URLError, ConnectionError, socket.timeout) as e:
+                if attempt == retries:
+                    raise ConnectionError(f"Coordinator unreachable at {self.coordinator_url}: {e}")
+                time.sleep(min(2 ** attempt, 10))
+
+    async def _call(self, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a request without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._request, path, payload)
+
+    # ==================== LOOP ====================
+
+    async def _register(self) -> int:
+        """Register with the coordinator and adopt its settings; returns the claim size"""
+        info = await self._call("/register", {"name": self.name})
+        self.worker_id = info["worker_id"]
+        self.heartbeat_interval = info.get("heartbeat_interval", self.heartbeat_interval)
+        self._dropped = False
+        return self.batch_size or info.get("batch_size", 50)
+
+    async def _heartbeat_loop(self):
+        """Keep the leases of in-flight URLs alive"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                reply = await self._call("/heartbeat", {"worker_id": self.worker_id, "urls": sorted(self._in_flight)})
+            except Exception as e:
+                self._log(f"⚠️ Heartbeat failed: {e}", "warning")
+                continue
+            if not reply.get("known", True) and not self._dropped:
+                self._abandon_batch()
+
+    def _abandon_batch(self):
+        """
+        Give up the current batch after the coordinator dropped this worker
+
+        Its URLs were requeued and may already be crawled by other workers, so
+        the batch is cancelled and its results are not uploaded.
+        """
+        self._dropped = True
+        self._log(f"⚠️ Coordinator dropped this worker (missed heartbeats) - abandoning "
+                  f"{len(self._in_flight)} URLs and registering again", "warning")
+        if self._batch_task is not None and not self._batch_task.done():
+            self._batch_task.cancel()
+
+    async def _upload(self, results: List[Dict[str, Any]]):
+        """Upload finished results"""
+        if results:
+            reply = await self._call("/results", {"worker_id": self.worker_id, "results": results})
+            if not reply.get("known", True) and not self._dropped:
+                self._abandon_batch()
+
+    async def _crawl_batch(self, scraper, urls: List[str]):
+        """Crawl one leased batch and upload its results"""
+        self._in_flight = set(urls)
+        buffer: List[Dict[str, Any]] = []
+
+        async def on_result(result: Dict[str, Any]):
+            self._in_flight.discard(result["url"])
+            buffer.append({"url": result["url"], "data": result["data"], "error": result["error"]})
+            if result["error"]:
+                self.stats["failed"] += 1
+            else:
+                self.stats["done"] += 1
+            if len(buffer) >= self.upload_every:
+                batch = buffer[:]
+                del buffer[:]
+                await self._upload(batch)
+
+        # Retries are the coordinator's frontier's business
+        self._batch_task = asyncio.ensure_future(scraper.crawl(
+            urls, handler=self.handler, concurrency=self.concurrency, max_retries=0, on_result=on_result
+        ))
+        try:
+            await self._batch_task
+        except asyncio.CancelledError:
+            if not self._dropped:
+                raise
+            self.stats["abandoned"] += len(self._in_flight)
+            self._in_flight = set()
+            return
+        finally:
+            self._batch_task = None
+        if self._dropped:
+            # Dropped after the crawl finished: the leases are gone, keep the results local
+            self.stats["abandoned"] += len(buffer)
+            self._in_flight = set()
+            return
+        await self._upload(buffer)
+        self.stats["batches"] += 1
+
+    async def run(self) -> Dict[str, int]:
+        """
+        Crawl until the coordinator has no more work (or stop() is called)
+
+        Returns:
+            Worker stats {'batches', 'done', 'failed', 'abandoned'}
+        """
+        self._stop_requested = False
+        limit = await self._register()
+
+        scraper = self.scraper_factory(**self.settings)
+        await scraper.start()
+        heartbeat = asyncio.ensure_future(self._heartbeat_loop())
+        self._log(f"🔗 Connected to {self.coordinator_url}", "success")
+
+        try:
+            while not self._stop_requested:
+                if self._dropped:
+                    limit = await self._register()
+                claimed = await self._call("/claim", {"worker_id": self.worker_id, "limit": limit})
+                if not claimed.get("known", True):
+                    self._dropped = True
+                    continue
+                if claimed["urls"]:
+                    await self._crawl_batch(scraper, claimed["urls"])
+                elif claimed.get("finished"):
+                    break
+                else:
+                    # Other workers still hold leases that may come back
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            heartbeat.cancel()
+            leftover = sorted(self._in_flight)
+            self._in_flight = set()
+            try:
+                await self._call("/release", {"worker_id": self.worker_id, "urls": leftover, "leaving": True})
+            except Exception:
+                pass
+            await scraper.stop()
+
+        self._log(f"📊 {self.stats['done']} done, {self.stats['failed']} failed in {self.stats['batches']} batches", "info")
+        return self.stats
+
+    def stop(self):
+        """Stop after the current batch"""
+        self._stop_requested = True
@@ -0,0 +1,454 @@
+"""
+GA-Scrap Downloads Module
+Parallel file downloads with resume, checksums and per-host limits
+"""
+
+import asyncio
+import base64
+import hashlib
+import http.client
+import json
+import os
+import re
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Union, Tuple
+from urllib.parse import urlsplit, urljoin, unquote
+from .politeness import PolitenessScheduler
+
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class ChecksumMismatch(Exception):
+    """Raised when a downloaded file does not match its expected checksum"""
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP(S) connections, pooled per host, optionally through a proxy"""
+
+    def __init__(self, timeout: float, proxy: Dict[str, str] = None, ssl_context: ssl.SSLContext = None):
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.proxy = None
+        self.proxy_headers: Dict[str, str] = {}
+        self._bypass: List[str] = []
+        if proxy and proxy.get("server"):
+            server = proxy["server"]
+            parts = urlsplit(server if "://" in server else f"http://{server}")
+            if parts.scheme not in ("http", "https"):
+                raise ValueError(f"Unsupported proxy for downloads: {server} (HTTP proxies only)")
+            self.proxy = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+            if proxy.get("username"):
+                credentials = f"{proxy['username']}:{proxy.get('password') or ''}".encode("utf-8")
+                self.proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials).decode("ascii")
+            self._bypass = [entry.strip().lstrip(".").lower()
+                            for entry in (proxy.get("bypass") or "").split(",") if entry.strip()]
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Get an idle connection or open a new one"""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        return self.connect(scheme, netloc)
+
+    def uses_proxy(self, netloc: str) -> bool:
+        """Check whether requests to a host go through the proxy"""
+        if self.proxy is None:
+            return False
+        host = (urlsplit(f"//{netloc}").hostname or "").lower()
+        return not any(host == entry or host.endswith("." + entry) for entry in self._bypass)
+
+    def connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Open a new connection (HTTPS through a proxy is tunnelled with CONNECT)"""
+        if self.uses_proxy(netloc):
+            proxy_scheme, proxy_host, proxy_port = self.proxy
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout,
+                                                   context=self.ssl_context)
+                target = urlsplit(f"//{netloc}")
+                conn.set_tunnel(target.hostname, target.port or 443, headers=self.proxy_headers)
+                return conn
+            if proxy_scheme == "https":
+                return http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout,
+                                                   context=self.ssl_context)
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def put(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        """Return a connection whose response was fully read"""
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+def _cookie_matches(cookie: Dict[str, Any], scheme: str, host: str, path: str) -> bool:
+    """Check whether a Playwright cookie applies to a request"""
+    domain = cookie.get("domain", "").lower()
+    if domain.startswith("."):
+        if not (host == domain[1:] or host.endswith(domain)):
+            return False
+    elif domain and host != domain:
+        return False
+    if cookie.get("secure") and scheme != "https":
+        return False
+    return path.startswith(cookie.get("path") or "/")
+
+
+class DownloadManager:
+    """
+    Parallel download manager
+
+    Features:
+    - N concurrent transfers over pooled keep-alive connections, with per-host limits
+    - Shares the browser's cookies, user agent, proxy and certificate settings
+    - Streams to disk in chunks and resumes partial files with Range requests
+    - Verifies checksums; content-addressed mode stores each distinct file once
+    - Manifest of finished downloads, so re-runs skip what is already on disk
+    - Concurrent submissions of the same file wait for one transfer instead of racing
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "downloads",
+        concurrency: int = 4,
+        max_per_host: int = 2,
+        rate_per_host: float = 0,
+        chunk_size: int = 1024 * 1024,
+        algorithm: str = "sha256",
+        content_addressed: bool = False,
+        retries: int = 2,
+        timeout: float = 60.0,
+        headers: Dict[str, str] = None,
+        cookies: List[Dict[str, Any]] = None,
+        proxy: Dict[str, str] = None,
+        ignore_https_errors: bool = False
+    ):
+        """
+        Initialize download manager
+
+        Args:
+            output_dir: Directory files are saved to
+            concurrency: Maximum transfers at once
+            max_per_host: Maximum transfers per host
+            rate_per_host: Transfers started per second per host (0 = unlimited)
+            chunk_size: Bytes read and written per chunk
+            algorithm: Hash algorithm for checksums (any hashlib name)
+            content_addressed: Name files by their hash (identical files are stored once)
+            retries: Retries per file after a network error (partial data is kept)
+            timeout: Socket timeout in seconds
+            headers: Extra request headers
+            cookies: Playwright-style cookies sent with matching requests
+            proxy: Playwright-style proxy {'server', 'username', 'password', 'bypass'}
+                   (HTTP proxies; HTTPS is tunnelled with CONNECT)
+            ignore_https_errors: Accept invalid or self-signed certificates
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.algorithm = algorithm
+        self.content_addressed = content_addressed
+        self.retries = retries
+        self.headers = dict(headers or {})
+        self.cookies = list(cookies or [])
+
+        self.scheduler = PolitenessScheduler(
+            rate_per_host=rate_per_host,
+            max_per_host=max_per_host,
+            max_concurrency=concurrency
+        )
+        self.stats = {"downloaded": 0, "skipped": 0, "failed": 0, "resumed": 0, "bytes": 0}
+
+        ssl_context = None
+        if ignore_https_errors:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        self._pool = _ConnectionPool(timeout, proxy, ssl_context)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ga-scrap-download")
+        self._manifest_path = self.output_dir / ".manifest.jsonl"
+        self._manifest_lock = threading.Lock()
+        self._manifest = self._load_manifest()
+        # Targets being written, so two submissions never share a .part file
+        self._in_flight: Dict[Path, asyncio.Event] = {}
+
+    # ==================== MANIFEST ====================
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Read finished downloads from the manifest"""
+        manifest = {}
+        if self._manifest_path.exists():
+            with open(self._manifest_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line after a crash
+                    manifest[entry["url"]] = entry
+        return manifest
+
+    def _record(self, entry: Dict[str, Any]):
+        """Append a finished download to the manifest"""
+        with self._manifest_lock:
+            self._manifest[entry["url"]] = entry
+            with open(self._manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    # ==================== HELPERS ====================
+
+    def set_cookies(self, cookies: List[Dict[str, Any]]):
+        """
+        Replace the cookies sent with requests
+
+        Args:
+            cookies: Playwright-style cookies (e.g. from context.cookies())
+        """
+        self.cookies = list(cookies)
+
+    def _request_headers(self, url: str, offset: int) -> Dict[str, str]:
+        """Headers for a request, including matching cookies and Range"""
+        parts = urlsplit(url)
+        headers = {"Accept-Encoding": "identity", **self.headers}
+        cookies = [
+            f"{c['name']}={c['value']}" for c in self.cookies
+            if _cookie_matches(c, parts.scheme, (parts.hostname or "").lower(), parts.path or "/")
+        ]
+        if cookies:
+            headers["Cookie"] = "; ".join(cookies)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        return headers
+
+    @staticmethod
+    def filename_for(url: str) -> str:
+        """Stable local filename for a URL (basename + short URL hash)"""
+        name = unquote(urlsplit(url).path.rsplit("/", 1)[-1])
+        name = re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._") or "download"
+        stem, dot, ext = name.rpartition(".")
+        if not dot:
+            stem, ext = name, "bin"
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+        return f"{stem[:100]}_{digest}.{ext[:10]}"
+
+    def _parse_checksum(self, checksum: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Split 'algo:hex' into (algorithm, hex digest)"""
+        if not checksum:
+            return self.algorithm, None
+        algorithm, sep, digest = checksum.partition(":")
+        if not sep:
+            return self.algorithm, checksum.lower()
+        return algorithm.lower(), digest.lower()
+
+    # ==================== TRANSFER ====================
+
+    def _open(self, url: str, offset: int) -> Tuple[http.client.HTTPResponse, http.client.HTTPConnection, str]:
+        """Send the request, following redirects"""
+        for _ in range(10):
+            parts = urlsplit(url)
+            conn = self._pool.get(parts.scheme, parts.netloc)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            headers = self._request_headers(url, offset)
+            if parts.scheme == "http" and self._pool.uses_proxy(parts.netloc):
+                # Plain HTTP goes to the proxy with the absolute URL
+                path = f"http://{parts.netloc}{path}"
+                headers.update(self._pool.proxy_headers)
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # A pooled keep-alive connection was closed by the server - retry on a fresh one
+                conn.close()
+                conn = self._pool.connect(parts.scheme, parts.netloc)
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+
+            if response.status in _REDIRECT_CODES and response.getheader("Location"):
+                response.read()
+                self._pool.put(parts.scheme, parts.netloc, conn)
+                url = urljoin(url, response.getheader("Location"))
+                continue
+            return response, conn, url
+        raise IOError(f"Too many redirects: {url}")
+
+    def _transfer(self, url: str, target: Path, checksum: Optional[str]) -> Tuple[Dict[str, Any], int, bool]:
+        """Download one file (runs in a worker thread)
+
+        Returns:
+            Tuple of (result, bytes transferred, whether a partial file was resumed)
+        """
+        algorithm, expected = self._parse_checksum(checksum)
+        partial = target.with_name(target.name + ".part")
+        offset = partial.stat().st_size if partial.exists() else 0
+        hasher = hashlib.new(algorithm)
+        transferred = 0
+
+        response, conn, final_url = self._open(url, offset)
+        parts = urlsplit(final_url)
+        reusable = True
+        try:
+            if response.status == 416 and offset:
+                # Nothing left to fetch - the partial file is already complete
+                response.read()
+            elif response.status in (200, 206):
+                if response.status == 200 and offset:
+                    offset = 0  # server ignored the Range header, start over
+                mode = "ab" if offset else "wb"
+                with open(partial, mode) as f:
+                    while True:
+                        chunk = response.read(self.chunk_size)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        transferred += len(chunk)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                response.read()
+                raise IOError(f"HTTP {response.status} for {url}")
+            reusable = not response.will_close
+        except Exception:
+            reusable = False
+            raise
+        finally:
+            if reusable:
+                self._pool.put(parts.scheme, parts.netloc, conn)
+            else:
+                conn.close()
+
+        with open(partial, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+
+        if expected and digest != expected:
+            partial.unlink()
+            raise ChecksumMismatch(f"{algorithm} mismatch for {url}: expected {expected}, got {digest}")
+
+        if self.content_addressed:
+            target = self.output_dir / f"{digest}{target.suffix}"
+        size = partial.stat().st_size
+        if self.content_addressed and target.exists():
+            partial.unlink()  # identical content already stored
+        else:
+            partial.replace(target)
+
+        result = {"url": url, "path": str(target), "size": size, "checksum": f"{algorithm}:{digest}"}
+        return result, transferred, offset > 0
+
+    # ==================== PUBLIC API ====================
+
+    def _existing(self, url: str, target: Path, checksum: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the manifest entry if this URL is already downloaded"""
+        entry = self._manifest.get(url)
+        if entry and Path(entry["path"]).exists():
+            if not checksum or (entry.get("checksum") or "").endswith(self._parse_checksum(checksum)[1]):
+                return entry
+
+        algorithm, expected = self._parse_checksum(checksum)
+        if self.content_addressed and expected:
+            path = self.output_dir / f"{expected}{target.suffix}"
+            if path.exists():
+                return {"url": url, "path": str(path), "size": path.stat().st_size,
+                        "checksum": f"{algorithm}:{expected}"}
+        elif not self.content_addressed and target.exists() and not checksum:
+            return {"url": url, "path": str(target), "size": target.stat().st_size, "checksum": None}
+        return None
+
+    async def download(self, url: str, filename: str = None, checksum: str = None) -> Dict[str, Any]:
+        """
+        Download one file
+
+        Args:
+            url: File URL
+            filename: Local filename (default: basename + short URL hash)
+            checksum: Expected checksum as 'sha256:<hex>' (or bare hex with the default algorithm)
+
+        Returns:
+            Result {'url', 'path', 'size', 'checksum', 'skipped', 'error'}
+        """
+        target = self.output_dir / (filename or self.filename_for(url))
+
+        # Wait for a transfer to the same file; its result is then found on disk
+        while target in self._in_flight:
+            await self._in_flight[target].wait()
+
+        existing = self._existing(url, target, checksum)
+        if existing is not None:
+            self.stats["skipped"] += 1
+            return {**existing, "skipped": True, "error": None}
+
+        done = self._in_flight[target] = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        error = None
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    async with self.scheduler.slot(url):
+                        result, transferred, resumed = await loop.run_in_executor(
+                            self._executor, self._transfer, url, target, checksum
+                        )
+                    self._record(result)
+                    self.stats["downloaded"] += 1
+                    self.stats["bytes"] += transferred
+                    self.stats["resumed"] += int(resumed)
+                    return {**result, "skipped": False, "error": None}
+                except ChecksumMismatch as e:
+                    error = e
+                    break  # the data is wrong, not the connection
+                except Exception as e:
+                    error = e
+                    if attempt < self.retries:
+                        await asyncio.sleep(min(2 ** attempt, 10))
+        finally:
+            del self._in_flight[target]
+            done.set()
+
+        self.stats["failed"] += 1
+        return {"url": url, "path": None, "size": 0, "checksum": None, "skipped": False, "error": str(error)}
+
+    async def download_all(self, items: Iterable[Union[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Download many files concurrently
+
+        Args:
+            items: URLs, or dicts {'url', 'filename', 'checksum'}
+
+        Returns:
+            Results in input order
+        """
+        jobs = []
+        for item in items:
+            if isinstance(item, str):
+                item = {"url": item}
+            jobs.append(self.download(item["url"], item.get("filename"), item.get("checksum")))
+        return list(await asyncio.gather(*jobs))
+
+    def close(self):
+        """Close pooled connections and worker threads"""
+        self._executor.shutdown(wait=True)
+        self._pool.close()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        self.close()
@@ -0,0 +1,195 @@
+"""
+GA-Scrap Frames Module
+Run one extraction schema over many frames concurrently
+"""
+
+import asyncio
+import re
+from typing import Optional, Dict, Any, List, Callable, Union, Pattern, Tuple
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Frame
+
+
+# Hosts serving ad, tracking and recommendation widgets - never worth extracting
+AD_FRAME_HOSTS = (
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "adservice.google.com",
+    "amazon-adsystem.com", "adnxs.com", "criteo.com", "criteo.net", "taboola.com", "outbrain.com",
+    "rubiconproject.com", "pubmatic.com", "openx.net", "casalemedia.com", "moatads.com",
+    "adsrvr.org", "teads.tv", "smartadserver.com", "yieldmo.com", "sharethrough.com",
+)
+
+# One call per frame reads every field of the schema
+_SCHEMA_JS = """
+(fields) => {
+    const read = (element, attribute) => attribute
+        ? element.getAttribute(attribute)
+        : (element.innerText || '').trim();
+    const data = {};
+    for (const [name, selector, attribute, multiple] of fields) {
+        if (multiple) {
+            data[name] = Array.from(document.querySelectorAll(selector), element => read(element, attribute));
+        } else {
+            const element = document.querySelector(selector);
+            data[name] = element ? read(element, attribute) : null;
+        }
+    }
+    return data;
+}
+"""
+
+_ATTRIBUTE_SUFFIX = re.compile(r"@([\w:-]+)$")
+
+
+def parse_schema(schema: Dict[str, str]) -> List[Tuple[str, str, Optional[str], bool]]:
+    """
+    Parse a {field: selector} schema
+
+    A selector ending in '[]' reads all matches, '@attr' reads an attribute
+    instead of the text: {'links': 'a.item@href[]'}.
+
+    Returns:
+        List of (field, css selector, attribute or None, multiple)
+    """
+    fields = []
+    for name, selector in schema.items():
+        selector = selector.strip()
+        multiple = selector.endswith("[]")
+        if multiple:
+            selector = selector[:-2].rstrip()
+        attribute = None
+        match = _ATTRIBUTE_SUFFIX.search(selector)
+        if match:
+            attribute = match.group(1)
+            selector = selector[:match.start()].rstrip()
+        fields.append((name, selector, attribute, multiple))
+    return fields
+
+
+def is_ad_frame(frame: Frame) -> bool:
+    """Check whether a frame is served by a known ad/tracking host"""
+    host = (urlsplit(frame.url).hostname or "").lower()
+    return any(host == ad_host or host.endswith("." + ad_host) for ad_host in AD_FRAME_HOSTS)
+
+
+def _origin(url: str) -> Tuple[str, str]:
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+class FrameExtractionFeatures:
+    """Mixin class for extracting from many frames at once"""
+
+    # ==================== FRAME EXTRACTION ====================
+
+    def filter_frames(
+        self,
+        page: Optional[Page] = None,
+        url: Union[str, Pattern, Callable[[Frame], bool], None] = None,
+        name: Optional[str] = None,
+        same_origin: bool = False,
+        skip_ads: bool = True,
+        include_main: bool = True
+    ) -> List[Frame]:
+        """
+        Select frames of a page
+
+        Args:
+            page: Page to search in (default: main page)
+            url: URL substring, regex or predicate(frame) a frame must match
+            name: Frame name a frame must have
+            same_origin: Only frames with the page's origin
+            skip_ads: Leave out frames served by known ad/tracking hosts
+            include_main: Include the page's main frame
+
+        Returns:
+            Matching frames
+        """
+        target_page = page or self.page
+        main_frame = target_page.main_frame
+        page_origin = _origin(main_frame.url)
+
+        frames = []
+        for frame in target_page.frames:
+            if frame.is_detached() or not frame.url or frame.url == "about:blank":
+                continue
+            if frame == main_frame and not include_main:
+                continue
+            if name is not None and frame.name != name:
+                continue
+            if url is not None:
+                if callable(url):
+                    if not url(frame):
+                        continue
+                elif isinstance(url, str):
+                    if url not in frame.url:
+                        continue
+                elif not url.search(frame.url):
+                    continue
+            if same_origin and _origin(frame.url) != page_origin:
+                continue
+            if skip_ads and is_ad_frame(frame):
+                continue
+            frames.append(frame)
+        return frames
+
+    async def extract_from_frames(
+        self,
+        schema: Dict[str, str],
+        page: Optional[Page] = None,
+        url: Union[str, Pattern, Callable[[Frame], bool], None] = None,
+        name: Optional[str] = None,
+        same_origin: bool = False,
+        skip_ads: bool = True,
+        include_main: bool = True,
+        skip_empty: bool = True,
+        timeout: Optional[float] = 10.0,
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run an extraction schema over all matching frames concurrently
+
+        Args:
+            schema: {field: css selector}; '[]' suffix for all matches, '@attr' for an attribute
+            page: Page to search in (default: main page)
+            url: URL substring, regex or predicate(frame) a frame must match
+            name: Frame name a frame must have
+            same_origin: Only frames with the page's origin
+            skip_ads: Leave out frames served by known ad/tracking hosts
+            include_main: Include the page's main frame
+            skip_empty: Leave out frames where no field matched
+            timeout: Seconds to wait for a single frame
+            concurrency: Frames extracted at once (default: all; capped by max_concurrency)
+
+        Returns:
+            List of {'frame_url', 'frame_name', 'data', 'error'} in frame order
+        """
+        fields = parse_schema(schema)
+        frames = self.filter_frames(page, url, name, same_origin, skip_ads, include_main)
+        limit = concurrency or len(frames) or 1
+        if self.max_concurrency:
+            limit = min(limit, self.max_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def extract(frame: Frame) -> Dict[str, Any]:
+            result = {"frame_url": frame.url, "frame_name": frame.name, "data": None, "error": None}
+            async with semaphore:
+                try:
+                    result["data"] = await asyncio.wait_for(frame.evaluate(_SCHEMA_JS, fields), timeout)
+                except asyncio.TimeoutError:
+                    result["error"] = f"timed out after {timeout}s"
+                except Exception as e:
+                    # Frames navigate or detach while we read them
+                    result["error"] = str(e)
+            return result
+
+        results = await asyncio.gather(*(extract(frame) for frame in frames))
+        if skip_empty:
+            results = [
+                result for result in results
+                if result["error"] or any(value not in (None, "", []) for value in result["data"].values())
+            ]
+
+        failed = sum(1 for result in results if result["error"])
+        self.log(f"🖼️ Extracted from {len(results) - failed} of {len(frames)} frames"
+                 f"{f' ({failed} failed)' if failed else ''}", "info")
+        return list(results)
@@ -0,0 +1,382 @@
+"""
+GA-Scrap Frontier Module
+Persistent, resumable crawl queue backed by SQLite (WAL mode)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Union
+from .dedup import URLDeduplicator
+
+
+class Frontier:
+    """
+    Persistent crawl frontier
+
+    Features:
+    - URL states: pending, in_flight, done, failed
+    - Priorities, attempt counting and lease timeouts
+    - Batched claims and buffered result checkpoints
+    - Constant memory - everything lives in SQLite, so crawls resume after a crash
+    - Optional URL canonicalization and Bloom filter dedup
+    """
+
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        path: str = "frontier.db",
+        lease_timeout: float = 300.0,
+        max_attempts: int = 3,
+        flush_every: int = 100,
+        dedup: Optional[URLDeduplicator] = None
+    ):
+        """
+        Initialize frontier
+
+        Args:
+            path: SQLite database file
+            lease_timeout: Seconds before an in-flight URL is handed out again
+            max_attempts: Attempts before a URL is marked failed
+            flush_every: Buffered completions before they are committed
+            dedup: Canonicalize added URLs and skip ones the Bloom filter has already seen
+        """
+        self.path = Path(path)
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.flush_every = flush_every
+        self.dedup = dedup
+
+        self._lock = threading.RLock()
+        self._completed: List[Tuple[Optional[str], float, str]] = []
+
+        if self.path.parent and not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create tables and indexes"""
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL UNIQUE,
+                state TEXT NOT NULL DEFAULT 'pending',
+                priority INTEGER NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_expires REAL,
+                updated_at REAL,
+                error TEXT,
+                result TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_urls_claim ON urls (state, priority DESC, id);
+            CREATE INDEX IF NOT EXISTS idx_urls_lease ON urls (state, lease_expires);
+        """)
+
+    # ==================== QUEUEING ====================
+
+    def add(self, urls: Union[str, Iterable[str]], priority: int = 0) -> int:
+        """
+        Add URLs (already known URLs are ignored)
+
+        Args:
+            urls: URL or iterable of URLs
+            priority: Higher priorities are claimed first
+
+        Returns:
+            Number of newly added URLs
+        """
+        if isinstance(urls, str):
+            urls = [urls]
+
+        now = time.time()
+        added = 0
+        batch = []
+        # URLs only go into the Bloom filter once they are committed, so a
+        # rolled-back add() can be retried
+        fresh: List[str] = []
+        fresh_set = set()
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for url in urls:
+                    if self.dedup is not None:
+                        # Canonical form keys the table; the filter avoids hitting SQLite for repeats
+                        url = self.dedup.canonicalize(url)
+                        if url in fresh_set or url in self.dedup.bloom:
+                            continue
+                        fresh.append(url)
+                        fresh_set.add(url)
+                    batch.append((url, priority, now))
+                    if len(batch) >= 1000:
+                        added += self._insert(batch)
+                        batch = []
+                if batch:
+                    added += self._insert(batch)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            for url in fresh:
+                self.dedup.bloom.add(url)
+
+        return added
+
+    def _insert(self, rows: List[Tuple[str, int, float]]) -> int:
+        """Insert a batch of (url, priority, timestamp) rows"""
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO urls (url, priority, updated_at) VALUES (?, ?, ?)",
+            rows
+        )
+        return self._conn.total_changes - before
+
+    def claim(self, limit: int = 100, lease_timeout: Optional[float] = None) -> List[str]:
+        """
+        Claim a batch of pending URLs, leasing them for lease_timeout seconds
+
+        Args:
+            limit: Maximum URLs to claim
+            lease_timeout: Override the default lease timeout
+
+        Returns:
+            Claimed URLs, highest priority first
+        """
+        now = time.time()
+        lease = lease_timeout if lease_timeout is not None else self.lease_timeout
+
+        with self._lock:
+            # Buffered completions are still 'in_flight' in the table - commit them
+            # first, or their expired leases would hand finished URLs out again
+            self.flush()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Leases of crashed or stuck workers go back into the queue
+                self._conn.execute(
+                    "UPDATE urls SET state = ?, lease_expires = NULL "
+                    "WHERE state = ? AND lease_expires < ?",
+                    (self.PENDING, self.IN_FLIGHT, now)
+                )
+                rows = self._conn.execute(
+                    "SELECT id, url FROM urls WHERE state = ? ORDER BY priority DESC, id LIMIT ?",
+                    (self.PENDING, limit)
+                ).fetchall()
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE urls SET state = ?, attempts = attempts + 1, "
+                        "lease_expires = ?, updated_at = ? WHERE id = ?",
+                        [(self.IN_FLIGHT, now + lease, now, row[0]) for row in rows]
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return [row[1] for row in rows]
+
+    def extend_lease(self, urls: Iterable[str], lease_timeout: Optional[float] = None):
+        """
+        Extend the lease of in-flight URLs (heartbeat)
+
+        Args:
+            urls: URLs still being worked on
+            lease_timeout: Override the default lease timeout
+        """
+        lease = lease_timeout if lease_timeout is not None else self.lease_timeout
+        expires = time.time() + lease
+
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE urls SET lease_expires = ? WHERE url = ? AND state = ?",
+                [(expires, url, self.IN_FLIGHT) for url in urls]
+            )
+
+    def requeue_in_flight(self) -> int:
+        """
+        Put every in-flight URL back into the queue (use when resuming after a crash)
+
+        Returns:
+            Number of requeued URLs
+        """
+        self.flush()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE urls SET state = ?, lease_expires = NULL WHERE state = ?",
+                (self.PENDING, self.IN_FLIGHT)
+            )
+            return cursor.rowcount
+
+    def release(self, urls: Iterable[str]) -> int:
+        """
+        Put in-flight URLs back into the queue right away (like an expired lease)
+
+        Args:
+            urls: URLs a worker gave up or lost
+
+        Returns:
+            Number of requeued URLs
+        """
+        with self._lock:
+            cursor = self._conn.executemany(
+                "UPDATE urls SET state = ?, lease_expires = NULL WHERE url = ? AND state = ?",
+                [(self.PENDING, url, self.IN_FLIGHT) for url in urls]
+            )
+            return cursor.rowcount
+
+    # ==================== RESULTS ====================
+
+    def complete(self, url: str, result: Any = None):
+        """
+        Mark a URL as done and store its result (committed in batches)
+
+        Args:
+            url: Finished URL
+            result: JSON-serializable result data
+        """
+        payload = json.dumps(result, ensure_ascii=False, default=str) if result is not None else None
+
+        with self._lock:
+            self._completed.append((payload, time.time(), url))
+            if len(self._completed) >= self.flush_every:
+                self.flush()
+
+    def fail(self, url: str, error: str = None) -> str:
+        """
+        Record a failed attempt; the URL is retried until max_attempts is reached
+
+        Args:
+            url: URL that failed
+            error: Error message
+
+        Returns:
+            New state of the URL ('pending' or 'failed')
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM urls WHERE url = ?", (url,)).fetchone()
+            attempts = row[0] if row else self.max_attempts
+            state = self.FAILED if attempts >= self.max_attempts else self.PENDING
+            self._conn.execute(
+                "UPDATE urls SET state = ?, error = ?, lease_expires = NULL, updated_at = ? WHERE url = ?",
+                (state, error, time.time(), url)
+            )
+        return state
+
+    def flush(self):
+        """Commit buffered completions"""
+        with self._lock:
+            if not self._completed:
+                return
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE urls SET state = 'done', result = ?, lease_expires = NULL, "
+                    "error = NULL, updated_at = ? WHERE url = ?",
+                    self._completed
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._completed = []
+
+    def checkpoint(self):
+        """Flush completions and fold the WAL back into the database file"""
+        self.flush()
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def results(self, state: str = DONE, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream stored results without loading them all into memory
+
+        Args:
+            state: State to read ('done' or 'failed')
+            batch_size: Rows fetched per query
+
+        Yields:
+            Dictionaries {'url', 'result', 'error', 'attempts'}
+        """
+        self.flush()
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, url, result, error, attempts FROM urls "
+                    "WHERE state = ? AND id > ? ORDER BY id LIMIT ?",
+                    (state, last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, url, result, error, attempts in rows:
+                last_id = row_id
+                yield {
+                    "url": url,
+                    "result": json.loads(result) if result else None,
+                    "error": error,
+                    "attempts": attempts
+                }
+
+    # ==================== STATUS ====================
+
+    def count(self, state: str = None) -> int:
+        """
+        Count URLs, optionally in one state
+
+        Args:
+            state: State to count (default: all)
+        """
+        with self._lock:
+            if state:
+                row = self._conn.execute("SELECT COUNT(*) FROM urls WHERE state = ?", (state,)).fetchone()
+            else:
+                row = self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()
+        return row[0]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get URL counts per state
+
+        Returns:
+            Dictionary {'pending': n, 'in_flight': n, 'done': n, 'failed': n}
+        """
+        self.flush()
+        counts = {self.PENDING: 0, self.IN_FLIGHT: 0, self.DONE: 0, self.FAILED: 0}
+        with self._lock:
+            for state, count in self._conn.execute("SELECT state, COUNT(*) FROM urls GROUP BY state"):
+                counts[state] = count
+        return counts
+
+    def is_finished(self) -> bool:
+        """Check whether no URLs are pending or in flight"""
+        stats = self.stats()
+        return stats[self.PENDING] == 0 and stats[self.IN_FLIGHT] == 0
+
+    def close(self):
+        """Flush, checkpoint and close the database"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.checkpoint()
+            if self.dedup is not None:
+                self.dedup.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
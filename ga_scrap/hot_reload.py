@@ -3,19 +3,100 @@ GA-Scrap Hot Reload Module
 File watching and automatic reload functionality
 """
 
+import ast
 import asyncio
+import hashlib
 import sys
 import importlib
-import subprocess
+import importlib.util
 import signal
 import os
+import site
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, List, Dict, Any, Iterable, Set
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent
+from watchdog.events import FileSystemEventHandler
 from colorama import Fore, Style
 import time
 
+
+# Directories holding installed, vendored or generated code - never app code
+IGNORED_DIRS = frozenset({
+    "__pycache__", ".git", ".venv", "venv", "node_modules", "build", "dist",
+    "site-packages", "dist-packages", ".tox", ".nox", ".eggs", ".mypy_cache", ".pytest_cache",
+})
+
+
+def environment_roots(app_dirs: Iterable[Path] = ()) -> List[Path]:
+    """
+    Directories of the Python installation (prefixes and site-packages)
+    
+    Args:
+        app_dirs: App directories; installation roots that contain one of them
+                  (e.g. an app living under /usr) are left out
+    
+    Returns:
+        Resolved installation directories
+    """
+    candidates = {sys.prefix, sys.base_prefix, sys.exec_prefix}
+    try:
+        candidates.update(site.getsitepackages())
+    except AttributeError:
+        # Old virtualenv site.py has no getsitepackages()
+        pass
+    user_site = getattr(site, "USER_SITE", None)
+    if user_site:
+        candidates.add(user_site)
+    
+    app_dirs = [Path(d).resolve() for d in app_dirs]
+    roots = []
+    for candidate in candidates:
+        root = Path(candidate).resolve()
+        if any(root == app_dir or root in app_dir.parents for app_dir in app_dirs):
+            continue
+        roots.append(root)
+    return roots
+
+
+def is_environment_path(path: Path, roots: Iterable[Path], base_dirs: Iterable[Path] = ()) -> bool:
+    """
+    Check whether a file belongs to the Python installation or an ignored directory
+    
+    Args:
+        path: Resolved file path
+        roots: Installation directories (see environment_roots())
+        base_dirs: App directories; only the part of the path below them is
+                   checked for ignored directory names
+    """
+    path = Path(path)
+    if any(root == path or root in path.parents for root in roots):
+        return True
+    parts = path.parts[:-1]
+    for base_dir in base_dirs:
+        if base_dir in path.parents:
+            parts = path.relative_to(base_dir).parts[:-1]
+            break
+    return any(part in IGNORED_DIRS for part in parts)
+
+
+def walk_files(root: Path, roots: Iterable[Path] = ()) -> Iterable[Path]:
+    """
+    Files under a directory, without descending into ignored or installation directories
+    
+    Args:
+        root: Directory to walk
+        roots: Installation directories to skip (see environment_roots())
+    """
+    roots = [Path(r) for r in roots]
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        dirnames[:] = [
+            name for name in dirnames
+            if name not in IGNORED_DIRS and (current / name).resolve() not in roots
+        ]
+        for filename in filenames:
+            yield current / filename
+
 class HotReloader:
     """
     Hot reload functionality for GA-Scrap applications
@@ -25,6 +106,11 @@ class HotReloader:
     - Automatically restart scraper on file changes
     - Configurable file patterns and directories
     - Graceful process management
+    - Runs on an asyncio event loop: file events are handed over thread-safely,
+      bursts of saves are coalesced into one restart and app output is streamed
+      from non-blocking pipes
+    - Restart latency metrics (save to new process)
+    - Content hashes instead of mtimes: saves that do not change a file are ignored
     """
     
     def __init__(
@@ -33,7 +119,8 @@ class HotReloader:
         watch_dirs: List[str] = None,
         watch_patterns: List[str] = None,
         ignore_patterns: List[str] = None,
-        debounce_delay: float = 1.0
+        debounce_delay: float = 0.3,
+        stop_timeout: float = 5.0
     ):
         """
         Initialize Hot Reloader
@@ -43,18 +130,32 @@ class HotReloader:
             watch_dirs: Directories to watch (default: current directory)
             watch_patterns: File patterns to watch (default: *.py)
             ignore_patterns: Patterns to ignore
-            debounce_delay: Delay before restarting after file change
+            debounce_delay: Quiet period after the last change before restarting
+            stop_timeout: Seconds to wait for a graceful exit before killing the process
         """
         self.script_path = Path(script_path)
         self.watch_dirs = watch_dirs or [str(self.script_path.parent)]
         self.watch_patterns = watch_patterns or ["*.py"]
         self.ignore_patterns = ignore_patterns or ["__pycache__", "*.pyc", ".git"]
         self.debounce_delay = debounce_delay
+        self._app_roots = [Path(d).resolve() for d in self.watch_dirs]
+        self._environment_roots = environment_roots(self._app_roots)
+        self.stop_timeout = stop_timeout
         
         self.observer = Observer()
-        self.process: Optional[subprocess.Popen] = None
-        self.restart_pending = False
-        self.last_restart_time = 0
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.metrics = {"restarts": 0, "last_ms": None, "avg_ms": None, "max_ms": None}
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._debounce_handle: Optional[asyncio.TimerHandle] = None
+        self._first_change: Optional[float] = None
+        self._pending_paths: Set[str] = set()
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._restart_lock: Optional[asyncio.Lock] = None
+        self._restart_task: Optional[asyncio.Task] = None
+        self._output_task: Optional[asyncio.Task] = None
+        self._total_ms = 0.0
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -63,13 +164,21 @@ class HotReloader:
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print(f"\n{Fore.YELLOW}🛑 Shutting down hot reloader...{Style.RESET_ALL}")
-        self.stop()
-        sys.exit(0)
+        if self._loop is not None and self._stop_event is not None:
+            # Let the loop shut the app down cleanly
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        else:
+            self.stop()
+            sys.exit(0)
     
     def _should_watch_file(self, file_path: str) -> bool:
         """Check if file should be watched based on patterns"""
         path = Path(file_path)
         
+        # Virtualenvs, node_modules, build output, site-packages
+        if is_environment_path(path.resolve(), self._environment_roots, self._app_roots):
+            return False
+        
         # Check ignore patterns
         for pattern in self.ignore_patterns:
             if pattern in str(path):
@@ -96,95 +205,207 @@ class HotReloader:
         timestamp = time.strftime("%H:%M:%S")
         print(f"{color}[{timestamp}] [Hot Reload] {message}{Style.RESET_ALL}")
     
-    def _start_process(self):
+    # ==================== CHANGE HANDLING ====================
+    
+    def _watched_files(self) -> Iterable[Path]:
+        """All files in the watch directories that match the watch patterns"""
+        for watch_dir in self.watch_dirs:
+            root = Path(watch_dir)
+            if not root.exists():
+                continue
+            for path in walk_files(root, self._environment_roots):
+                if self._should_watch_file(str(path)):
+                    yield path.resolve()
+    
+    @staticmethod
+    def _file_hash(path: Path) -> Optional[str]:
+        """Content hash of a file (None if it does not exist)"""
+        try:
+            return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+    
+    def _snapshot_hashes(self):
+        """Remember the content of every watched file"""
+        self._hashes = {str(path): self._file_hash(path) for path in self._watched_files()}
+    
+    def _changed_files(self, paths: Iterable[str]) -> List[Path]:
+        """
+        Filter paths down to files whose content really changed
+        
+        Editors, formatters and `touch` often rewrite files without changing them;
+        comparing hashes instead of mtimes avoids restarting for those.
+        
+        Args:
+            paths: Paths reported by the watcher
+        
+        Returns:
+            Changed, created or deleted files
+        """
+        changed = []
+        for raw in paths:
+            path = Path(raw).resolve()
+            key = str(path)
+            digest = self._file_hash(path)
+            if key in self._hashes and self._hashes[key] == digest:
+                continue
+            if digest is None and key not in self._hashes:
+                continue  # Temp file that came and went
+            self._hashes[key] = digest
+            changed.append(path)
+        return changed
+    
+    def _on_change(self, file_path: str, changed_at: float):
+        """
+        Record a file change and (re)arm the debounce timer (runs on the loop thread)
+        
+        Args:
+            file_path: Changed file
+            changed_at: time.perf_counter() when the watcher saw the change
+        """
+        self._pending_paths.add(file_path)
+        if self._first_change is None:
+            self._first_change = changed_at
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = self._loop.call_later(self.debounce_delay, self._trigger)
+    
+    def _trigger(self):
+        """Debounce window elapsed - reload once for the whole burst of changes"""
+        self._debounce_handle = None
+        changed_at, self._first_change = self._first_change, None
+        paths, self._pending_paths = self._pending_paths, set()
+        
+        changed = self._changed_files(paths)
+        if not changed:
+            self._log("💤 Files saved without changes - not reloading", "debug")
+            return
+        
+        names = ", ".join(path.name for path in changed[:5])
+        more = f" (+{len(changed) - 5} more)" if len(changed) > 5 else ""
+        self._log(f"📝 Changed: {names}{more}", "info")
+        self._reload(changed_at, changed)
+    
+    def _reload(self, changed_at: float, changed: List[Path]):
+        """Start a restart (restarts are serialized, so a save during a restart queues another)"""
+        self._restart_task = self._loop.create_task(self._restart(changed_at))
+    
+    def _record_latency(self, changed_at: Optional[float]) -> Optional[float]:
+        """
+        Update restart metrics
+        
+        Args:
+            changed_at: time.perf_counter() of the first change that caused the restart
+        
+        Returns:
+            Latency in milliseconds
+        """
+        if changed_at is None:
+            return None
+        latency = (time.perf_counter() - changed_at) * 1000
+        self._total_ms += latency
+        self.metrics["restarts"] += 1
+        self.metrics["last_ms"] = latency
+        self.metrics["avg_ms"] = self._total_ms / self.metrics["restarts"]
+        self.metrics["max_ms"] = max(self.metrics["max_ms"] or 0.0, latency)
+        return latency
+    
+    # ==================== PROCESS MANAGEMENT ====================
+    
+    async def _start_process(self):
         """Start the main script process"""
         try:
-            if self.process:
-                self._stop_process()
-            
             self._log(f"🚀 Starting: {self.script_path}", "info")
             
-            # Start the process
-            self.process = subprocess.Popen(
-                [sys.executable, str(self.script_path)],
-                cwd=self.script_path.parent,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+            env = dict(os.environ, PYTHONUNBUFFERED="1")
+            self.process = await asyncio.create_subprocess_exec(
+                sys.executable, str(self.script_path),
+                cwd=str(self.script_path.parent),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env=env
             )
             
-            # Start output monitoring in background
-            asyncio.create_task(self._monitor_output())
+            # Stream output without blocking the loop
+            self._output_task = self._loop.create_task(self._monitor_output(self.process))
             
         except Exception as e:
+            self.process = None
             self._log(f"❌ Failed to start process: {e}", "error")
     
-    async def _monitor_output(self):
+    async def _monitor_output(self, process: asyncio.subprocess.Process):
         """Monitor process output and display it"""
-        if not self.process:
-            return
-        
         try:
-            while self.process.poll() is None:
-                line = self.process.stdout.readline()
-                if line:
-                    # Print output with prefix
-                    print(f"{Fore.WHITE}[App] {line.rstrip()}{Style.RESET_ALL}")
-                await asyncio.sleep(0.1)
+            async for line in process.stdout:
+                # Print output with prefix
+                text = line.decode(errors="replace").rstrip()
+                print(f"{Fore.WHITE}[App] {text}{Style.RESET_ALL}")
+            
+            returncode = await process.wait()
+            if process is self.process:
+                level = "success" if returncode == 0 else "warning"
+                self._log(f"⏹️ App exited with code {returncode} - waiting for changes", level)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             self._log(f"Error monitoring output: {e}", "warning")
     
-    def _stop_process(self):
+    async def _stop_process(self):
         """Stop the current process"""
-        if self.process:
-            try:
+        process, self.process = self.process, None
+        if process is None:
+            return
+        
+        try:
+            if process.returncode is None:
                 self._log("🛑 Stopping current process...", "warning")
                 
                 # Try graceful shutdown first
-                self.process.terminate()
-                
-                # Wait a bit for graceful shutdown
+                process.terminate()
                 try:
-                    self.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(process.wait(), timeout=self.stop_timeout)
+                except asyncio.TimeoutError:
                     # Force kill if graceful shutdown fails
                     self._log("⚡ Force killing process...", "warning")
-                    self.process.kill()
-                    self.process.wait()
-                
-                self.process = None
-                self._log("✅ Process stopped", "success")
-                
-            except Exception as e:
-                self._log(f"Error stopping process: {e}", "error")
+                    process.kill()
+                    await process.wait()
+            
+            if self._output_task is not None:
+                await self._output_task
+                self._output_task = None
+            
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            self._log(f"Error stopping process: {e}", "error")
     
-    async def _restart_with_delay(self):
-        """Restart process after debounce delay"""
-        if self.restart_pending:
-            return
-        
-        self.restart_pending = True
-        current_time = time.time()
-        
-        # Debounce: wait for delay period without new changes
-        await asyncio.sleep(self.debounce_delay)
-        
-        # Check if another restart was triggered during delay
-        if current_time < self.last_restart_time:
-            self.restart_pending = False
-            return
-        
-        self._log("🔄 Restarting application...", "info")
-        self._start_process()
-        self.restart_pending = False
-        self.last_restart_time = time.time()
+    async def _restart(self, changed_at: Optional[float] = None):
+        """Restart the process and record how long it took"""
+        async with self._restart_lock:
+            self._log("🔄 Restarting application...", "info")
+            await self._stop_process()
+            await self._start_process()
+            latency = self._record_latency(changed_at)
+            if latency is not None and self.process is not None:
+                self._log(f"⚡ Restarted {latency:.0f} ms after save", "success")
     
-    def start(self):
-        """Start hot reload monitoring"""
-        self._log("🔥 Starting hot reload...", "success")
-        self._log(f"📁 Watching directories: {', '.join(self.watch_dirs)}", "info")
-        self._log(f"📄 Watching patterns: {', '.join(self.watch_patterns)}", "info")
+    # ==================== LIFECYCLE ====================
+    
+    async def _launch(self):
+        """Start the app for the first time"""
+        await self._start_process()
+    
+    async def _shutdown(self):
+        """Stop the app"""
+        if self._restart_task is not None and not self._restart_task.done():
+            await self._restart_task
+        await self._stop_process()
+    
+    async def _serve(self):
+        """Watch files and supervise the app until stopped"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._restart_lock = asyncio.Lock()
         
         # Create file system event handler
         event_handler = HotReloadHandler(self)
@@ -198,68 +419,467 @@ class HotReloader:
                 self._log(f"⚠️  Directory not found: {watch_dir}", "warning")
         
         # Start file watching
+        self._snapshot_hashes()
         self.observer.start()
         
-        # Start initial process
-        self._start_process()
+        try:
+            await self._launch()
+            await self._stop_event.wait()
+        finally:
+            if self._debounce_handle is not None:
+                self._debounce_handle.cancel()
+            self._stop_observer()
+            await self._shutdown()
+            self._loop = None
+            self._stop_event = None
+    
+    def start(self):
+        """Start hot reload monitoring (blocks until Ctrl+C)"""
+        self._log("🔥 Starting hot reload...", "success")
+        self._log(f"📁 Watching directories: {', '.join(self.watch_dirs)}", "info")
+        self._log(f"📄 Watching patterns: {', '.join(self.watch_patterns)}", "info")
         
         try:
-            # Keep the main thread alive
-            while True:
-                time.sleep(1)
+            asyncio.run(self._serve())
         except KeyboardInterrupt:
+            pass
+        finally:
             self.stop()
     
-    def stop(self):
-        """Stop hot reload monitoring"""
-        self._log("🛑 Stopping hot reload...", "info")
-        
-        # Stop file watching
+    def _stop_observer(self):
+        """Stop file watching"""
         if self.observer.is_alive():
             self.observer.stop()
             self.observer.join()
+    
+    def stop(self):
+        """Stop hot reload monitoring"""
+        if self._loop is not None and self._stop_event is not None:
+            # Still running - the loop stops the app and calls stop() again
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+            return
         
-        # Stop current process
-        self._stop_process()
-        
+        self._stop_observer()
+        if self.metrics["restarts"]:
+            self._log(
+                f"📊 {self.metrics['restarts']} restarts, avg {self.metrics['avg_ms']:.0f} ms, "
+                f"max {self.metrics['max_ms']:.0f} ms",
+                "info"
+            )
         self._log("✅ Hot reload stopped", "success")
 
 class HotReloadHandler(FileSystemEventHandler):
-    """File system event handler for hot reload"""
+    """File system event handler for hot reload (hands events to the reloader's loop)"""
     
     def __init__(self, reloader: HotReloader):
         self.reloader = reloader
         super().__init__()
     
+    def _dispatch_path(self, file_path: str):
+        """Forward a watched path to the loop thread"""
+        # Check if we should watch this file
+        if not self.reloader._should_watch_file(file_path):
+            return
+        
+        loop = self.reloader._loop
+        if loop is None:
+            return
+        
+        # Watchdog runs in its own thread; the loop must do the scheduling
+        try:
+            loop.call_soon_threadsafe(self.reloader._on_change, file_path, time.perf_counter())
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+    
     def on_modified(self, event):
         """Handle file modification events"""
-        if event.is_directory:
-            return
+        if not event.is_directory:
+            self._dispatch_path(event.src_path)
+    
+    def on_created(self, event):
+        """Handle file creation events"""
+        if not event.is_directory:
+            self._dispatch_path(event.src_path)
+    
+    def on_moved(self, event):
+        """Handle moves (editors that save atomically write a temp file and move it into place)"""
+        if not event.is_directory:
+            self._dispatch_path(event.dest_path)
+
+class ImportGraph:
+    """
+    Import graph of an app's own modules
+    
+    Built by parsing the source (nothing is imported), so it can tell which
+    modules have to be reloaded when a file changes: the module itself and
+    everything that imports it, directly or indirectly.
+    """
+    
+    def __init__(self, roots: List[str], aliases: Dict[str, str] = None, ignore_patterns: List[str] = None):
+        """
+        Initialize import graph
         
-        file_path = event.src_path
+        Args:
+            roots: Directories that are on sys.path for the app
+            aliases: Module names for specific files (e.g. the main script)
+            ignore_patterns: Path fragments to skip (IGNORED_DIRS and the Python
+                             installation are always skipped)
+        """
+        self.roots = [Path(root).resolve() for root in roots]
+        self.environment_roots = environment_roots(self.roots)
+        self.aliases = {str(Path(path).resolve()): name for path, name in (aliases or {}).items()}
+        self.ignore_patterns = ignore_patterns or ["__pycache__", ".git"]
         
-        # Check if we should watch this file
-        if not self.reloader._should_watch_file(file_path):
+        self.modules: Dict[str, Path] = {}
+        self.imports: Dict[str, Set[str]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+    
+    def module_name(self, path: Path) -> Optional[str]:
+        """
+        Module name a file is imported under
+        
+        Args:
+            path: Python file
+        
+        Returns:
+            Dotted module name or None if the file is outside the roots
+        """
+        path = Path(path).resolve()
+        if str(path) in self.aliases:
+            return self.aliases[str(path)]
+        if is_environment_path(path, self.environment_roots, self.roots):
+            return None
+        for root in self.roots:
+            if root in path.parents:
+                parts = list(path.relative_to(root).with_suffix("").parts)
+                if parts[-1] == "__init__":
+                    parts.pop()
+                return ".".join(parts) if parts else None
+        return None
+    
+    def scan(self) -> "ImportGraph":
+        """Parse every Python file under the roots"""
+        self.modules.clear()
+        self.imports.clear()
+        self.dependents.clear()
+        
+        for root in self.roots:
+            for path in walk_files(root, self.environment_roots):
+                if path.suffix != ".py" or any(pattern in str(path) for pattern in self.ignore_patterns):
+                    continue
+                name = self.module_name(path)
+                if name:
+                    self.modules[name] = path.resolve()
+        for path in self.aliases:
+            if Path(path).exists():
+                self.modules[self.aliases[path]] = Path(path)
+        
+        for name, path in self.modules.items():
+            self._set_imports(name, self._parse_imports(name, path))
+        return self
+    
+    def _parse_imports(self, name: str, path: Path) -> Set[str]:
+        """App modules imported by a file"""
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (OSError, SyntaxError, ValueError):
+            return set()
+        
+        is_package = path.name == "__init__.py"
+        found = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    parts = alias.name.split(".")
+                    # 'import a.b.c' also imports the packages a and a.b
+                    found.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    package = name.split(".") if is_package else name.split(".")[:-1]
+                    if node.level > 1:
+                        package = package[:-(node.level - 1)]
+                    base = ".".join(package + ([node.module] if node.module else []))
+                else:
+                    base = node.module or ""
+                if base:
+                    found.add(base)
+                # 'from pkg import mod' may import a submodule
+                found.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+        
+        return {module for module in found if module in self.modules and module != name}
+    
+    def _set_imports(self, name: str, imports: Set[str]):
+        """Replace a module's outgoing edges"""
+        for old in self.imports.get(name, set()) - imports:
+            self.dependents.get(old, set()).discard(name)
+        for new in imports:
+            self.dependents.setdefault(new, set()).add(name)
+        self.imports[name] = imports
+    
+    def affected(self, names: Iterable[str]) -> Set[str]:
+        """
+        Modules that must be reloaded when the given modules change
+        
+        Args:
+            names: Changed modules
+        
+        Returns:
+            The changed modules and all their (transitive) dependents
+        """
+        result = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in result:
+                continue
+            result.add(name)
+            stack.extend(self.dependents.get(name, ()))
+        return result
+    
+    def update(self, paths: Iterable[Path]) -> Set[str]:
+        """
+        Re-parse changed files and work out what needs reloading
+        
+        Args:
+            paths: Changed, created or deleted files
+        
+        Returns:
+            Names of the modules to reload
+        """
+        changed = set()
+        for path in paths:
+            path = Path(path).resolve()
+            if path.suffix != ".py":
+                continue
+            name = self.module_name(path)
+            if not name:
+                continue
+            changed.add(name)
+            if path.exists():
+                self.modules[name] = path
+                # Edits can add or drop imports
+                self._set_imports(name, self._parse_imports(name, path))
+            elif name in self.modules:
+                del self.modules[name]
+                self._set_imports(name, set())
+        
+        # Other modules may import a newly created file
+        if any(name not in self.dependents for name in changed):
+            for name, path in self.modules.items():
+                self._set_imports(name, self._parse_imports(name, path))
+        
+        return self.affected(changed)
+
+class InProcessReloader(HotReloader):
+    """
+    In-process hot reload
+    
+    The browser, context and current page live in this process and survive
+    reloads. On a change, only the changed modules and the modules that import
+    them are re-imported (see ImportGraph), and the script's `run(scraper)`
+    coroutine is executed again against the live browser.
+    
+    The script must define:
+        async def run(scraper):   # scraper is a SimpleScraper (scraper.scraper is the GAScrap)
+            ...
+    """
+    
+    APP_MODULE = "__ga_scrap_app__"
+    
+    def __init__(
+        self,
+        script_path: str,
+        watch_dirs: List[str] = None,
+        watch_patterns: List[str] = None,
+        ignore_patterns: List[str] = None,
+        debounce_delay: float = 0.2,
+        entry_point: str = "run",
+        scraper_options: Dict[str, Any] = None
+    ):
+        """
+        Initialize in-process reloader
+        
+        Args:
+            script_path: Path to the main script (must define the entry point)
+            watch_dirs: Directories to watch (default: the script's directory)
+            watch_patterns: File patterns to watch (default: *.py)
+            ignore_patterns: Patterns to ignore
+            debounce_delay: Quiet period after the last change before reloading
+            entry_point: Name of the async function to run
+            scraper_options: GAScrap options for the long-lived browser
+        """
+        super().__init__(script_path, watch_dirs, watch_patterns, ignore_patterns, debounce_delay)
+        self.script_path = self.script_path.resolve()
+        self.entry_point = entry_point
+        self.scraper_options = {"headless": False, "debug": True, "sandbox_mode": True, **(scraper_options or {})}
+        
+        self.scraper = None
+        self.reload_count = 0
+        self.graph = ImportGraph(
+            self.watch_dirs,
+            aliases={str(self.script_path): self.APP_MODULE},
+            ignore_patterns=self.ignore_patterns
+        )
+        self._run_task: Optional[asyncio.Task] = None
+    
+    def _purge_app_modules(self, names: Optional[Set[str]] = None) -> int:
+        """
+        Drop app modules from sys.modules so they are imported fresh
+        
+        Only modules the import graph resolved as app modules are dropped, and
+        only if they were loaded from the file the graph knows - installed
+        packages next to the app (a .venv in the project root) are never touched.
+        
+        Args:
+            names: Modules to drop (default: every app module of the import graph)
+        
+        Returns:
+            Number of dropped modules
+        """
+        if not self.graph.modules:
+            self.graph.scan()
+        app_modules = self.graph.modules
+        purged = 0
+        for name in list(app_modules if names is None else names):
+            module = sys.modules.get(name)
+            path = app_modules.get(name)
+            module_file = getattr(module, "__file__", None)
+            if module is None or path is None or not module_file:
+                continue
+            if Path(module_file).resolve() != path:
+                # Same name, but imported from somewhere else (e.g. site-packages)
+                continue
+            del sys.modules[name]
+            purged += 1
+            # .pyc files are validated by whole-second mtime and size, so a quick
+            # second save of the same length could otherwise load stale bytecode
+            cached = getattr(module, "__cached__", None)
+            if cached and Path(cached).resolve().parent == path.parent / "__pycache__":
+                Path(cached).unlink(missing_ok=True)
+        return purged
+    
+    def _load_app(self, modules: Optional[Set[str]] = None):
+        """
+        Import the main script (and, through it, the app modules)
+        
+        Args:
+            modules: App modules to re-import (default: all of them)
+        
+        Returns:
+            The main script module
+        """
+        self._purge_app_modules(modules)
+        app_dir = str(self.script_path.parent)
+        if app_dir not in sys.path:
+            sys.path.insert(0, app_dir)
+        importlib.invalidate_caches()
+        
+        if modules is not None and self.APP_MODULE in sys.modules:
+            # Nothing the main script imports changed - keep it
+            return sys.modules[self.APP_MODULE]
+        
+        spec = importlib.util.spec_from_file_location(self.APP_MODULE, self.script_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Never reuse a half-executed script on the next change
+            sys.modules.pop(spec.name, None)
+            raise
+        return module
+    
+    async def _execute(self, changed_at: Optional[float] = None, changed: Optional[List[Path]] = None):
+        """
+        Reload the affected app modules and run the entry point
+        
+        Args:
+            changed_at: time.perf_counter() of the first change (None for the initial run)
+            changed: Changed files (None reloads everything)
+        """
+        from .simple import SimpleScraper
+        
+        started = time.perf_counter()
+        modules = None
+        if changed is not None:
+            modules = self.graph.update(changed)
+            if modules:
+                self._log(f"🔁 Reloading {len(modules)} module(s): {', '.join(sorted(modules))}", "debug")
+        try:
+            module = self._load_app(modules)
+        except Exception as e:
+            self._log(f"❌ Import failed: {e}", "error")
+            return
+        
+        entry = getattr(module, self.entry_point, None)
+        if entry is None:
+            self._log(f"❌ {self.script_path.name} has no '{self.entry_point}(scraper)' function", "error")
             return
         
-        self.reloader._log(f"📝 File changed: {Path(file_path).name}", "info")
+        load_ms = (time.perf_counter() - started) * 1000
+        latency = self._record_latency(changed_at)
+        if latency is not None:
+            self._log(f"♻️ Reloaded app code in {load_ms:.0f} ms ({latency:.0f} ms after save) - running {self.entry_point}()", "info")
+        else:
+            self._log(f"♻️ Loaded app code in {load_ms:.0f} ms - running {self.entry_point}()", "info")
+        
+        try:
+            result = entry(SimpleScraper(scraper=self.scraper))
+            if asyncio.iscoroutine(result):
+                await result
+            self._log(f"✅ Run finished in {time.perf_counter() - started:.2f}s (browser kept alive)", "success")
+        except asyncio.CancelledError:
+            self._log("⏹️ Run cancelled by a newer change", "warning")
+            raise
+        except Exception as e:
+            self._log(f"❌ Run failed: {e}", "error")
+            if self.scraper.needs_recovery(e):
+                await self.scraper.recover()
+    
+    def _reload(self, changed_at: float, changed: List[Path]):
+        """Cancel the current run and start a new one"""
+        if self._run_task is not None and not self._run_task.done():
+            self._run_task.cancel()
+        self.reload_count += 1
+        self._run_task = self._loop.create_task(self._execute(changed_at, changed))
+    
+    async def _launch(self):
+        """Start the browser once and run the app"""
+        from .core import GAScrap
         
-        # Trigger restart
-        asyncio.create_task(self.reloader._restart_with_delay())
+        self.graph.scan()
+        self.scraper = GAScrap(**self.scraper_options)
+        await self.scraper.start()
+        self._run_task = self._loop.create_task(self._execute())
+    
+    async def _shutdown(self):
+        """Cancel the current run and close the browser"""
+        if self._run_task is not None and not self._run_task.done():
+            self._run_task.cancel()
+            await asyncio.gather(self._run_task, return_exceptions=True)
+        if self.scraper is not None:
+            await self.scraper.stop()
+    
+    def start(self):
+        """Start in-process hot reload (blocks until Ctrl+C)"""
+        self._log(f"🚀 Entry point: {self.script_path.name}:{self.entry_point}() (browser stays open)", "info")
+        super().start()
 
 class DevServer:
     """
     Development server with hot reload for GA-Scrap apps
     """
     
-    def __init__(self, app_dir: str):
+    def __init__(self, app_dir: str, in_process: bool = False):
         """
         Initialize development server
         
         Args:
             app_dir: Directory containing the GA-Scrap app
+            in_process: Keep the browser alive and re-run main.py's run(scraper) on changes
         """
         self.app_dir = Path(app_dir)
+        self.in_process = in_process
         self.main_script = self.app_dir / "main.py"
         
         if not self.main_script.exists():
@@ -275,25 +895,28 @@ class DevServer:
         print("-" * 50)
         
         # Create hot reloader
-        reloader = HotReloader(
+        reloader_class = InProcessReloader if self.in_process else HotReloader
+        reloader = reloader_class(
             script_path=str(self.main_script),
             watch_dirs=[str(self.app_dir)],
             watch_patterns=["*.py", "*.yaml", "*.yml", "*.json"],
-            debounce_delay=1.0
+            debounce_delay=0.2 if self.in_process else 0.3
         )
         
         # Start hot reload
         reloader.start()
 
-def run_with_hot_reload(script_path: str, watch_dirs: List[str] = None):
+def run_with_hot_reload(script_path: str, watch_dirs: List[str] = None, in_process: bool = False):
     """
     Convenience function to run a script with hot reload
     
     Args:
         script_path: Path to the script to run
         watch_dirs: Directories to watch for changes
+        in_process: Keep the browser alive and re-run the script's run(scraper) on changes
     """
-    reloader = HotReloader(
+    reloader_class = InProcessReloader if in_process else HotReloader
+    reloader = reloader_class(
         script_path=script_path,
         watch_dirs=watch_dirs
     )
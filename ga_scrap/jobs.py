@@ -0,0 +1,526 @@
+"""
+GA-Scrap Jobs Module
+Recurring job scheduler (cron and interval triggers) running against a warm browser
+"""
+
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Union, Set
+from colorama import Fore, Style
+from .app_host import BrowserPool
+from .translator import SyncGAScrap
+
+
+_CRON_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+_DAY_NAMES = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+MISFIRE_POLICIES = ("skip", "run_once", "run_all")
+
+
+class CronTrigger:
+    """
+    Cron trigger ('minute hour day-of-month month day-of-week', local time)
+
+    Supports '*', lists, ranges, steps ('*/15', '1-5', 'mon-fri') and the
+    @hourly / @daily / @weekly / @monthly / @yearly shortcuts.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Initialize cron trigger
+
+        Args:
+            expression: Cron expression, e.g. '*/30 8-18 * * mon-fri'
+        """
+        self.expression = expression
+        fields = _CRON_ALIASES.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+
+        self.minutes = self._parse(fields[0], 0, 59)
+        self.hours = self._parse(fields[1], 0, 23)
+        self.days = self._parse(fields[2], 1, 31)
+        self.months = self._parse(fields[3], 1, 12, _MONTH_NAMES)
+        # 7 is Sunday as well
+        self.weekdays = {day % 7 for day in self._parse(fields[4], 0, 7, _DAY_NAMES)}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int, names: Dict[str, int] = None) -> Set[int]:
+        """Expand one cron field into the set of matching values"""
+        def value(text: str) -> int:
+            text = text.lower()
+            if names and text in names:
+                return names[text]
+            number = int(text)
+            if not low <= number <= high:
+                raise ValueError(f"Cron value {number} outside {low}-{high}")
+            return number
+
+        values = set()
+        for part in field.split(","):
+            spec, _, step = part.partition("/")
+            step = int(step) if step else 1
+            if spec == "*":
+                start, end = low, high
+            elif "-" in spec:
+                start, end = (value(v) for v in spec.split("-", 1))
+            else:
+                start = value(spec)
+                end = high if step > 1 else start
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Day-of-month / day-of-week check with cron's OR rule when both are restricted"""
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day and self._any_weekday:
+            return True
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Next fire time strictly after a moment
+
+        Args:
+            moment: Reference time
+
+        Returns:
+            Next matching minute
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate.year + 5
+
+        while candidate.year <= limit:
+            if candidate.month not in self.months:
+                year = candidate.year + (candidate.month == 12)
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+    def __repr__(self) -> str:
+        return f"CronTrigger({self.expression!r})"
+
+
+class IntervalTrigger:
+    """Fixed-interval trigger"""
+
+    def __init__(self, seconds: float):
+        """
+        Initialize interval trigger
+
+        Args:
+            seconds: Seconds between runs
+        """
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Next fire time after a moment"""
+        return moment + timedelta(seconds=self.seconds)
+
+    def __repr__(self) -> str:
+        return f"IntervalTrigger({self.seconds})"
+
+
+def make_trigger(trigger: Union[str, float, int, timedelta, CronTrigger, IntervalTrigger]):
+    """
+    Build a trigger from a shorthand
+
+    Args:
+        trigger: Seconds or timedelta (interval), cron expression string, or a trigger object
+
+    Returns:
+        CronTrigger or IntervalTrigger
+    """
+    if isinstance(trigger, (CronTrigger, IntervalTrigger)):
+        return trigger
+    if isinstance(trigger, timedelta):
+        return IntervalTrigger(trigger.total_seconds())
+    if isinstance(trigger, (int, float)):
+        return IntervalTrigger(trigger)
+    return CronTrigger(trigger)
+
+
+class Job:
+    """A recurring job and its run state"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        trigger,
+        jitter: float = 0.0,
+        misfire: str = "run_once",
+        start_now: bool = False,
+        args: tuple = (),
+        kwargs: Dict[str, Any] = None,
+        scraper_options: Dict[str, Any] = None
+    ):
+        """Initialize job (see JobScheduler.add_job() for the arguments)"""
+        if misfire not in MISFIRE_POLICIES:
+            raise ValueError(f"misfire must be one of {', '.join(MISFIRE_POLICIES)}")
+        self.name = name
+        self.func = func
+        self.trigger = make_trigger(trigger)
+        self.jitter = jitter
+        self.misfire = misfire
+        self.start_now = start_now
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.scraper_options = scraper_options or {}
+
+        self.planned: Optional[datetime] = None   # Fire time without jitter
+        self.next_run: Optional[datetime] = None  # Fire time with jitter
+        self.catch_up = 0
+        self.running = False
+        self.state: Dict[str, Any] = {"runs": 0, "failures": 0}
+
+    def schedule_after(self, moment: datetime):
+        """Plan the next fire time after a moment"""
+        self.planned = self.trigger.next_after(moment)
+        self.next_run = self.planned + timedelta(seconds=random.uniform(0, self.jitter) if self.jitter else 0)
+
+    def schedule_now(self, now: datetime):
+        """Fire as soon as possible (catch-up or start_now)"""
+        self.planned = now
+        self.next_run = now
+
+
+class JobScheduler:
+    """
+    Recurring job scheduler
+
+    Features:
+    - Cron and interval triggers with random jitter
+    - Limit on jobs running at the same time; a job never overlaps itself
+    - Missed-run policies after downtime: 'skip', 'run_once' or 'run_all'
+    - Last-run state persisted to a JSON file
+    - Jobs run against warm browsers (BrowserPool): every run gets a fresh
+      context instead of launching a browser
+
+    Usage:
+        scheduler = JobScheduler(max_concurrent=2)
+
+        @scheduler.job("*/15 * * * *")
+        async def check_prices(scraper):
+            await scraper.goto("https://example.com")
+
+        scheduler.start()
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        state_path: Optional[str] = "jobs_state.json",
+        pool: Optional[BrowserPool] = None,
+        headless: bool = True,
+        profile: str = None,
+        max_catch_up: int = 100
+    ):
+        """
+        Initialize job scheduler
+
+        Args:
+            max_concurrent: Jobs running at the same time
+            state_path: JSON file for last-run state (None keeps it in memory)
+            pool: Browser pool to run jobs against (default: one browser)
+            headless: Run the default pool's browser headless
+            profile: Performance profile for the default pool
+            max_catch_up: Most missed runs replayed by the 'run_all' policy
+        """
+        self.max_concurrent = max_concurrent
+        self.state_path = Path(state_path) if state_path else None
+        self.pool = pool or BrowserPool(headless=headless, profile=profile)
+        self.max_catch_up = max_catch_up
+
+        self.jobs: Dict[str, Job] = {}
+        self._state = self._load_state()
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._limiter: Optional[asyncio.Semaphore] = None
+
+    def _log(self, message: str, level: str = "info"):
+        """Log message with color coding"""
+        colors = {
+            'info': Fore.CYAN,
+            'warning': Fore.YELLOW,
+            'error': Fore.RED,
+            'success': Fore.GREEN,
+            'debug': Fore.MAGENTA
+        }
+        color = colors.get(level, Fore.WHITE)
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"{color}[{timestamp}] [Scheduler] {message}{Style.RESET_ALL}")
+
+    # ==================== STATE ====================
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted job state"""
+        if not self.state_path or not self.state_path.exists():
+            return {}
+        try:
+            return json.loads(self.state_path.read_text())
+        except (OSError, ValueError) as e:
+            self._log(f"⚠️ Could not read job state: {e}", "warning")
+            return {}
+
+    def _save_state(self):
+        """Persist job state atomically"""
+        if not self.state_path:
+            return
+        self._state.update({name: job.state for name, job in self.jobs.items()})
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp.write_text(json.dumps(self._state, indent=2, default=str))
+        tmp.replace(self.state_path)
+
+    # ==================== JOBS ====================
+
+    def add_job(
+        self,
+        func: Callable,
+        trigger: Union[str, float, timedelta, CronTrigger, IntervalTrigger],
+        name: str = None,
+        jitter: float = 0.0,
+        misfire: str = "run_once",
+        start_now: bool = False,
+        args: tuple = (),
+        kwargs: Dict[str, Any] = None,
+        scraper_options: Dict[str, Any] = None
+    ) -> Job:
+        """
+        Add a recurring job
+
+        Args:
+            func: Job function called as func(scraper, *args, **kwargs); async functions get a
+                  GAScrap, plain functions run in a thread and get a SyncGAScrap
+            trigger: Seconds / timedelta (interval) or cron expression
+            name: Unique job name (default: function name); keys the persisted state
+            jitter: Random delay of up to this many seconds added to every run
+            misfire: What to do with runs missed while the scheduler was down
+                     ('skip', 'run_once' or 'run_all')
+            start_now: Run once right away instead of waiting for the first trigger
+            args: Extra positional arguments for the job
+            kwargs: Extra keyword arguments for the job
+            scraper_options: GAScrap options for this job's context (viewport, timeout, ...)
+
+        Returns:
+            The job
+        """
+        name = name or func.__name__
+        if name in self.jobs:
+            raise ValueError(f"Job already exists: {name}")
+        job = Job(name, func, trigger, jitter, misfire, start_now, args, kwargs, scraper_options)
+        job.state.update(self._state.get(name, {}))
+        self.jobs[name] = job
+        if self._loop is not None:
+            self._plan(job, datetime.now())
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        return job
+
+    def job(self, trigger, **options) -> Callable:
+        """
+        Decorator form of add_job()
+
+        Args:
+            trigger: Seconds / timedelta (interval) or cron expression
+            **options: add_job() options
+        """
+        def decorator(func: Callable) -> Callable:
+            self.add_job(func, trigger, **options)
+            return func
+        return decorator
+
+    def remove_job(self, name: str):
+        """Remove a job (a running instance finishes)"""
+        self.jobs.pop(name, None)
+
+    def _missed_runs(self, job: Job, now: datetime) -> int:
+        """Count fire times between the last recorded run and now"""
+        last = job.state.get("last_fire")
+        if not last:
+            return 0
+        moment = datetime.fromisoformat(last)
+        missed = 0
+        while missed < self.max_catch_up:
+            moment = job.trigger.next_after(moment)
+            if moment > now:
+                break
+            missed += 1
+        return missed
+
+    def _plan(self, job: Job, now: datetime):
+        """Work out a job's first run, applying its misfire policy"""
+        missed = self._missed_runs(job, now)
+        if missed and job.misfire != "skip":
+            job.catch_up = missed - 1 if job.misfire == "run_all" else 0
+            self._log(f"⏪ {job.name}: {missed} missed run(s), policy '{job.misfire}'", "info")
+            job.schedule_now(now)
+        elif job.start_now:
+            job.schedule_now(now)
+        else:
+            job.schedule_after(now)
+
+    # ==================== RUNNING ====================
+
+    async def _call(self, job: Job, scraper):
+        """Call the job function with the right flavour of scraper"""
+        if asyncio.iscoroutinefunction(job.func):
+            return await job.func(scraper, *job.args, **job.kwargs)
+        sync_scraper = SyncGAScrap.wrap(scraper, self._loop)
+        return await self._loop.run_in_executor(
+            None, lambda: job.func(sync_scraper, *job.args, **job.kwargs)
+        )
+
+    async def _execute(self, job: Job, fire_time: datetime):
+        """Run a job once in its own context"""
+        try:
+            async with self._limiter:
+                started = time.perf_counter()
+                job.state["last_fire"] = fire_time.isoformat()
+                job.state["last_run"] = datetime.now().isoformat()
+                scraper = None
+                try:
+                    scraper = await self.pool.acquire(**job.scraper_options)
+                    await self._call(job, scraper)
+                    job.state["last_status"] = "ok"
+                    job.state["last_error"] = None
+                    self._log(f"✅ {job.name} finished in {time.perf_counter() - started:.1f}s", "success")
+                except Exception as e:
+                    job.state["failures"] = job.state.get("failures", 0) + 1
+                    job.state["last_status"] = "failed"
+                    job.state["last_error"] = str(e)
+                    self._log(f"❌ {job.name} failed: {e}", "error")
+                finally:
+                    if scraper is not None:
+                        await self.pool.release(scraper)
+                    job.state["runs"] = job.state.get("runs", 0) + 1
+                    job.state["last_duration"] = round(time.perf_counter() - started, 3)
+                    self._save_state()
+        finally:
+            job.running = False
+            if job.catch_up > 0 and not self._stopping:
+                job.catch_up -= 1
+                job.schedule_now(datetime.now())
+            self._wakeup.set()
+
+    def _dispatch(self, now: datetime):
+        """Start every due job"""
+        for job in list(self.jobs.values()):
+            if job.next_run is None or job.next_run > now:
+                continue
+            if job.running:
+                if job.catch_up == 0:
+                    job.schedule_after(max(now, job.planned))
+                    self._log(f"⏭️ {job.name} is still running - skipping this run", "warning")
+                continue
+            fire_time = job.planned
+            if job.catch_up == 0:
+                job.schedule_after(max(now, job.planned))
+            job.running = True
+            task = self._loop.create_task(self._execute(job, fire_time))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def run(self):
+        """Run the scheduler until stop() is called"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._limiter = asyncio.Semaphore(self.max_concurrent)
+        self._stopping = False
+
+        now = datetime.now()
+        for job in self.jobs.values():
+            self._plan(job, now)
+
+        await self.pool.start()
+        self._log(f"⏰ Scheduler started with {len(self.jobs)} job(s)", "success")
+        try:
+            while not self._stopping:
+                now = datetime.now()
+                self._dispatch(now)
+
+                upcoming = [job.next_run for job in self.jobs.values() if job.next_run and not job.running]
+                # Re-check at least every minute so clock changes are picked up
+                delay = 60.0
+                if upcoming:
+                    delay = min(delay, max(0.0, (min(upcoming) - datetime.now()).total_seconds()))
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if self._tasks:
+                await asyncio.gather(*list(self._tasks), return_exceptions=True)
+            self._save_state()
+            await self.pool.close()
+            self._loop = None
+            self._log("👋 Scheduler stopped", "info")
+
+    def start(self):
+        """Run the scheduler in the current thread (blocks until Ctrl+C or stop())"""
+        try:
+            asyncio.run(self.run())
+        except KeyboardInterrupt:
+            pass
+
+    def stop(self):
+        """Stop after the running jobs finish (safe to call from any thread)"""
+        self._stopping = True
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Get the state of every job
+
+        Returns:
+            List of {'name', 'trigger', 'next_run', 'running', 'runs', 'failures', 'last_run', ...}
+        """
+        return [
+            {
+                "name": job.name,
+                "trigger": repr(job.trigger),
+                "next_run": job.next_run.isoformat() if job.next_run else None,
+                "running": job.running,
+                **job.state
+            }
+            for job in self.jobs.values()
+        ]
@@ -0,0 +1,264 @@
+"""
+GA-Scrap Locators Module
+Per-page locator cache and scoped element handles
+"""
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Callable, List, AsyncIterator
+from playwright.async_api import Page, Frame, Locator, ElementHandle
+
+
+_FACTORIES: Dict[str, Callable[..., Locator]] = {
+    "css": lambda page, value, **options: page.locator(value, **options),
+    "text": lambda page, value, **options: page.get_by_text(value, **options),
+    "role": lambda page, value, **options: page.get_by_role(value, **options),
+    "label": lambda page, value, **options: page.get_by_label(value, **options),
+    "placeholder": lambda page, value, **options: page.get_by_placeholder(value, **options),
+    "test_id": lambda page, value, **options: page.get_by_test_id(value, **options),
+    "title": lambda page, value, **options: page.get_by_title(value, **options),
+}
+
+
+class LocatorCache:
+    """
+    LRU cache of locators for one page
+
+    Locators are keyed by kind (css, text, role, label, placeholder, test_id,
+    title), value and options, and dropped whenever the page's main frame
+    navigates, so a cached locator never outlives the document it was built for.
+    """
+
+    KINDS = tuple(_FACTORIES)
+
+    def __init__(self, page: Page, max_size: int = 256):
+        """
+        Initialize locator cache
+
+        Args:
+            page: Page the locators belong to
+            max_size: Locators kept before the least recently used one is dropped
+        """
+        self.page = page
+        self.max_size = max_size
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self._entries: "OrderedDict[tuple, Locator]" = OrderedDict()
+        page.on("framenavigated", self._on_frame_navigated)
+
+    def _on_frame_navigated(self, frame: Frame):
+        """Invalidate when the main frame navigates (iframe navigations keep the cache)"""
+        if frame == self.page.main_frame:
+            self.invalidate()
+
+    def get(self, kind: str, value: Any, first: bool = False, **options) -> Locator:
+        """
+        Get a cached locator, building it on a miss
+
+        Args:
+            kind: Locator kind ('css', 'text', 'role', 'label', 'placeholder', 'test_id', 'title')
+            value: Selector, text, role, ... for that kind
+            first: Narrow the locator to its first match (like page.click(selector))
+            **options: Options for the locator factory (exact, name, has_text, ...)
+
+        Returns:
+            Locator object
+        """
+        factory = _FACTORIES.get(kind)
+        if factory is None:
+            raise ValueError(f"Unknown locator kind: {kind} (use one of {', '.join(self.KINDS)})")
+
+        try:
+            key = (kind, value, first, tuple(sorted(options.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable options (e.g. a list) - build without caching
+            key = None
+
+        if key is not None:
+            locator = self._entries.get(key)
+            if locator is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return locator
+
+        self.stats["misses"] += 1
+        locator = factory(self.page, value, **options)
+        if first:
+            locator = locator.first
+
+        if key is not None:
+            self._entries[key] = locator
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return locator
+
+    def invalidate(self):
+        """Drop every cached locator"""
+        if self._entries:
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+
+class HandleScope:
+    """
+    Scope that owns element handles and disposes them when it closes
+
+    Element handles pin their DOM nodes in the renderer until they are disposed
+    or the page navigates, so long single-page sessions that query handles in a
+    loop keep growing. Handles taken through a scope are released on exit.
+    """
+
+    def __init__(self, page: Page):
+        """
+        Initialize handle scope
+
+        Args:
+            page: Page (or frame) to query
+        """
+        self.page = page
+        self.handles: List[ElementHandle] = []
+
+    def track(self, handle: Optional[ElementHandle]) -> Optional[ElementHandle]:
+        """Dispose a handle obtained elsewhere together with this scope"""
+        if handle is not None:
+            self.handles.append(handle)
+        return handle
+
+    async def query(self, selector: str) -> Optional[ElementHandle]:
+        """Get the first element matching a selector (or None)"""
+        return self.track(await self.page.query_selector(selector))
+
+    async def query_all(self, selector: str) -> List[ElementHandle]:
+        """Get all elements matching a selector"""
+        handles = await self.page.query_selector_all(selector)
+        self.handles.extend(handles)
+        return handles
+
+    async def dispose(self):
+        """Release every handle of the scope"""
+        handles, self.handles = self.handles, []
+        for handle in handles:
+            try:
+                await handle.dispose()
+            except Exception:
+                # Already gone with a navigation or a closed page
+                pass
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.dispose()
+
+
+class LocatorCacheFeatures:
+    """Mixin class that serves repeated selectors from per-page locator caches"""
+
+    # ==================== LOCATOR CACHE ====================
+
+    def cached_locator(self, kind: str, value: Any, page: Optional[Page] = None,
+                       first: bool = False, **options) -> Locator:
+        """
+        Get a locator from the page's locator cache
+
+        Args:
+            kind: Locator kind ('css', 'text', 'role', 'label', 'placeholder', 'test_id', 'title')
+            value: Selector, text, role, ... for that kind
+            page: Page to use (default: main page)
+            first: Narrow the locator to its first match
+            **options: Options for the locator factory (exact, name, has_text, ...)
+
+        Returns:
+            Locator object
+        """
+        target_page = page or self.page
+        if not self.locator_cache_size:
+            locator = _FACTORIES[kind](target_page, value, **options)
+            return locator.first if first else locator
+
+        cache = self._locator_caches.get(target_page)
+        if cache is None:
+            cache = LocatorCache(target_page, self.locator_cache_size)
+            self._locator_caches[target_page] = cache
+        return cache.get(kind, value, first=first, **options)
+
+    def _drop_locator_cache(self, page: Page):
+        """Forget the cache of a closed page, keeping its counters"""
+        cache = self._locator_caches.pop(page, None)
+        if cache is not None:
+            for name, count in cache.stats.items():
+                self._retired_locator_stats[name] += count
+
+    def clear_locator_cache(self, page: Optional[Page] = None):
+        """
+        Drop cached locators
+
+        Args:
+            page: Page whose cache to clear (default: all pages)
+        """
+        caches = [self._locator_caches.get(page)] if page else list(self._locator_caches.values())
+        for cache in caches:
+            if cache is not None:
+                cache.invalidate()
+
+    def get_locator_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get locator cache statistics over all pages (including closed ones)
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'evictions', 'invalidations', 'size', 'pages' and 'hit_rate'
+        """
+        stats = dict(self._retired_locator_stats)
+        for cache in self._locator_caches.values():
+            for name, count in cache.stats.items():
+                stats[name] += count
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["size"] = sum(len(cache) for cache in self._locator_caches.values())
+        stats["pages"] = len(self._locator_caches)
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    # ==================== SCOPED ELEMENT HANDLES ====================
+
+    def handle_scope(self, page: Optional[Page] = None) -> HandleScope:
+        """
+        Open a scope whose element handles are disposed when it closes
+
+        Args:
+            page: Page to query (default: main page)
+
+        Returns:
+            HandleScope to use with 'async with'
+        """
+        return HandleScope(page or self.page)
+
+    @asynccontextmanager
+    async def query_elements(self, selector: str, page: Optional[Page] = None) -> AsyncIterator[List[ElementHandle]]:
+        """
+        Get element handles that are disposed when the block ends
+
+        Prefer get_text()/get_texts() or locators; use this only when element
+        handles are really needed.
+
+        Args:
+            selector: CSS selector
+            page: Page to use (default: main page)
+
+        Yields:
+            List of element handles
+        """
+        async with self.handle_scope(page) as scope:
+            yield await scope.query_all(selector)
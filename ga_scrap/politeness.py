@@ -0,0 +1,320 @@
+"""
+GA-Scrap Politeness Module
+Per-host token buckets and concurrency limits for crawling many domains at once
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Callable, Iterable
+from urllib.parse import urlsplit
+
+
+def get_host(url: str) -> str:
+    """
+    Get the host a URL belongs to (used as the politeness key)
+
+    Args:
+        url: URL to inspect
+
+    Returns:
+        Lower-cased host name (with port if present)
+    """
+    return urlsplit(url).netloc.lower()
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum burst size
+            clock: Monotonic clock function
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated_at = clock()
+
+    def _refill(self):
+        """Add tokens for the time elapsed since the last update"""
+        now = self.clock()
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """
+        Seconds until `tokens` are available (0 if available now)
+
+        Args:
+            tokens: Number of tokens needed
+        """
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if they are available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        if self.wait_time(tokens) > 0:
+            return False
+        if self.rate > 0:
+            self.tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1.0):
+        """
+        Wait until tokens are available and take them
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        while not self.try_acquire(tokens):
+            await asyncio.sleep(self.wait_time(tokens))
+
+
+class _HostState:
+    """Rate limit and concurrency state for one host"""
+
+    def __init__(self, rate: float, burst: float, max_active: int):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_active = max_active
+        self.active = 0
+        self.queue = deque()
+
+
+class PolitenessScheduler:
+    """
+    Politeness scheduler for multi-domain crawls
+
+    Features:
+    - Token bucket per host (requests per second + burst)
+    - Maximum concurrent requests per host
+    - Global concurrency cap
+    - Hosts that are throttled never block work for other hosts
+    """
+
+    def __init__(
+        self,
+        rate_per_host: float = 1.0,
+        burst: float = 1.0,
+        max_per_host: int = 2,
+        max_concurrency: int = 8,
+        host_limits: Dict[str, Dict[str, Any]] = None
+    ):
+        """
+        Initialize politeness scheduler
+
+        Args:
+            rate_per_host: Requests per second allowed for each host (0 = unlimited)
+            burst: Requests a host may receive back-to-back before throttling
+            max_per_host: Maximum in-flight requests per host
+            max_concurrency: Maximum in-flight requests overall
+            host_limits: Per-host overrides {'example.com': {'rate': 0.2, 'max_active': 1}}
+        """
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.max_per_host = max_per_host
+        self.max_concurrency = max_concurrency
+        self.host_limits = host_limits or {}
+
+        self.active = 0
+        self.pending = 0
+        self.closed = False
+        self._hosts: "OrderedDict[str, _HostState]" = OrderedDict()
+        self._changed: Optional[asyncio.Event] = None
+
+    def _host(self, host: str) -> _HostState:
+        """Get or create the state for a host"""
+        state = self._hosts.get(host)
+        if state is None:
+            limits = self.host_limits.get(host, {})
+            state = _HostState(
+                rate=limits.get("rate", self.rate_per_host),
+                burst=limits.get("burst", self.burst),
+                max_active=limits.get("max_active", self.max_per_host)
+            )
+            self._hosts[host] = state
+        return state
+
+    def _notify(self):
+        """Wake up anyone waiting in acquire()"""
+        if self._changed is not None:
+            self._changed.set()
+
+    def add(self, url: str):
+        """
+        Queue a URL
+
+        Args:
+            url: URL to schedule
+        """
+        self._host(get_host(url)).queue.append(url)
+        self.pending += 1
+        self._notify()
+
+    def add_many(self, urls: Iterable[str]):
+        """
+        Queue several URLs
+
+        Args:
+            urls: URLs to schedule
+        """
+        for url in urls:
+            self.add(url)
+
+    def close(self):
+        """Signal that no more URLs will be added"""
+        self.closed = True
+        self._notify()
+
+    def _next_ready(self):
+        """
+        Find the next URL whose host has a free slot and a token
+
+        Returns:
+            Tuple of (url or None, seconds until the earliest host becomes ready or None)
+        """
+        if self.active >= self.max_concurrency:
+            return None, None
+
+        earliest = None
+        for host in list(self._hosts):
+            state = self._hosts[host]
+            if not state.queue:
+                # Forget idle hosts once their bucket has refilled to keep the scan short
+                if state.active == 0 and state.bucket.wait_time(state.bucket.capacity) == 0:
+                    del self._hosts[host]
+                continue
+            if state.active >= state.max_active:
+                continue
+
+            wait = state.bucket.wait_time()
+            if wait > 0:
+                earliest = wait if earliest is None else min(earliest, wait)
+                continue
+
+            state.bucket.try_acquire()
+            state.active += 1
+            self.active += 1
+            self.pending -= 1
+
+            # Rotate hosts so every domain gets its turn
+            self._hosts.move_to_end(host)
+            return state.queue.popleft(), None
+
+        return None, earliest
+
+    async def acquire(self) -> Optional[str]:
+        """
+        Wait for the next URL that may be fetched now
+
+        Returns:
+            URL to fetch, or None once the scheduler is closed and drained
+        """
+        if self._changed is None:
+            self._changed = asyncio.Event()
+
+        while True:
+            url, wait = self._next_ready()
+            if url is not None:
+                return url
+
+            # In-flight URLs may still be re-queued for a retry, so wait for them too
+            if self.closed and self.pending == 0 and self.active == 0:
+                return None
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def release(self, url: str):
+        """
+        Mark a URL returned by acquire() as finished
+
+        Args:
+            url: URL that finished
+        """
+        state = self._host(get_host(url))
+        state.active = max(0, state.active - 1)
+        self.active = max(0, self.active - 1)
+        self._notify()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        Wait for a politeness slot for a single request
+
+        Args:
+            url: URL about to be fetched
+
+        Usage:
+            async with scheduler.slot(url):
+                ...
+        """
+        if self._changed is None:
+            self._changed = asyncio.Event()
+
+        host = get_host(url)
+        while True:
+            state = self._host(host)
+            if self.active < self.max_concurrency and state.active < state.max_active:
+                wait = state.bucket.wait_time()
+                if wait <= 0:
+                    state.bucket.try_acquire()
+                    break
+            else:
+                wait = None
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+        state.active += 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.release(url)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics
+
+        Returns:
+            Dictionary with in-flight, pending and per-host counts
+        """
+        return {
+            "active": self.active,
+            "pending": self.pending,
+            "hosts": {
+                host: {"active": state.active, "queued": len(state.queue)}
+                for host, state in self._hosts.items()
+                if state.active or state.queue
+            }
+        }
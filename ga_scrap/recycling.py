@@ -0,0 +1,142 @@
+"""
+GA-Scrap Context Recycling Module
+Keeps renderer memory bounded by recreating the browser context transparently
+"""
+
+import time
+from typing import Optional, Dict, Any
+from playwright.async_api import Page
+
+
+class ContextRecyclingFeatures:
+    """Mixin class that recycles the main browser context according to a policy"""
+
+    # ==================== CONTEXT RECYCLING ====================
+
+    async def get_renderer_memory(self, page: Optional[Page] = None) -> Dict[str, Any]:
+        """
+        Get renderer memory usage for a page
+
+        Args:
+            page: Page to inspect (default: main page)
+
+        Returns:
+            Dictionary with 'js_heap_used_mb' and 'dom_nodes' (empty if unavailable)
+        """
+        target_page = page or self.page
+
+        try:
+            if self.browser_type == "chromium":
+                cdp = await self.context.new_cdp_session(target_page)
+                try:
+                    await cdp.send('Performance.enable')
+                    response = await cdp.send('Performance.getMetrics')
+                finally:
+                    await cdp.detach()
+
+                metrics = {m['name']: m['value'] for m in response.get('metrics', [])}
+                return {
+                    "js_heap_used_mb": metrics.get('JSHeapUsedSize', 0) / (1024 * 1024),
+                    "dom_nodes": int(metrics.get('Nodes', 0))
+                }
+
+            heap = await target_page.evaluate(
+                "() => performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+            if heap is not None:
+                return {"js_heap_used_mb": heap / (1024 * 1024)}
+
+        except Exception as e:
+            self.log(f"Could not read renderer memory: {e}", "debug")
+
+        return {}
+
+    async def _recycle_reason(self) -> Optional[str]:
+        """
+        Check the recycle policy against the current context
+
+        Returns:
+            Human readable reason if the context should be recycled, otherwise None
+        """
+        policy = self.recycle_policy
+
+        max_navigations = policy.get("max_navigations")
+        if max_navigations and self._navigation_count >= max_navigations:
+            return f"{self._navigation_count} navigations"
+
+        max_age_minutes = policy.get("max_age_minutes")
+        if max_age_minutes and self._context_created_at:
+            age_minutes = (time.time() - self._context_created_at) / 60
+            if age_minutes >= max_age_minutes:
+                return f"context age {age_minutes:.1f} min"
+
+        max_heap_mb = policy.get("max_js_heap_mb")
+        max_dom_nodes = policy.get("max_dom_nodes")
+        if not (max_heap_mb or max_dom_nodes):
+            return None
+
+        # Memory checks cost a round trip, so only sample every few navigations
+        interval = policy.get("memory_check_interval", 10)
+        if self._navigation_count == 0 or self._navigation_count % interval:
+            return None
+
+        memory = await self.get_renderer_memory()
+        heap_mb = memory.get("js_heap_used_mb")
+        if max_heap_mb and heap_mb is not None and heap_mb >= max_heap_mb:
+            return f"JS heap {heap_mb:.0f} MB"
+
+        dom_nodes = memory.get("dom_nodes")
+        if max_dom_nodes and dom_nodes is not None and dom_nodes >= max_dom_nodes:
+            return f"{dom_nodes} DOM nodes"
+
+        return None
+
+    async def _maybe_recycle_context(self):
+        """Recycle the main context if the recycle policy says so"""
+        try:
+            reason = await self._recycle_reason()
+        except Exception as e:
+            self.log(f"Could not evaluate recycle policy: {e}", "debug")
+            return
+
+        if reason:
+            self.log(f"♻️ Recycling context ({reason})", "info")
+            await self.recycle_context(restore_url=False)
+
+    async def recycle_context(self, restore_url: bool = True):
+        """
+        Close the main context and recreate it, carrying over storage state,
+        routes and listeners
+
+        Args:
+            restore_url: Navigate the new main page back to the previous URL
+        """
+        if not self.browser or not self.context:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        current_url = None
+        if self.page and not self.page.is_closed():
+            current_url = self.page.url
+
+        storage_state = None
+        try:
+            storage_state = await self.context.storage_state()
+            self._last_storage_state = storage_state
+        except Exception as e:
+            self.log(f"⚠️ Could not capture storage state before recycling: {e}", "warning")
+
+        # Close the old context first so its renderers are released before new ones spawn
+        old_context = self.context
+        try:
+            await old_context.close()
+        except Exception as e:
+            self.log(f"⚠️ Error closing old context: {e}", "debug")
+
+        self.pages = []
+        await self._create_context(storage_state=storage_state)
+        self.recycle_count += 1
+
+        if restore_url and current_url and current_url != "about:blank":
+            await self.page.goto(current_url)
+
+        self.log(f"♻️ Context recycled (total: {self.recycle_count})", "success")
@@ -0,0 +1,245 @@
+"""
+GA-Scrap Screenshots Module
+Capture screenshots to memory and encode/write them off the event loop
+"""
+
+import asyncio
+import hashlib
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Set
+from playwright.async_api import Page
+
+
+_EXTENSIONS = {"png": "png", "jpeg": "jpg", "jpg": "jpg", "webp": "webp"}
+
+
+class ScreenshotPipeline:
+    """
+    Screenshot pipeline
+
+    Features:
+    - Captures to bytes, so the page is free again as soon as the capture returns
+    - Encoding (JPEG/WebP quality, thumbnail downscale) and disk writes run in a thread pool
+    - Identical frames are stored once (hash dedupe)
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "screenshots",
+        format: str = "png",
+        quality: int = 80,
+        thumbnail: Optional[Tuple[int, int]] = None,
+        dedupe: bool = True,
+        max_workers: int = 2,
+        max_seen: int = 10000
+    ):
+        """
+        Initialize screenshot pipeline
+
+        Args:
+            output_dir: Directory screenshots are written to
+            format: 'png', 'jpeg' or 'webp' (WebP and thumbnails need Pillow)
+            quality: JPEG/WebP quality (1-100)
+            thumbnail: Downscale to fit (width, height), keeping the aspect ratio
+            dedupe: Skip frames identical to one already saved
+            max_workers: Encoder threads
+            max_seen: Frame hashes remembered for dedupe (least recently seen ones are forgotten)
+        """
+        format = format.lower()
+        if format not in _EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot format: {format}")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.format = "jpeg" if format == "jpg" else format
+        self.quality = quality
+        self.thumbnail = thumbnail
+        self.dedupe = dedupe
+        self.max_seen = max_seen
+
+        self.stats = {"captured": 0, "written": 0, "duplicates": 0, "failed": 0, "bytes_written": 0}
+        self.last_error: Optional[BaseException] = None
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ga-scrap-screenshot")
+        self._pending: Set[asyncio.Future] = set()
+        self._seen: "OrderedDict[str, Path]" = OrderedDict()
+        self._counter = 0
+
+        if self.format == "webp" or self.thumbnail:
+            self._require_pillow()
+
+    @staticmethod
+    def _require_pillow():
+        """Import Pillow or explain how to get it"""
+        try:
+            from PIL import Image
+            return Image
+        except ImportError:
+            raise ImportError("Pillow is required for WebP screenshots and thumbnails (pip install Pillow)")
+
+    def _needs_reencode(self) -> bool:
+        """Check whether Playwright's own encoder is not enough"""
+        return self.format == "webp" or bool(self.thumbnail)
+
+    def _capture_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Screenshot options for the capture step"""
+        options = dict(options)
+        options.pop("path", None)
+        if self._needs_reencode():
+            # Capture losslessly and let Pillow produce the final image
+            options["type"] = "png"
+            options.pop("quality", None)
+        else:
+            options["type"] = self.format
+            if self.format == "jpeg":
+                options.setdefault("quality", self.quality)
+        return options
+
+    def _target_path(self, name: Optional[str]) -> Path:
+        """Output path for a screenshot"""
+        self._counter += 1
+        if not name:
+            name = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self._counter:05d}"
+        name = Path(name).stem if Path(name).suffix.lower().lstrip(".") in _EXTENSIONS else name
+        return self.output_dir / f"{name}.{_EXTENSIONS[self.format]}"
+
+    def _encode(self, data: bytes) -> bytes:
+        """Re-encode captured PNG bytes (runs in a worker thread)"""
+        Image = self._require_pillow()
+        with Image.open(io.BytesIO(data)) as image:
+            if self.thumbnail:
+                image.thumbnail(self.thumbnail)
+            if self.format == "jpeg" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            out = io.BytesIO()
+            save_options = {} if self.format == "png" else {"quality": self.quality}
+            image.save(out, format=self.format.upper(), **save_options)
+            return out.getvalue()
+
+    def _encode_and_write(self, data: bytes, path: Path) -> int:
+        """Encode and write a screenshot (runs in a worker thread)"""
+        if self._needs_reencode():
+            data = self._encode(data)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        return len(data)
+
+    def _on_written(self, future: asyncio.Future):
+        """Book-keeping once a write finished"""
+        self._pending.discard(future)
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.stats["failed"] += 1
+            self.last_error = future.exception()
+            return
+        self.stats["written"] += 1
+        self.stats["bytes_written"] += future.result()
+
+    async def capture(self, page: Page, name: Optional[str] = None, **options) -> Path:
+        """
+        Capture a screenshot and queue it for encoding and writing
+
+        Args:
+            page: Page to capture
+            name: File name without extension (default: timestamp + counter)
+            **options: Playwright screenshot options (full_page, clip, ...)
+
+        Returns:
+            Path the screenshot is (or will be) written to; for a duplicate frame,
+            the path of the identical earlier screenshot
+        """
+        data = await page.screenshot(**self._capture_options(options))
+        self.stats["captured"] += 1
+
+        digest = None
+        if self.dedupe:
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if digest in self._seen:
+                self._seen.move_to_end(digest)
+                self.stats["duplicates"] += 1
+                return self._seen[digest]
+
+        path = self._target_path(name)
+        if digest is not None:
+            self._seen[digest] = path
+            # Long monitoring jobs would otherwise remember every frame forever
+            if len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._encode_and_write, data, path)
+        self._pending.add(future)
+        future.add_done_callback(self._on_written)
+        return path
+
+    async def drain(self):
+        """Wait until every queued screenshot is on disk"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    async def close(self):
+        """Drain queued screenshots and stop the encoder threads"""
+        await self.drain()
+        self._executor.shutdown(wait=True)
+
+
+class ScreenshotFeatures:
+    """Mixin class for non-blocking screenshots"""
+
+    # ==================== SCREENSHOT PIPELINE ====================
+
+    async def configure_screenshots(self, **settings) -> ScreenshotPipeline:
+        """
+        Configure the screenshot pipeline used by capture_screenshot()
+
+        Screenshots queued on the previous pipeline are written before it is replaced.
+
+        Args:
+            **settings: ScreenshotPipeline options (output_dir, format, quality, thumbnail,
+                        dedupe, max_workers, max_seen)
+
+        Returns:
+            The screenshot pipeline
+        """
+        if self.screenshot_pipeline is not None:
+            old = self.screenshot_pipeline
+            await old.close()
+            if old.stats["failed"]:
+                self.log(f"⚠️ {old.stats['failed']} queued screenshots could not be written: "
+                         f"{old.last_error}", "warning")
+        self.screenshot_pipeline = ScreenshotPipeline(**settings)
+        return self.screenshot_pipeline
+
+    async def capture_screenshot(self, name: str = None, page: Optional[Page] = None, **options) -> Optional[str]:
+        """
+        Capture a screenshot without waiting for it to be encoded and written
+
+        Args:
+            name: File name without extension (default: timestamp + counter)
+            page: Page to use (default: main page)
+            **options: Playwright screenshot options (full_page, clip, ...)
+
+        Returns:
+            Path of the screenshot file
+        """
+        if self.screenshot_pipeline is None:
+            await self.configure_screenshots()
+        target_page = page or self.page
+
+        async def _capture():
+            path = await self.screenshot_pipeline.capture(target_page, name, **options)
+            self.log(f"📸 Screenshot queued: {path}", "debug")
+            return str(path)
+
+        return await self._safe_execute_async("capture_screenshot", _capture)
+
+    async def flush_screenshots(self):
+        """Wait until all queued screenshots are written"""
+        if self.screenshot_pipeline is not None:
+            await self.screenshot_pipeline.drain()
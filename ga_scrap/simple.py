@@ -13,15 +13,18 @@ class SimpleScraper:
     Perfect for beginners or quick scraping tasks
     """
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, scraper: Optional[GAScrap] = None, profile: str = None):
         """
         Initialize simple scraper
         
         Args:
             headless: Run browser in headless mode (default: False - visible)
+            scraper: Existing, already started GAScrap to use (it is not stopped on exit)
+            profile: Performance profile ('throughput', 'low-memory', 'fidelity', ...)
         """
-        self.scraper = GAScrap(headless=headless, debug=True)
-        self.started = False
+        self._owns_scraper = scraper is None
+        self.scraper = scraper or GAScrap(headless=headless, debug=True, profile=profile)
+        self.started = not self._owns_scraper
     
     async def __aenter__(self):
         """Start scraper when entering context"""
@@ -40,7 +43,7 @@ class SimpleScraper:
     
     async def stop(self):
         """Stop the scraper"""
-        if self.started:
+        if self.started and self._owns_scraper:
             await self.scraper.stop()
             self.started = False
     
@@ -0,0 +1,678 @@
+"""
+GA-Scrap Sinks Module
+Streaming result writers that never hold a whole crawl in memory
+"""
+
+import csv
+import gzip
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Union
+
+
+_CLOSE = object()
+
+
+class BaseSink:
+    """
+    Base class for streaming sinks
+
+    Features:
+    - Accepts records one at a time or in batches
+    - Optional background writer thread fed by a bounded queue
+    - Flushes (and fsyncs) every N records or T seconds
+    - Rotates files by size or record count
+    """
+
+    # Write to '<name>.part' and rename when the file is finished
+    # (for formats that are unreadable until closed)
+    atomic = False
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        rotate_bytes: Optional[int] = None,
+        rotate_records: Optional[int] = None,
+        flush_every: int = 1000,
+        flush_interval: float = 5.0,
+        background: bool = True,
+        queue_size: int = 10000
+    ):
+        """
+        Initialize sink
+
+        Args:
+            path: Output file; with rotation, files become '<stem>-00001<suffix>'
+            rotate_bytes: Start a new file after this many bytes
+            rotate_records: Start a new file after this many records
+            flush_every: Flush after this many buffered records
+            flush_interval: Flush at least every N seconds while records arrive
+            background: Write from a background thread (write() only enqueues)
+            queue_size: Maximum queued records before write() blocks
+        """
+        self.path = Path(path)
+        self.rotate_bytes = rotate_bytes
+        self.rotate_records = rotate_records
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.background = background
+
+        self.records_written = 0
+        self.files: List[Path] = []
+        self.closed = False
+
+        self._file = None
+        self._file_path: Optional[Path] = None
+        self._file_records = 0
+        self._file_index = 0
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._thread = threading.Thread(target=self._run, name=f"sink-{self.path.name}", daemon=True)
+            self._thread.start()
+
+    # ==================== PUBLIC API ====================
+
+    def write(self, record: Dict[str, Any]):
+        """
+        Write one record
+
+        Args:
+            record: Record to write
+        """
+        self._submit([record])
+
+    def write_many(self, records: Iterable[Dict[str, Any]]):
+        """
+        Write several records
+
+        Args:
+            records: Records to write
+        """
+        records = list(records)
+        if records:
+            self._submit(records)
+
+    def flush(self):
+        """Write out everything submitted so far and sync it to disk"""
+        self._raise_error()
+        if self._queue is not None:
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+            self._raise_error()
+        else:
+            with self._lock:
+                self._flush_file()
+
+    def close(self):
+        """Flush and close the current file"""
+        if self.closed:
+            return
+        self.closed = True
+
+        if self._queue is not None:
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        else:
+            with self._lock:
+                self._finish_file()
+        self._raise_error()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    # ==================== WRITER ====================
+
+    def _submit(self, records: List[Dict[str, Any]]):
+        """Hand records to the writer"""
+        if self.closed:
+            raise RuntimeError("Sink is closed")
+        self._raise_error()
+
+        if self._queue is not None:
+            self._queue.put(records)
+        else:
+            with self._lock:
+                self._write_batch(records)
+
+    def _raise_error(self):
+        """Re-raise an error from the writer thread"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        """Background writer loop"""
+        item = None
+        while True:
+            if item is None:
+                timeout = None
+                if self._unflushed:
+                    timeout = max(0.0, self.flush_interval - (time.monotonic() - self._last_flush))
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._guarded(self._flush_file)
+                    continue
+
+            if item is _CLOSE:
+                self._guarded(self._finish_file)
+                return
+            if isinstance(item, threading.Event):
+                self._guarded(self._flush_file)
+                item.set()
+                item = None
+                continue
+
+            # Drain whatever else is queued so it is written in one go
+            records, item = list(item), None
+            while len(records) < self.flush_every:
+                try:
+                    more = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if not isinstance(more, list):
+                    item = more  # control item, handled after this batch
+                    break
+                records.extend(more)
+
+            self._guarded(self._write_batch, records)
+
+    def _guarded(self, func, *args):
+        """Run a writer step, keeping the first error for the caller"""
+        try:
+            func(*args)
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+
+    def _write_batch(self, records: List[Dict[str, Any]]):
+        """Write records, rotating files as needed"""
+        for record in records:
+            if self._file is None:
+                self._open_next()
+
+            self._write_record(record)
+            self._file_records += 1
+            self._unflushed += 1
+            self.records_written += 1
+
+            if self._unflushed >= self.flush_every or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_file()
+
+            if self._should_rotate():
+                self._finish_file()
+
+    def _should_rotate(self) -> bool:
+        """Check whether the current file is full"""
+        if self.rotate_records and self._file_records >= self.rotate_records:
+            return True
+        if self.rotate_bytes and self._bytes_written() >= self.rotate_bytes:
+            return True
+        return False
+
+    def _next_path(self) -> Path:
+        """Path of the next output file"""
+        if not (self.rotate_bytes or self.rotate_records or self.files):
+            return self.path
+        self._file_index = max(self._file_index, len(self.files)) + 1
+        name = self.path.name
+        stem, dot, suffix = name.partition(".")
+        return self.path.with_name(f"{stem}-{self._file_index:05d}{dot}{suffix}")
+
+    def _open_next(self):
+        """Open the next output file"""
+        self._file_path = self._next_path()
+        target = self._file_path.with_name(self._file_path.name + ".part") if self.atomic else self._file_path
+        self._file = self._open_file(target)
+        self._file_records = 0
+
+    def _flush_file(self):
+        """Flush buffered data and fsync it"""
+        if self._file is not None and self._unflushed:
+            self._flush_handle()
+            self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def _finish_file(self):
+        """Flush and close the current file"""
+        if self._file is None:
+            return
+        self._flush_file()
+        self._seal_file()
+
+    def _seal_file(self):
+        """Close the current file and move it into place"""
+        self._close_file()
+        self._file = None
+        if self.atomic:
+            os.replace(self._file_path.with_name(self._file_path.name + ".part"), self._file_path)
+        self.files.append(self._file_path)
+
+    # ==================== FORMAT HOOKS ====================
+
+    def _open_file(self, path: Path):
+        """Open an output file (format specific)"""
+        raise NotImplementedError
+
+    def _write_record(self, record: Dict[str, Any]):
+        """Write one record to the current file (format specific)"""
+        raise NotImplementedError
+
+    def _bytes_written(self) -> int:
+        """Bytes written to the current file"""
+        return self._file.tell()
+
+    def _flush_handle(self):
+        """Flush and fsync the current file"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close_file(self):
+        """Close the current file"""
+        self._file.close()
+
+
+class NDJSONSink(BaseSink):
+    """Newline-delimited JSON sink (one record per line, survives crashes up to the last flush)"""
+
+    def _open_file(self, path: Path):
+        return open(path, "a", encoding="utf-8")
+
+    def _write_record(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+class GzipNDJSONSink(NDJSONSink):
+    """Gzip-compressed NDJSON sink (.jsonl.gz)"""
+
+    def _open_file(self, path: Path):
+        self._raw = open(path, "ab")
+        return gzip.GzipFile(fileobj=self._raw, mode="ab")
+
+    def _write_record(self, record: Dict[str, Any]):
+        self._file.write((json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+
+    def _bytes_written(self) -> int:
+        # Compressed size, so rotation follows what lands on disk
+        return self._raw.tell()
+
+    def _flush_handle(self):
+        # Sync flush makes everything so far decompressible even if we crash later
+        self._file.flush()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def _close_file(self):
+        self._file.close()
+        self._raw.close()
+
+
+class CSVSink(BaseSink):
+    """CSV sink (columns come from `fieldnames` or the first record)"""
+
+    def __init__(self, path: Union[str, Path], fieldnames: Optional[List[str]] = None, **kwargs):
+        """
+        Initialize CSV sink
+
+        Args:
+            path: Output file
+            fieldnames: Column names (default: keys of the first record; extra keys are dropped)
+            **kwargs: BaseSink options
+        """
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self._writer = None
+        super().__init__(path, **kwargs)
+
+    def _open_file(self, path: Path):
+        handle = open(path, "a", newline="", encoding="utf-8")
+        self._writer = None
+        self._needs_header = handle.tell() == 0
+        return handle
+
+    def _write_record(self, record: Dict[str, Any]):
+        if self._writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = list(record.keys())
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+            if self._needs_header:
+                self._writer.writeheader()
+        self._writer.writerow(record)
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """Render a value that does not fit its column as text"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+class _ParquetFile:
+    """Open Parquet output file (the writer is created once the schema is known)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.writer = None
+
+
+class ParquetSink(BaseSink):
+    """
+    Columnar Parquet sink (requires pyarrow)
+
+    Records are buffered into Arrow record batches and written as compressed row
+    groups. The schema is inferred from the first batch; new fields or values that
+    no longer fit a column start a new file with the widened schema, so a
+    directory of parts reads back as one dataset.
+    """
+
+    atomic = True
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        row_group_size: int = 50000,
+        compression: str = "zstd",
+        flush_interval: float = 60.0,
+        **kwargs
+    ):
+        """
+        Initialize Parquet sink
+
+        Args:
+            path: Output file
+            row_group_size: Records buffered per row group
+            compression: Parquet codec ('zstd', 'snappy', 'gzip', 'none')
+            flush_interval: Write a (smaller) row group at least every N seconds
+            **kwargs: BaseSink options
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet export (pip install ga-scrap[parquet])")
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.compression = compression
+        self.schema = None
+        self._buffer: List[Dict[str, Any]] = []
+        kwargs.setdefault("flush_every", row_group_size)
+        super().__init__(path, flush_interval=flush_interval, **kwargs)
+
+    def _open_file(self, path: Path):
+        return _ParquetFile(path)
+
+    def _write_record(self, record: Dict[str, Any]):
+        self._buffer.append(record)
+
+    def _bytes_written(self) -> int:
+        return self._file.path.stat().st_size if self._file.writer is not None else 0
+
+    def _column(self, name: str, values: List[Any], expected=None):
+        """Build one Arrow column, falling back to text for mixed values"""
+        pa = self._pa
+        if expected is not None and not pa.types.is_null(expected):
+            try:
+                return pa.array(values, type=expected)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                if pa.types.is_string(expected):
+                    return pa.array([_to_text(v) for v in values], type=pa.string())
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            return pa.array([_to_text(v) for v in values], type=pa.string())
+
+    def _to_table(self, records: List[Dict[str, Any]]):
+        """Convert buffered records to a table that follows (or widens) the schema"""
+        pa = self._pa
+        names = list(self.schema.names) if self.schema is not None else []
+        known = set(names)
+        for record in records:
+            for name in record:
+                if name not in known:
+                    known.add(name)
+                    names.append(name)
+
+        arrays = []
+        for name in names:
+            expected = None
+            if self.schema is not None and name in self.schema.names:
+                expected = self.schema.field(name).type
+            arrays.append(self._column(name, [record.get(name) for record in records], expected))
+
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def _flush_handle(self):
+        if not self._buffer:
+            return
+        table = self._to_table(self._buffer)
+        self._buffer = []
+
+        writer = self._file.writer
+        if writer is not None and not table.schema.equals(writer.schema):
+            # Schema evolved: finish this part and continue in a new one
+            self._seal_file()
+            self._open_next()
+            writer = None
+
+        if writer is None:
+            self.schema = table.schema
+            writer = self._pq.ParquetWriter(str(self._file.path), table.schema, compression=self.compression)
+            self._file.writer = writer
+
+        writer.write_table(table, row_group_size=len(table))
+
+    def _close_file(self):
+        if self._file.writer is not None:
+            self._file.writer.close()
+        else:
+            # Nothing was written - still leave a valid (empty) file behind
+            self._pq.write_table(self._pa.table({}), str(self._file.path))
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _to_sql_value(value: Any) -> Any:
+    """Convert a value to something SQLite can store"""
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+class SQLiteSink(BaseSink):
+    """
+    High-throughput SQLite sink
+
+    Records are inserted with executemany inside one transaction per batch on a
+    WAL-mode database. Columns are created from the record fields (new fields
+    add columns) and an optional natural key turns inserts into upserts.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        table: str = "records",
+        key: Union[str, List[str], None] = None,
+        flush_every: int = 5000,
+        flush_interval: float = 1.0,
+        synchronous: str = "NORMAL",
+        **kwargs
+    ):
+        """
+        Initialize SQLite sink
+
+        Args:
+            path: Database file
+            table: Table to write to (created if missing)
+            key: Natural key column(s); records with an existing key update that row
+            flush_every: Rows per transaction
+            flush_interval: Commit at least every N seconds while rows arrive
+            synchronous: SQLite synchronous mode ('OFF', 'NORMAL', 'FULL')
+            **kwargs: BaseSink options (rotation does not apply to databases)
+        """
+        self.table = table
+        self.key = [key] if isinstance(key, str) else list(key or [])
+        self.synchronous = synchronous
+        self.columns: List[str] = []
+        self._key_indexed = False
+        self._buffer: List[Dict[str, Any]] = []
+        self._statements: Dict[tuple, str] = {}
+        kwargs.pop("rotate_bytes", None)
+        kwargs.pop("rotate_records", None)
+        super().__init__(path, flush_every=flush_every, flush_interval=flush_interval, **kwargs)
+
+    def _open_file(self, path: Path):
+        conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA busy_timeout=30000")
+        self.columns = [row[1] for row in conn.execute(f"PRAGMA table_info({_quote(self.table)})")]
+        return conn
+
+    def _write_record(self, record: Dict[str, Any]):
+        self._buffer.append(record)
+
+    def _bytes_written(self) -> int:
+        return 0
+
+    def _ensure_columns(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create the table or add columns for new fields (inside the batch's transaction)
+
+        Returns:
+            The columns added; the cached schema is only updated once the batch commits
+        """
+        new = []
+        known = set(self.columns)
+        for column in self.key:
+            if column not in known:
+                known.add(column)
+                new.append(column)
+        for record in records:
+            for column in record:
+                if column not in known:
+                    known.add(column)
+                    new.append(column)
+
+        if new and not self.columns:
+            self._file.execute(
+                f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} ({', '.join(_quote(c) for c in new)})"
+            )
+        elif new:
+            for column in new:
+                self._file.execute(f"ALTER TABLE {_quote(self.table)} ADD COLUMN {_quote(column)}")
+
+        # Also for tables created earlier without the index, or ON CONFLICT fails
+        if self.key and not self._key_indexed:
+            self._file.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(f'ux_{self.table}_key')} "
+                f"ON {_quote(self.table)} ({', '.join(_quote(c) for c in self.key)})"
+            )
+        return new
+
+    def _insert_sql(self, columns: List[str]) -> str:
+        """Build (and cache) the insert or upsert statement for a column set"""
+        sql = self._statements.get(tuple(columns))
+        if sql is not None:
+            return sql
+
+        names = ", ".join(_quote(c) for c in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        sql = f"INSERT INTO {_quote(self.table)} ({names}) VALUES ({placeholders})"
+        if self.key:
+            conflict = ", ".join(_quote(c) for c in self.key)
+            updates = [c for c in columns if c not in self.key]
+            if updates:
+                assignments = ", ".join(f"{_quote(c)} = excluded.{_quote(c)}" for c in updates)
+                sql += f" ON CONFLICT ({conflict}) DO UPDATE SET {assignments}"
+            else:
+                sql += f" ON CONFLICT ({conflict}) DO NOTHING"
+
+        self._statements[tuple(columns)] = sql
+        return sql
+
+    def _flush_handle(self):
+        if not self._buffer:
+            return
+        records, self._buffer = self._buffer, []
+        conn = self._file
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            new = self._ensure_columns(records)
+            # Only write columns some record in this batch has, so upserts keep other values
+            present = set()
+            for record in records:
+                present.update(record)
+            columns = [c for c in self.columns + new if c in present or c in self.key]
+            conn.executemany(self._insert_sql(columns), [
+                [_to_sql_value(record.get(column)) for column in columns] for record in records
+            ])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.columns.extend(new)
+        self._key_indexed = bool(self.key)
+
+    def _close_file(self):
+        self._file.close()
+
+
+# Sink classes by file extension (longest match wins)
+SINK_TYPES = {
+    ".jsonl.gz": GzipNDJSONSink,
+    ".ndjson.gz": GzipNDJSONSink,
+    ".jsonl": NDJSONSink,
+    ".ndjson": NDJSONSink,
+    ".csv": CSVSink,
+    ".parquet": ParquetSink,
+    ".db": SQLiteSink,
+    ".sqlite": SQLiteSink,
+    ".sqlite3": SQLiteSink,
+}
+
+
+def open_sink(path: Union[str, Path], **kwargs) -> BaseSink:
+    """
+    Open a sink, picking the format from the file extension
+
+    Args:
+        path: Output file (.jsonl, .ndjson, .jsonl.gz, .csv, .parquet, .db/.sqlite)
+        **kwargs: Sink options
+
+    Returns:
+        Sink instance
+    """
+    name = str(path).lower()
+    for extension in sorted(SINK_TYPES, key=len, reverse=True):
+        if name.endswith(extension):
+            return SINK_TYPES[extension](path, **kwargs)
+    raise ValueError(f"Unsupported sink format: {path}")
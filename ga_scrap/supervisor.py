@@ -0,0 +1,145 @@
+"""
+GA-Scrap Supervisor Module
+Detects page crashes and browser disconnects, relaunches and resumes jobs
+"""
+
+from typing import Optional, Dict, Any, Callable
+
+
+# Error messages Playwright raises when the page, context or browser went away
+_FATAL_ERROR_MARKERS = (
+    "Target crashed",
+    "Target closed",
+    "Target page, context or browser has been closed",
+    "Browser has been closed",
+    "Browser closed",
+    "Connection closed",
+)
+
+
+class CrashRecoveryFeatures:
+    """Mixin class that supervises the browser and recovers from crashes"""
+
+    # ==================== CRASH RECOVERY ====================
+
+    def needs_recovery(self, error: Optional[BaseException] = None) -> bool:
+        """
+        Check whether the browser or main page is dead
+
+        Args:
+            error: Exception raised by the last operation (optional)
+
+        Returns:
+            True if recover() should be called before continuing
+        """
+        if self._page_crashed or self._browser_disconnected:
+            return True
+
+        if self.browser and not self.browser.is_connected():
+            return True
+
+        if self.page is not None and self.page.is_closed():
+            return True
+
+        if error is not None:
+            message = str(error)
+            return any(marker in message for marker in _FATAL_ERROR_MARKERS)
+
+        return False
+
+    async def snapshot_session(self) -> Optional[Dict[str, Any]]:
+        """
+        Remember the current storage state so it can be restored after a crash
+
+        Returns:
+            Storage state data or None if it could not be captured
+        """
+        if not self.context:
+            return None
+
+        try:
+            self._last_storage_state = await self.context.storage_state()
+        except Exception as e:
+            self.log(f"Could not snapshot storage state: {e}", "debug")
+
+        return self._last_storage_state
+
+    async def recover(self):
+        """
+        Relaunch the browser (after a disconnect) or the context (after a page crash),
+        restoring the last storage state snapshot, routes and listeners
+        """
+        if not self.playwright:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        browser_dead = self._browser_disconnected or not (self.browser and self.browser.is_connected())
+
+        if browser_dead and not self._owns_browser:
+            raise RuntimeError("Shared browser disconnected - its pool has to relaunch it")
+
+        if browser_dead:
+            self.log("🚑 Relaunching browser after disconnect...", "warning")
+            try:
+                if self.browser:
+                    await self.browser.close()
+            except Exception:
+                pass
+            await self._launch_browser()
+            storage_state = self._last_storage_state
+        else:
+            self.log("🚑 Recreating context after page crash...", "warning")
+            storage_state = await self.snapshot_session()
+            try:
+                await self.context.close()
+            except Exception as e:
+                self.log(f"⚠️ Error closing crashed context: {e}", "debug")
+
+        self.pages = []
+        await self._create_context(storage_state=storage_state)
+        self._browser_disconnected = False
+        self.recovery_count += 1
+
+        self.log(f"✅ Recovered (total recoveries: {self.recovery_count})", "success")
+
+    async def run_supervised(self, job: Callable, *args, max_restarts: int = 3,
+                             snapshot: bool = True, **kwargs) -> Any:
+        """
+        Run a job, recovering and re-running it if the page crashes or the browser dies
+
+        Args:
+            job: Async callable invoked as job(scraper, *args, **kwargs)
+            *args: Positional arguments for the job
+            max_restarts: Maximum number of recoveries for this job
+            snapshot: Snapshot storage state after the job succeeds
+            **kwargs: Keyword arguments for the job
+
+        Returns:
+            Result of the job
+        """
+        restarts = 0
+
+        while True:
+            error = None
+            try:
+                result = await job(self, *args, **kwargs)
+            except Exception as e:
+                error = e
+                result = None
+
+            # Sandbox mode swallows errors, so check the browser even when the job returned
+            if not self.needs_recovery(error):
+                if error is not None:
+                    raise error
+                if snapshot:
+                    await self.snapshot_session()
+                return result
+
+            if restarts >= max_restarts:
+                self.log(f"❌ Giving up after {restarts} recoveries", "error")
+                if error is not None:
+                    raise error
+                raise RuntimeError("Browser crashed repeatedly while running job")
+
+            restarts += 1
+            self.log(f"🔁 Re-queuing job after crash (attempt {restarts}/{max_restarts})", "warning")
+            await self.recover()
@@ -0,0 +1,168 @@
+"""
+GA-Scrap Tables Module
+Read whole HTML tables in a single browser call
+"""
+
+from typing import Optional, Dict, Any, List, Union
+from playwright.async_api import Page, Locator
+
+
+# Builds a rectangular cell grid per table (colspan/rowspan expanded) in the
+# page, so a table costs one round trip instead of one per row and cell
+_TABLES_JS = """
+(tables, options) => tables.slice(0, options.limit == null ? tables.length : options.limit).map(table => {
+    const rows = Array.from(table.rows);
+    const grid = [];
+    const headerFlags = [];
+
+    rows.forEach((row, r) => {
+        grid[r] = grid[r] || [];
+        let c = 0;
+        for (const cell of row.cells) {
+            while (grid[r][c] !== undefined) c++;
+            const text = (cell.innerText || '').trim();
+            const colspan = Math.max(1, cell.colSpan || 1);
+            const rowspan = cell.rowSpan === 0 ? rows.length - r : Math.max(1, cell.rowSpan || 1);
+            for (let dr = 0; dr < rowspan && r + dr < rows.length; dr++) {
+                const target = grid[r + dr] = grid[r + dr] || [];
+                for (let dc = 0; dc < colspan; dc++) target[c + dc] = text;
+            }
+            c += colspan;
+        }
+        const cells = Array.from(row.cells);
+        headerFlags[r] = row.parentElement.tagName === 'THEAD'
+            || (cells.length > 0 && cells.every(cell => cell.tagName === 'TH'));
+    });
+
+    let headerCount = options.headerRows;
+    if (headerCount == null) {
+        headerCount = 0;
+        while (headerCount < rows.length && headerFlags[headerCount]) headerCount++;
+        // No <thead> or all-<th> row: treat the first row as the header, like before
+        if (headerCount === 0 && rows.length > 1) headerCount = 1;
+    }
+
+    const width = grid.reduce((max, row) => Math.max(max, row.length), 0);
+    const filled = grid.map(row => Array.from({length: width}, (_, i) => row[i] === undefined ? '' : row[i]));
+    return {header: filled.slice(0, headerCount), body: filled.slice(headerCount)};
+})
+"""
+
+ORIENTS = ("records", "columns", "rows")
+
+
+def _column_names(header: List[List[str]], width: int) -> List[str]:
+    """Combine (possibly stacked) header rows into unique column names"""
+    names = []
+    seen: Dict[str, int] = {}
+    for column in range(width):
+        parts = []
+        for row in header:
+            text = row[column]
+            if text and (not parts or parts[-1] != text):
+                parts.append(text)
+        name = " ".join(parts) or f"column_{column + 1}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 1
+        names.append(name)
+    return names
+
+
+def _shape(table: Dict[str, List[List[str]]], orient: str) -> Union[List[Dict[str, str]], Dict[str, List[str]], Dict[str, Any]]:
+    """Turn a raw header/body grid into records, column arrays or headers + rows"""
+    width = len((table["header"] or table["body"] or [[]])[0])
+    headers = _column_names(table["header"], width)
+    # Spacer rows carry no data
+    body = [row for row in table["body"] if any(row)]
+
+    if orient == "columns":
+        return {name: [row[i] for row in body] for i, name in enumerate(headers)}
+    if orient == "rows":
+        return {"headers": headers, "rows": body}
+    return [dict(zip(headers, row)) for row in body]
+
+
+async def read_tables(
+    target: Union[Page, Locator],
+    selector: str = "table",
+    orient: str = "records",
+    header_rows: Optional[int] = None,
+    limit: Optional[int] = None
+) -> List[Any]:
+    """
+    Read every table matching a selector in one browser call
+
+    Args:
+        target: Page, frame or locator to search in
+        selector: Selector of the <table> elements
+        orient: 'records' (list of dicts), 'columns' (dict of column arrays) or
+                'rows' ({'headers', 'rows'})
+        header_rows: Number of header rows (default: detect <thead> / all-<th> rows,
+                     else use the first row)
+        limit: Maximum number of tables
+
+    Returns:
+        One entry per table in the chosen orientation
+    """
+    if orient not in ORIENTS:
+        raise ValueError(f"Unsupported orient: {orient} (use one of {', '.join(ORIENTS)})")
+    tables = await target.locator(selector).evaluate_all(
+        _TABLES_JS, {"headerRows": header_rows, "limit": limit}
+    )
+    return [_shape(table, orient) for table in tables]
+
+
+class TableFeatures:
+    """Mixin class for single-call table extraction"""
+
+    # ==================== TABLE EXTRACTION ====================
+
+    async def extract_tables(self, selector: str = "table", page: Optional[Page] = None,
+                             orient: str = "records", header_rows: Optional[int] = None,
+                             limit: Optional[int] = None) -> List[Any]:
+        """
+        Extract every table matching a selector in one browser call
+
+        Colspan and rowspan cells are repeated over the columns and rows they
+        cover, stacked header rows are joined into one name per column.
+
+        Args:
+            selector: Selector of the <table> elements
+            page: Page to use (default: main page)
+            orient: 'records' (list of dicts), 'columns' (dict of column arrays) or
+                    'rows' ({'headers', 'rows'})
+            header_rows: Number of header rows (default: auto-detect)
+            limit: Maximum number of tables
+
+        Returns:
+            One entry per table in the chosen orientation
+        """
+        try:
+            return await read_tables(page or self.page, selector, orient, header_rows, limit)
+        except ValueError:
+            raise
+        except Exception as e:
+            self.log(f"Could not extract tables '{selector}': {e}", "warning")
+            return []
+
+    async def extract_table(self, selector: str = "table", page: Optional[Page] = None,
+                            orient: str = "records", header_rows: Optional[int] = None) -> Any:
+        """
+        Extract the first table matching a selector in one browser call
+
+        Args:
+            selector: Selector of the <table> element
+            page: Page to use (default: main page)
+            orient: 'records', 'columns' or 'rows' (see extract_tables())
+            header_rows: Number of header rows (default: auto-detect)
+
+        Returns:
+            The table in the chosen orientation (empty if no table matched)
+        """
+        tables = await self.extract_tables(selector, page, orient, header_rows, limit=1)
+        if tables:
+            return tables[0]
+        return {} if orient != "records" else []
@@ -26,6 +26,27 @@ class SyncGAScrap:
         self._loop = None
         self._thread = None
         self._started = False
+        self._attached = False
+    
+    @classmethod
+    def wrap(cls, scraper: GAScrap, loop: asyncio.AbstractEventLoop) -> 'SyncGAScrap':
+        """
+        Wrap a started GAScrap whose event loop runs in another thread
+        
+        Args:
+            scraper: Started GAScrap (stays running when the wrapper is stopped)
+            loop: Event loop the scraper runs on
+        
+        Returns:
+            Synchronous wrapper (call it from a thread other than the loop's)
+        """
+        wrapper = cls.__new__(cls)
+        wrapper._scraper = scraper
+        wrapper._loop = loop
+        wrapper._thread = None
+        wrapper._started = True
+        wrapper._attached = True
+        return wrapper
     
     def _ensure_loop(self):
         """Ensure event loop is running in background thread"""
@@ -69,6 +90,10 @@ class SyncGAScrap:
     
     def stop(self):
         """Stop the browser"""
+        if self._attached:
+            # The wrapped scraper belongs to someone else
+            self._started = False
+            return
         if self._started:
             try:
                 self._run_async(self._scraper.stop())
@@ -98,6 +123,34 @@ class SyncGAScrap:
         self._run_async(self._scraper.screenshot(filename, page, **options))
         return self  # Return self for chaining
     
+    def configure_screenshots(self, **settings):
+        """Configure the non-blocking screenshot pipeline (format, quality, thumbnail, dedupe)"""
+        self._run_async(self._scraper.configure_screenshots(**settings))
+        return self
+    
+    def capture_screenshot(self, name: str = None, page=None, **options) -> Optional[str]:
+        """Capture a screenshot; encoding and writing happen in the background"""
+        return self._run_async(self._scraper.capture_screenshot(name, page, **options))
+    
+    def flush_screenshots(self):
+        """Wait until all queued screenshots are written"""
+        self._run_async(self._scraper.flush_screenshots())
+        return self
+    
+    def get_locator_cache_stats(self) -> Dict[str, Any]:
+        """Get locator cache hits, misses and hit rate"""
+        return self._scraper.get_locator_cache_stats()
+
+    def capture_responses(self, url=None, **options):
+        """Start capturing JSON responses (callbacks run on the browser thread)"""
+        async def _capture():
+            return self._scraper.capture_responses(url, **options)
+        return self._run_async(_capture())
+
+    def stop_capture(self, capture) -> Dict[str, int]:
+        """Stop a response capture once its pending responses are delivered"""
+        return self._run_async(self._scraper.stop_capture(capture))
+
     def new_page(self):
         """Create a new page"""
         return self._run_async(self._scraper.new_page())
@@ -204,6 +257,14 @@ class SyncGAScrap:
         """Save page as PDF"""
         return self._run_async(self._scraper.save_page_as_pdf(filename, options, page))
     
+    def download_files(self, items: List[Union[str, Dict[str, Any]]], concurrency: int = 4, **options) -> List[Dict[str, Any]]:
+        """Download many files in parallel with resume and checksums"""
+        return self._run_async(self._scraper.download_files(items, concurrency, **options))
+    
+    def save_pdfs(self, urls: List[str], concurrency: int = 4, options: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
+        """Render many URLs to PDF concurrently"""
+        return self._run_async(self._scraper.save_pdfs(urls, concurrency, options, **kwargs))
+    
     def execute_script(self, script: str, *args, page=None):
         """Execute JavaScript"""
         return self._run_async(self._scraper.execute_script(script, *args, page))
@@ -237,6 +298,16 @@ class SyncGAScrap:
         self._run_async(self._scraper.emulate_device(device_name))
         return self
     
+    def recycle_context(self, restore_url: bool = True):
+        """Recreate the browser context, keeping storage state and routes"""
+        self._run_async(self._scraper.recycle_context(restore_url))
+        return self
+
+    def recover(self):
+        """Relaunch the browser or context after a crash"""
+        self._run_async(self._scraper.recover())
+        return self
+
     def block_requests(self, resource_types: List[str] = None, url_patterns: List[str] = None):
         """Block requests"""
         self._run_async(self._scraper.block_requests(resource_types, url_patterns))
@@ -0,0 +1,380 @@
+"""
+GA-Scrap Workers Module
+Crawl across CPU cores with one browser per worker process
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import multiprocessing.connection
+import os
+import queue
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List, Callable, Iterable, Iterator, Tuple
+from colorama import Fore, Style
+from .core import GAScrap
+
+
+def _worker_main(worker_id: int, factory: Callable, settings: Dict[str, Any], tasks, results):
+    """Entry point of a worker process"""
+    try:
+        asyncio.run(_worker_loop(worker_id, factory, settings, tasks, results))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        results.close()
+
+
+async def _worker_loop(worker_id: int, factory: Callable, settings: Dict[str, Any], tasks, results):
+    """Take chunks from this worker's queue and crawl them with its browser"""
+    scraper = factory(**settings)
+    try:
+        await scraper.start()
+    except Exception as e:
+        results.send(("failed", worker_id, None, f"worker {worker_id}: {e}"))
+        return
+
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            task = await loop.run_in_executor(None, tasks.get)
+            if task is None:
+                break
+
+            chunk_id, items, handler, crawl_options = task
+            positions = {url: index for index, url in items}
+
+            def send(result: Dict[str, Any]):
+                result["worker"] = worker_id
+                results.send(("result", worker_id, chunk_id, (positions[result["url"]], result)))
+
+            await scraper.crawl(
+                [url for _, url in items], handler=handler, on_result=send, **crawl_options
+            )
+    finally:
+        await scraper.stop()
+
+
+class WorkerPool:
+    """
+    Pool of worker processes, each running its own event loop and browser
+
+    Features:
+    - Spreads event handling and extraction over CPU cores instead of one Python thread
+    - Workers get small chunks of URLs a few at a time and are topped up as their
+      chunks finish, so a fast worker simply takes more chunks while a slow one is
+      still busy (no static partitioning)
+    - Results come back in input order or are streamed as soon as they are ready
+    - Chunks held by a worker that dies are handed to the remaining workers
+
+    Handlers are sent to the workers by reference, so they must be module-level
+    functions (the usual multiprocessing rule); each worker runs them through
+    GAScrap.crawl(), with per-host limits applying within that worker.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        concurrency: int = 4,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 2,
+        headless: bool = True,
+        browser_type: str = "chromium",
+        profile: str = None,
+        scraper_factory: Callable = None,
+        **scraper_options
+    ):
+        """
+        Initialize worker pool
+
+        Args:
+            workers: Worker processes (default: CPU count)
+            concurrency: Pages crawling at once in each worker
+            chunk_size: URLs a worker takes from the queue at a time (default: 2 x concurrency)
+            prefetch: Chunks handed to each worker at a time
+            headless: Run the workers' browsers in headless mode
+            browser_type: Browser type ('chromium', 'firefox', 'webkit')
+            profile: Performance profile for the workers' browsers
+            scraper_factory: Callable building each worker's scraper from the settings (default: GAScrap)
+            **scraper_options: Further GAScrap options (launch_args, block_resources, timeout, ...)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size or concurrency * 2
+        self.prefetch = prefetch
+        self.scraper_factory = scraper_factory or GAScrap
+        self.settings = {"headless": headless, "browser_type": browser_type, "profile": profile,
+                         "debug": False, **scraper_options}
+
+        self.stats = {"results": 0, "failed": 0, "requeued": 0, "elapsed": 0.0}
+        self.errors: List[str] = []
+
+        # Playwright and asyncio are not fork-safe, so workers are always spawned
+        self._mp = multiprocessing.get_context("spawn")
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._dead = set()
+        # One task queue per worker, so the parent always knows which worker holds a chunk
+        self._queues: Dict[int, Any] = {}
+        self._connections: Dict[int, multiprocessing.connection.Connection] = {}
+        self._chunk_ids = itertools.count()
+
+    def _log(self, message: str, level: str = "info"):
+        """Log message with color coding"""
+        colors = {
+            'info': Fore.CYAN,
+            'warning': Fore.YELLOW,
+            'error': Fore.RED,
+            'success': Fore.GREEN,
+            'debug': Fore.MAGENTA
+        }
+        color = colors.get(level, Fore.WHITE)
+        print(f"{color}[Worker Pool] {message}{Style.RESET_ALL}")
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> "WorkerPool":
+        """Spawn the worker processes (each launches its browser once)"""
+        if self._processes:
+            return self
+
+        self._dead = set()
+        for worker_id in range(self.workers):
+            self._queues[worker_id] = self._mp.Queue()
+            # One result pipe per worker: sends are unbuffered and a dead worker shows up as EOF
+            reader, writer = self._mp.Pipe(duplex=False)
+            process = self._mp.Process(
+                target=_worker_main,
+                args=(worker_id, self.scraper_factory, self.settings, self._queues[worker_id], writer),
+                name=f"ga-scrap-worker-{worker_id}",
+                daemon=True
+            )
+            process.start()
+            writer.close()
+            self._processes.append(process)
+            self._connections[worker_id] = reader
+
+        self._log(f"🚀 Started {self.workers} workers x {self.concurrency} pages", "info")
+        return self
+
+    def close(self, timeout: float = 10.0):
+        """
+        Stop the workers after their current chunk
+
+        Args:
+            timeout: Seconds to wait before remaining workers are terminated
+        """
+        if not self._processes:
+            return
+
+        # Chunks nobody has taken yet are dropped
+        for tasks in self._queues.values():
+            try:
+                while True:
+                    tasks.get_nowait()
+            except queue.Empty:
+                pass
+            tasks.put(None)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and any(p.is_alive() for p in self._processes):
+            # Keep the result pipes drained so no worker blocks on a full pipe
+            self._receive(0.05)
+
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        for connection in self._connections.values():
+            connection.close()
+        for tasks in self._queues.values():
+            tasks.close()
+        self._processes = []
+        self._connections = {}
+        self._queues = {}
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    # ==================== DISTRIBUTION ====================
+
+    def _chunks(self, urls: Iterable[str]) -> Iterator[List[Tuple[int, str]]]:
+        """Split URLs into (index, url) chunks; a chunk never holds the same URL twice"""
+        items: List[Tuple[int, str]] = []
+        seen = set()
+        for index, url in enumerate(urls):
+            if len(items) >= self.chunk_size or url in seen:
+                yield items
+                items, seen = [], set()
+            items.append((index, url))
+            seen.add(url)
+        if items:
+            yield items
+
+    def _receive(self, timeout: float) -> List[tuple]:
+        """Wait for worker messages (or worker exits) and read everything available"""
+        waitables = list(self._connections.values()) + [
+            process.sentinel for worker_id, process in enumerate(self._processes) if worker_id not in self._dead
+        ]
+        multiprocessing.connection.wait(waitables, timeout)
+
+        messages = []
+        for worker_id, connection in list(self._connections.items()):
+            try:
+                while connection.poll():
+                    messages.append(connection.recv())
+            except (EOFError, OSError):
+                # The worker is gone and everything it sent has been read
+                connection.close()
+                del self._connections[worker_id]
+        return messages
+
+    def _idlest_worker(self, assigned: Dict[int, int]) -> Optional[int]:
+        """Live worker holding the fewest chunks, if one has room for another"""
+        load = {worker_id: 0 for worker_id in range(len(self._processes)) if worker_id not in self._dead}
+        for worker_id in assigned.values():
+            if worker_id in load:
+                load[worker_id] += 1
+        candidates = [worker_id for worker_id, held in load.items() if held < self.prefetch]
+        return min(candidates, key=load.get, default=None)
+
+    def _check_workers(self, pending: Dict[int, Dict[int, str]], assigned: Dict[int, int], waiting: deque):
+        """Queue the chunks of workers that died for the others"""
+        for worker_id, process in enumerate(self._processes):
+            if worker_id in self._dead or process.is_alive():
+                continue
+            self._dead.add(worker_id)
+            # Every chunk sent to the worker counts, whether or not it had started on it
+            lost = [chunk_id for chunk_id, owner in assigned.items() if owner == worker_id]
+            if process.exitcode:
+                self._log(f"⚠️ Worker {worker_id} exited with code {process.exitcode}", "warning")
+            for chunk_id in lost:
+                del assigned[chunk_id]
+                if chunk_id in pending:
+                    waiting.append(chunk_id)
+                    self.stats["requeued"] += 1
+
+        if len(self._dead) == len(self._processes):
+            details = "; ".join(self.errors) or "no error reported"
+            raise RuntimeError(f"All worker processes exited ({details})")
+
+    def imap(
+        self,
+        urls: Iterable[str],
+        handler: Callable = None,
+        ordered: bool = True,
+        **crawl_options
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Crawl URLs over the worker processes and stream the results
+
+        Args:
+            urls: URLs to crawl (consumed lazily)
+            handler: Module-level async function handler(page, url) returning the extracted data
+            ordered: Yield results in input order; False yields them as they finish
+            **crawl_options: Further crawl() options (rate_per_host, max_per_host, max_retries)
+
+        Returns:
+            Iterator of results {'url', 'data', 'error', 'attempts', 'worker'}
+        """
+        started_here = not self._processes
+        self.start()
+        crawl_options = {"concurrency": self.concurrency, **crawl_options}
+        task_args = (handler, crawl_options)
+
+        chunks = self._chunks(urls)
+        pending: Dict[int, Dict[int, str]] = {}
+        assigned: Dict[int, int] = {}
+        waiting: deque = deque()
+        buffered: Dict[int, Dict[str, Any]] = {}
+        next_index = 0
+        exhausted = False
+        started_at = time.time()
+        produced = 0
+
+        def feed():
+            nonlocal exhausted
+            while waiting or not exhausted:
+                worker_id = self._idlest_worker(assigned)
+                if worker_id is None:
+                    break
+                if waiting:
+                    # Chunks of a dead worker go out first, with only their unfinished URLs
+                    chunk_id = waiting.popleft()
+                else:
+                    items = next(chunks, None)
+                    if items is None:
+                        exhausted = True
+                        break
+                    chunk_id = next(self._chunk_ids)
+                    pending[chunk_id] = dict(items)
+                assigned[chunk_id] = worker_id
+                self._queues[worker_id].put((chunk_id, list(pending[chunk_id].items())) + task_args)
+
+        try:
+            feed()
+            while pending:
+                for kind, worker_id, chunk_id, payload in self._receive(0.5):
+                    if kind == "failed":
+                        self.errors.append(payload)
+                        self._log(f"❌ {payload}", "error")
+                        continue
+
+                    index, result = payload
+                    remaining = pending.get(chunk_id)
+                    if remaining is None or index not in remaining:
+                        # Late result of a chunk that was already handed to another worker
+                        continue
+                    del remaining[index]
+                    if not remaining:
+                        del pending[chunk_id]
+                        assigned.pop(chunk_id, None)
+                        feed()
+
+                    produced += 1
+                    self.stats["results"] += 1
+                    if result["error"]:
+                        self.stats["failed"] += 1
+
+                    if not ordered:
+                        yield result
+                        continue
+                    buffered[index] = result
+                    while next_index in buffered:
+                        yield buffered.pop(next_index)
+                        next_index += 1
+
+                # Messages of a dead worker are read before its chunks are requeued
+                self._check_workers(pending, assigned, waiting)
+                feed()
+        finally:
+            elapsed = max(time.time() - started_at, 1e-6)
+            self.stats["elapsed"] += elapsed
+            if started_here:
+                self.close()
+
+        self._log(
+            f"📊 {produced} results from {self.workers} workers in {elapsed:.1f}s "
+            f"({produced / elapsed:.2f} pages/s)",
+            "success"
+        )
+
+    def map(self, urls: Iterable[str], handler: Callable = None, **crawl_options) -> List[Dict[str, Any]]:
+        """
+        Crawl URLs over the worker processes and collect the results in input order
+
+        Args:
+            urls: URLs to crawl
+            handler: Module-level async function handler(page, url) returning the extracted data
+            **crawl_options: Further crawl() options (rate_per_host, max_per_host, max_retries)
+
+        Returns:
+            List of results {'url', 'data', 'error', 'attempts', 'worker'}
+        """
+        return list(self.imap(urls, handler, ordered=True, **crawl_options))
@@ -61,6 +61,9 @@ setup(
         "colorama>=0.4.6",
         "pyyaml>=6.0",
     ],
+    extras_require={
+        "parquet": ["pyarrow>=10.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "ga-scrap=ga_scrap.cli:main",
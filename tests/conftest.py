@@ -0,0 +1,36 @@
+"""
+Shared test fixtures
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def run_in_browser():
+    """
+    Run a check against real HTML in headless Chromium
+
+    Usage: run_in_browser(html, check) where check is an async function
+    check(page) whose result is returned. Skips when Chromium is not installed.
+    """
+    def run(html, check):
+        from playwright.async_api import async_playwright
+
+        async def main():
+            async with async_playwright() as playwright:
+                try:
+                    browser = await playwright.chromium.launch(headless=True)
+                except Exception as e:
+                    pytest.skip(f"Chromium is not available: {e}")
+                try:
+                    page = await browser.new_page()
+                    await page.set_content(html)
+                    return await check(page)
+                finally:
+                    await browser.close()
+
+        return asyncio.run(main())
+
+    return run
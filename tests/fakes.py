@@ -0,0 +1,144 @@
+"""
+Shared stand-ins for pages, locators, scrapers and browser pools (no browser required)
+
+Plain module-level classes, so they also pickle into spawned worker processes.
+"""
+
+import inspect
+from pathlib import Path
+from types import SimpleNamespace
+
+
+class FakeLocator:
+    """Locator stand-in reading the texts and evaluate_all() rows prepared on its page"""
+
+    def __init__(self, page, selector, description=None, texts=None):
+        self.page = page
+        self.selector = selector
+        self.description = description or f"css={selector}"
+        self.texts = page.texts.get(selector, []) if texts is None else texts
+        self.clicks = 0
+
+    @property
+    def first(self):
+        return FakeLocator(self.page, self.selector, self.description + ".first", self.texts[:1])
+
+    async def click(self, **options):
+        self.clicks += 1
+
+    async def all_inner_texts(self):
+        return list(self.texts)
+
+    async def evaluate_all(self, expression, arg=None):
+        self.page.evaluations.append((self.selector, expression, arg))
+        rows = self.page.rows.get(self.selector, [])
+        limit = (arg or {}).get("limit")
+        return rows[:limit] if limit is not None else rows
+
+
+class FakeHandle:
+    """Element handle stand-in that records its disposal"""
+
+    def __init__(self):
+        self.disposed = False
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class FakePage:
+    """
+    Page stand-in
+
+    Args:
+        texts: Inner texts per selector, for locators and query_selector_all()
+        rows: evaluate_all() results per selector
+        frames: Child frames; the first one is the main frame
+        screenshots: Screenshot bytes returned one per screenshot() call
+    """
+
+    def __init__(self, texts=None, rows=None, frames=None, screenshots=None):
+        self.texts = texts or {}
+        self.rows = rows or {}
+        self.frames = list(frames or [])
+        self.main_frame = self.frames[0] if self.frames else object()
+        self.screenshots = list(screenshots or [])
+
+        self.listeners = {}
+        self.evaluations = []
+        self.screenshot_options = []
+        self.built = 0
+        self.handle_queries = 0
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def emit(self, event, *args):
+        for handler in self.listeners.get(event, []):
+            handler(*args)
+
+    def locator(self, selector, **options):
+        self.built += 1
+        return FakeLocator(self, selector)
+
+    def get_by_role(self, role, **options):
+        self.built += 1
+        return FakeLocator(self, role, f"role={role} {options}")
+
+    async def query_selector_all(self, selector):
+        self.handle_queries += 1
+        return [FakeHandle() for _ in self.texts.get(selector, [])]
+
+    async def screenshot(self, **options):
+        self.screenshot_options.append(options)
+        return self.screenshots.pop(0)
+
+    async def pdf(self, path, **options):
+        Path(path).write_bytes(b"%PDF-1.4 " + options["format"].encode())
+
+
+class FakeScraper:
+    """Scraper stand-in whose crawl() just calls the handler"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+    async def crawl(self, urls, handler=None, on_result=None, **options):
+        for url in urls:
+            try:
+                data, error = await handler(None, url), None
+            except Exception as e:
+                data, error = None, str(e)
+            delivered = on_result({"url": url, "data": data, "error": error, "attempts": 1})
+            if inspect.isawaitable(delivered):
+                await delivered
+
+
+class FakePool:
+    """Browser pool stand-in that hands out placeholder scrapers"""
+
+    size = 1
+
+    def __init__(self):
+        self.acquired = []
+        self.released = []
+
+    async def start(self):
+        return self
+
+    async def acquire(self, **options):
+        scraper = SimpleNamespace(options=options)
+        self.acquired.append(scraper)
+        return scraper
+
+    async def release(self, scraper):
+        self.released.append(scraper)
+
+    async def close(self):
+        pass
@@ -0,0 +1,150 @@
+"""
+Test hosting several apps in one process (no browser required)
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+from ga_scrap import AppHost, GAScrap
+from ga_scrap.politeness import PolitenessScheduler
+
+from fakes import FakePool
+
+
+def _make_app(workspace: Path, name: str, body: str, config: str = None) -> Path:
+    """Create an app directory with its own utils module"""
+    app_dir = workspace / name
+    app_dir.mkdir()
+    (app_dir / "utils.py").write_text(f"NAME = {name!r}\n")
+    (app_dir / "main.py").write_text(body)
+    if config:
+        (app_dir / "config.yaml").write_text(config)
+    return app_dir
+
+
+def test_apps_share_pool_with_isolated_modules():
+    """Each app sees its own utils module and gets its own scraper with its quota"""
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Path(tmp)
+        body = (
+            "import utils\n"
+            "runs = []\n\n"
+            "async def run(scraper):\n"
+            "    runs.append((utils.NAME, scraper.scraper.options))\n"
+        )
+        news = _make_app(workspace, "news", body, "host:\n  concurrency: 3\nbrowser:\n  timeout: 5000\n")
+        shop = _make_app(workspace, "shop", body)
+        broken = _make_app(workspace, "broken", "import utils\n")
+
+        pool = FakePool()
+        host = AppHost([news, shop, broken], pool=pool, quotas={"shop": 5})
+        results = asyncio.run(host.run())
+
+        by_app = {result["app"]: result for result in results}
+        assert by_app["news"]["ok"] and by_app["shop"]["ok"]
+        assert not by_app["broken"]["ok"] and "run(scraper)" in by_app["broken"]["error"]
+
+        runs = {app.name: app.module.runs for app in host.apps}
+        assert runs["news"] == [("news", {"max_concurrency": 3, "timeout": 5000})]
+        assert runs["shop"] == [("shop", {"max_concurrency": 5})]
+        assert len(pool.released) == len(pool.acquired) == 2
+
+
+def test_failing_app_does_not_stop_others():
+    """An exception in one app is reported and its context is still released"""
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Path(tmp)
+        failing = _make_app(workspace, "failing", "async def run(scraper):\n    raise ValueError('boom')\n")
+        working = _make_app(workspace, "working", "async def run(scraper):\n    return 1\n")
+
+        pool = FakePool()
+        results = asyncio.run(AppHost([failing, working], pool=pool, max_apps=1).run())
+
+        assert [(r["app"], r["ok"], r["error"]) for r in results] == [
+            ("failing", False, "boom"), ("working", True, None)
+        ]
+        assert len(pool.released) == 2
+
+
+def test_rounds_keep_only_the_latest_results_and_lazy_imports_work():
+    """Repeated rounds do not pile up results; run() may import the app's modules lazily"""
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Path(tmp)
+        lazy = _make_app(workspace, "lazy", "async def run(scraper):\n    import helpers\n    helpers.CALLS.append(1)\n")
+        (lazy / "helpers.py").write_text("CALLS = []\n")
+
+        async def scenario():
+            host = AppHost([lazy], pool=FakePool(), interval=0.01)
+            task = asyncio.create_task(host.run())
+            while host.stats["lazy"]["runs"] < 3:
+                await asyncio.sleep(0.01)
+            host.stop()
+            return host, await task
+
+        host, results = asyncio.run(scenario())
+
+        assert [(r["app"], r["ok"], r["error"]) for r in results] == [("lazy", True, None)]
+        assert host.stats["lazy"]["runs"] >= 3 and host.stats["lazy"]["failed"] == 0
+        assert str(lazy) not in sys.path
+
+
+class FakeQuotaPage:
+    def __init__(self, context=None):
+        self.context = context
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeQuotaContext:
+    async def cookies(self):
+        return []
+
+    async def new_page(self):
+        return FakeQuotaPage(self)
+
+
+def test_quota_caps_pages_downloads_and_schedulers():
+    """max_concurrency limits new_page(), download managers and crawl workers"""
+    async def run(tmp):
+        scraper = GAScrap(headless=True, downloads_path=tmp, max_concurrency=2, user_agent="test")
+        scraper.context = FakeQuotaContext()
+        scraper.page = await scraper.context.new_page()
+        scraper.pages.append(scraper.page)
+
+        first = await scraper.new_page()
+        await scraper.new_page()
+        try:
+            await scraper.new_page()
+            raise AssertionError("third page allowed")
+        except RuntimeError as e:
+            assert "quota" in str(e)
+        await first.close()
+        await scraper.new_page()
+
+        manager = await scraper.create_download_manager(concurrency=8)
+        manager.close()
+
+        worker_pages = []
+
+        async def worker_page():
+            worker_pages.append(FakeQuotaPage(scraper.context))
+            return worker_pages[-1]
+
+        scraper._new_worker_page = worker_page
+        scheduler = PolitenessScheduler(max_concurrency=10)
+        await scraper.crawl([], scheduler=scheduler, concurrency=6)
+        return manager, scheduler, worker_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager, scheduler, worker_pages = asyncio.run(run(tmp))
+
+    assert manager.concurrency == 2
+    # The caller's scheduler is not changed; the quota caps the workers using it
+    assert len(worker_pages) == 2 and scheduler.max_concurrency == 10
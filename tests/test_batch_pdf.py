@@ -0,0 +1,34 @@
+"""
+Test batch PDF rendering bookkeeping (no browser required)
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from ga_scrap import GAScrap
+
+from fakes import FakePage
+
+
+def test_save_pdfs_renders_and_skips_existing():
+    """New URLs are rendered through crawl(), already rendered ones are skipped"""
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = GAScrap(headless=True, downloads_path=tmp)
+        urls = ["https://a.example/1", "https://a.example/2", "https://b.example/1"]
+        (Path(tmp) / scraper._pdf_filename(urls[0])).write_bytes(b"%PDF existing")
+        crawled = []
+
+        async def fake_crawl(pending, handler, on_result, **kwargs):
+            for url in pending:
+                crawled.append(url)
+                path = await handler(FakePage(), url)
+                await on_result({"url": url, "data": path, "error": None, "attempts": 1})
+
+        scraper.crawl = fake_crawl
+        summary = asyncio.run(scraper.save_pdfs(urls, options={"format": "Letter"}))
+
+        assert crawled == urls[1:]
+        assert summary["saved"] == 2 and summary["skipped"] == 1 and summary["failed"] == []
+        assert (Path(tmp) / scraper._pdf_filename(urls[2])).read_bytes() == b"%PDF-1.4 Letter"
+        assert not list(Path(tmp).glob("*.part"))
@@ -0,0 +1,67 @@
+"""
+Test bulk attribute and style extraction (fake page, no browser required)
+"""
+
+import asyncio
+
+from ga_scrap import GAScrap
+
+from fakes import FakePage
+
+
+def test_selector_and_whitelist_are_arguments():
+    """One call per selector; the script source never contains the selector"""
+    selector = "a[title='it\\'s']"
+    scraper = GAScrap(headless=True)
+    scraper.page = FakePage(rows={selector: [{"href": "/1"}, {"href": "/2"}]})
+
+    links = asyncio.run(scraper.get_elements_attributes(selector, ["href"]))
+    styles = asyncio.run(scraper.get_elements_styles(selector, ["color"], limit=5))
+
+    assert links == [{"href": "/1"}, {"href": "/2"}]
+    assert len(styles) == 2
+    (sel1, source1, arg1), (sel2, source2, arg2) = scraper.page.evaluations
+    assert sel1 == sel2 == selector
+    assert selector not in source1 and selector not in source2
+    assert arg1 == {"names": ["href"], "limit": None}
+    assert arg2 == {"names": ["color"], "limit": 5}
+
+
+def test_single_element_helpers_use_the_first_match():
+    """get_element_attributes() returns the first match or an empty dict"""
+    scraper = GAScrap(headless=True)
+    scraper.page = FakePage(rows={"img": [{"src": "a.png"}, {"src": "b.png"}]})
+
+    assert asyncio.run(scraper.get_element_attributes("img")) == {"src": "a.png"}
+    assert asyncio.run(scraper.get_element_styles(".missing")) == {}
+    assert scraper.page.evaluations[0][2]["limit"] == 1
+
+
+ATTRIBUTES_HTML = """
+<a href="/1" title="it's" class="x">One</a>
+<a href="/2" data-id="7">Two</a>
+<p style="color: rgb(255, 0, 0); display: none">hidden</p>
+<p style="display: block">shown</p>
+"""
+
+
+def test_attribute_and_style_scripts_in_browser(run_in_browser):
+    """The in-page scripts read attributes, whitelists, quoted selectors and computed styles"""
+    async def check(page):
+        scraper = GAScrap(headless=True)
+        scraper.page = page
+        return (
+            await scraper.get_elements_attributes("a"),
+            await scraper.get_elements_attributes("a", ["href", "data-id"]),
+            await scraper.get_element_attributes('a[title="it\'s"]', attributes=["href"]),
+            await scraper.get_elements_styles("p", ["color", "display"], limit=1),
+            await scraper.get_element_styles("p"),
+        )
+
+    everything, whitelisted, quoted, styles, all_styles = run_in_browser(ATTRIBUTES_HTML, check)
+
+    assert everything == [{"href": "/1", "title": "it's", "class": "x"}, {"href": "/2", "data-id": "7"}]
+    assert whitelisted == [{"href": "/1"}, {"href": "/2", "data-id": "7"}]
+    assert quoted == {"href": "/1"}
+    assert styles == [{"color": "rgb(255, 0, 0)", "display": "none"}]
+    assert all_styles["display"] == "none" and len(all_styles) > 100
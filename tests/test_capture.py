@@ -0,0 +1,145 @@
+"""
+Test JSON response capture (fake responses, no browser required)
+"""
+
+import asyncio
+import json
+import re
+import tempfile
+from pathlib import Path
+
+from ga_scrap import GAScrap, NDJSONSink
+from ga_scrap.capture import ResponseCapture
+
+
+class FakeRequest:
+    def __init__(self, method="GET", resource_type="xhr", post_data=None):
+        self.method = method
+        self.resource_type = resource_type
+        self.post_data = post_data
+
+
+class FakeResponse:
+    def __init__(self, url, body, status=200, content_type="application/json",
+                 resource_type="xhr", method="GET", post_data=None, delay=0.0):
+        self.url = url
+        self.status = status
+        self.ok = 200 <= status < 300
+        self.headers = {"content-type": content_type}
+        self.request = FakeRequest(method, resource_type, post_data)
+        self._body = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.delay = delay
+        self.reads = 0
+
+    async def body(self):
+        self.reads += 1
+        await asyncio.sleep(self.delay)
+        return self._body
+
+
+class FakeContext:
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def emit(self, event, value):
+        for handler in list(self.listeners.get(event, [])):
+            handler(value)
+
+
+def test_filters_are_checked_before_reading_bodies():
+    """Only matching XHR/fetch JSON responses get their body read"""
+    async def run():
+        capture = ResponseCapture(url=re.compile(r"/api/"))
+        responses = [
+            FakeResponse("https://shop.example/api/items", {"items": [1, 2]}),
+            FakeResponse("https://shop.example/api/graphql", {"data": {}}, method="POST",
+                         resource_type="fetch", post_data='{"query": "{ items }"}'),
+            FakeResponse("https://shop.example/api/page", b"<html>", content_type="text/html"),
+            FakeResponse("https://shop.example/api/items.json", {"x": 1}, resource_type="document"),
+            FakeResponse("https://shop.example/api/missing", {"error": 1}, status=404),
+            FakeResponse("https://cdn.example/config", {"x": 1}),
+        ]
+        for response in responses:
+            capture.on_response(response)
+        await capture.drain()
+        return capture, responses
+
+    capture, responses = asyncio.run(run())
+
+    assert capture.data() == [{"items": [1, 2]}, {"data": {}}]
+    assert capture.records[1]["method"] == "POST"
+    assert capture.records[1]["post_data"] == '{"query": "{ items }"}'
+    assert [response.reads for response in responses] == [1, 1, 0, 0, 0, 0]
+    assert capture.stats["seen"] == 6 and capture.stats["matched"] == 2 and capture.stats["captured"] == 2
+
+
+def test_bodies_are_read_concurrently_and_streamed_to_callbacks():
+    """Slow bodies are read in background tasks; async callbacks get every record"""
+    received = []
+
+    async def callback(record):
+        received.append(record["data"]["page"])
+
+    async def run():
+        capture = ResponseCapture(url="/api/", callback=callback)
+        started = asyncio.get_running_loop().time()
+        for page in range(5):
+            capture.on_response(FakeResponse(f"https://shop.example/api/items?page={page}", {"page": page}, delay=0.2))
+        assert capture.pending == 5
+        await capture.drain()
+        return capture, asyncio.get_running_loop().time() - started
+
+    capture, elapsed = asyncio.run(run())
+
+    assert sorted(received) == [0, 1, 2, 3, 4]
+    assert elapsed < 0.6
+    assert len(capture.records) == 0
+
+
+def test_invalid_and_oversized_bodies_are_counted():
+    """Broken JSON and bodies over the limit never reach the sink"""
+    async def run():
+        capture = ResponseCapture(max_body_bytes=20, callback=lambda record: None)
+        capture.on_response(FakeResponse("https://a.example/ok", {"ok": True}))
+        capture.on_response(FakeResponse("https://a.example/broken", b"{not json"))
+        capture.on_response(FakeResponse("https://a.example/big", {"rows": list(range(50))}))
+        await capture.drain()
+        return capture
+
+    capture = asyncio.run(run())
+
+    assert capture.stats["captured"] == 1
+    assert capture.stats["failed"] == 1 and capture.stats["skipped"] == 1
+    assert isinstance(capture.last_error, ValueError)
+
+
+def test_scraper_capture_streams_to_sink_and_stops():
+    """capture_responses() follows the context; stop_capture() drains and detaches"""
+    async def run(path):
+        scraper = GAScrap(headless=True)
+        scraper.context = FakeContext()
+        sink = NDJSONSink(path, background=False)
+
+        capture = scraper.capture_responses("/api/", sink=sink)
+        scraper.context.emit("response", FakeResponse("https://shop.example/api/items", {"items": ["lamp"]}))
+        stats = await scraper.stop_capture(capture)
+        scraper.context.emit("response", FakeResponse("https://shop.example/api/items", {"items": ["chair"]}))
+        await asyncio.sleep(0)
+        sink.close()
+        return scraper, stats
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "api.ndjson"
+        scraper, stats = asyncio.run(run(path))
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [line["data"] for line in lines] == [{"items": ["lamp"]}]
+    assert stats["captured"] == 1
+    assert scraper.context.listeners["response"] == []
+    assert scraper._context_listeners == [] and scraper._response_captures == []
@@ -0,0 +1,66 @@
+"""
+Test the context recycling policy checks (no browser required)
+"""
+
+import asyncio
+import time
+
+from ga_scrap import GAScrap
+
+
+def test_recycle_after_navigations():
+    """Recycle once the navigation budget is spent"""
+    scraper = GAScrap(headless=True, recycle_policy={"max_navigations": 3})
+    scraper._context_created_at = time.time()
+
+    scraper._navigation_count = 2
+    assert asyncio.run(scraper._recycle_reason()) is None
+
+    scraper._navigation_count = 3
+    assert asyncio.run(scraper._recycle_reason()) == "3 navigations"
+
+
+def test_recycle_after_age():
+    """Recycle once the context is older than the age limit"""
+    scraper = GAScrap(headless=True, recycle_policy={"max_age_minutes": 1})
+    scraper._context_created_at = time.time() - 30
+    assert asyncio.run(scraper._recycle_reason()) is None
+
+    scraper._context_created_at = time.time() - 120
+    assert asyncio.run(scraper._recycle_reason()).startswith("context age")
+
+
+def test_memory_checks_are_sampled():
+    """Memory limits are only sampled every memory_check_interval navigations"""
+    scraper = GAScrap(headless=True, recycle_policy={"max_js_heap_mb": 1, "memory_check_interval": 5})
+    scraper._context_created_at = time.time()
+
+    async def fake_memory(page=None):
+        return {"js_heap_used_mb": 64.0, "dom_nodes": 100}
+
+    scraper.get_renderer_memory = fake_memory
+
+    scraper._navigation_count = 4
+    assert asyncio.run(scraper._recycle_reason()) is None
+
+    scraper._navigation_count = 5
+    assert asyncio.run(scraper._recycle_reason()) == "JS heap 64 MB"
+
+
+def test_invalid_memory_check_interval_is_rejected():
+    """A zero or negative sampling interval fails at construction, not silently at runtime"""
+    for interval in (0, -3, 2.5):
+        try:
+            GAScrap(headless=True, recycle_policy={"max_dom_nodes": 1000, "memory_check_interval": interval})
+        except ValueError as e:
+            assert "memory_check_interval" in str(e)
+        else:
+            raise AssertionError(f"expected ValueError for {interval}")
+
+
+if __name__ == "__main__":
+    test_recycle_after_navigations()
+    test_recycle_after_age()
+    test_memory_checks_are_sampled()
+    test_invalid_memory_check_interval_is_rejected()
+    print("✅ Context recycling tests passed")
@@ -0,0 +1,114 @@
+"""
+Test crash detection and job re-queuing (no browser required)
+"""
+
+import asyncio
+
+from ga_scrap import GAScrap
+
+
+def test_fatal_errors_need_recovery():
+    """Playwright 'target closed' errors trigger recovery, others don't"""
+    scraper = GAScrap(headless=True)
+    assert not scraper.needs_recovery(ValueError("bad selector"))
+    assert scraper.needs_recovery(Exception("Target crashed"))
+    assert scraper.needs_recovery(Exception("Target page, context or browser has been closed"))
+
+
+def test_run_supervised_requeues_job():
+    """A job interrupted by a crash is re-run after recovery"""
+    scraper = GAScrap(headless=True)
+    calls = []
+    recoveries = []
+
+    async def fake_recover():
+        recoveries.append(True)
+        scraper._page_crashed = False
+
+    async def job(s, url):
+        calls.append(url)
+        if len(calls) == 1:
+            s._page_crashed = True
+            raise Exception("Target crashed")
+        return f"done {url}"
+
+    scraper.recover = fake_recover
+    result = asyncio.run(scraper.run_supervised(job, "https://example.com", snapshot=False))
+
+    assert result == "done https://example.com"
+    assert calls == ["https://example.com", "https://example.com"]
+    assert len(recoveries) == 1
+
+
+def test_run_supervised_gives_up():
+    """Recovery stops after max_restarts"""
+    scraper = GAScrap(headless=True)
+
+    async def fake_recover():
+        pass
+
+    async def job(s):
+        raise Exception("Browser has been closed")
+
+    scraper.recover = fake_recover
+    try:
+        asyncio.run(scraper.run_supervised(job, max_restarts=2, snapshot=False))
+    except Exception as e:
+        assert "Browser has been closed" in str(e)
+    else:
+        raise AssertionError("run_supervised should have raised")
+
+
+class CrashingPage:
+    """Worker page that crashes on a given URL and is dead afterwards"""
+
+    def __init__(self, scraper, crash_on):
+        self.scraper = scraper
+        self.context = scraper.context
+        self.crash_on = crash_on
+        self.crashed = False
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        if url == self.crash_on and not self.crashed:
+            self.crashed = True
+            self.scraper._on_page_crash(self)
+        if self.crashed:
+            raise Exception("Target crashed")
+
+    async def close(self):
+        self.closed = True
+
+
+def test_crawl_replaces_crashed_worker_pages():
+    """A worker whose page crashed continues on a fresh page instead of failing every URL"""
+    scraper = GAScrap(headless=True)
+    scraper.context = object()
+    pages = []
+
+    async def new_page():
+        pages.append(CrashingPage(scraper, crash_on="https://a.example/1" if not pages else None))
+        return pages[-1]
+
+    async def handler(page, url):
+        return url
+
+    scraper._new_worker_page = new_page
+    urls = [f"https://a.example/{i}" for i in range(4)]
+    results = asyncio.run(scraper.crawl(urls, handler, concurrency=1, rate_per_host=0))
+
+    assert sorted(result["url"] for result in results) == urls
+    assert all(result["error"] is None for result in results)
+    assert len(pages) == 2 and pages[0].closed
+    assert len(scraper._crashed_pages) == 0
+
+
+if __name__ == "__main__":
+    test_fatal_errors_need_recovery()
+    test_run_supervised_requeues_job()
+    test_run_supervised_gives_up()
+    test_crawl_replaces_crashed_worker_pages()
+    print("✅ Crash recovery tests passed")
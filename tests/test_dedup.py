@@ -0,0 +1,101 @@
+"""
+Test URL canonicalization and the Bloom filter (no browser required)
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ga_scrap.dedup import URLCanonicalizer, BloomFilter, URLDeduplicator, canonicalize_url
+from ga_scrap.frontier import Frontier
+
+
+def test_canonicalize_url():
+    """Equivalent URLs share one canonical form"""
+    canonical = "http://example.com/a/c?a=1&b=2"
+    assert canonicalize_url("HTTP://Example.COM:80/a/./b/../c?b=2&a=1#top") == canonical
+    assert canonicalize_url("http://example.com/a/c?utm_source=x&a=1&b=2&fbclid=y") == canonical
+    assert canonicalize_url("https://example.com/%7euser/%2f") == "https://example.com/~user/%2F"
+    assert canonicalize_url("https://example.com:8443/x") == "https://example.com:8443/x"
+
+    canonicalizer = URLCanonicalizer(strip_www=True, strip_trailing_slash=True, keep_params=["id"])
+    assert canonicalizer("https://www.example.com/p/?id=3&page=2") == "https://example.com/p?id=3"
+
+
+def test_canonicalize_non_ascii_query():
+    """Raw non-ASCII query values are encoded as UTF-8, existing escapes are kept"""
+    assert canonicalize_url("https://example.com/s?q=中文") == "https://example.com/s?q=%E4%B8%AD%E6%96%87"
+    assert canonicalize_url("https://example.com/s?q=é&a=1") == "https://example.com/s?a=1&q=%C3%A9"
+    assert canonicalize_url("https://example.com/s?q=%c3%a9") == "https://example.com/s?q=%C3%A9"
+    assert canonicalize_url("https://example.com/s?q=%E9&x=a+b&y=%26%7e") == "https://example.com/s?q=%E9&x=a+b&y=%26~"
+    assert canonicalize_url("https://example.com/s?utm_source=中&&flag") == "https://example.com/s?flag="
+
+
+def test_bloom_filter_persistence():
+    """A persisted filter remembers its items after reopening"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "seen.bloom"
+        with BloomFilter(capacity=1000, path=path) as bloom:
+            assert bloom.add("a") is True
+            assert bloom.add("a") is False
+            bloom.add("b")
+
+        with BloomFilter(path=path) as bloom:
+            assert "a" in bloom and "b" in bloom
+            assert "c" not in bloom
+            assert len(bloom) == 2
+
+
+def test_bloom_filter_error_rate():
+    """False positives stay near the configured rate"""
+    bloom = BloomFilter(capacity=10000, error_rate=0.01)
+    for i in range(10000):
+        bloom.add(f"https://example.com/item/{i}")
+
+    false_positives = sum(f"https://example.com/other/{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_frontier_dedup():
+    """The frontier stores canonical URLs and skips variants"""
+    with tempfile.TemporaryDirectory() as tmp:
+        dedup = URLDeduplicator(capacity=1000)
+        with Frontier(Path(tmp) / "frontier.db", dedup=dedup) as frontier:
+            assert frontier.add([
+                "https://example.com/p?b=2&a=1",
+                "https://EXAMPLE.com/p?a=1&b=2#reviews",
+                "https://example.com/p?a=1&b=2&utm_medium=email",
+            ]) == 1
+            assert frontier.claim(10) == ["https://example.com/p?a=1&b=2"]
+            # A raw non-Latin-1 query no longer fails the whole batch
+            assert frontier.add(["https://example.com/s?q=中文", "https://example.com/s?q=%E4%B8%AD%E6%96%87"]) == 1
+
+
+def test_frontier_dedup_survives_rollback():
+    """URLs of a rolled-back add() are not marked seen and can be added again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        dedup = URLDeduplicator(capacity=1000)
+        with Frontier(Path(tmp) / "frontier.db", dedup=dedup) as frontier:
+            insert = frontier._insert
+
+            def broken_insert(rows):
+                raise sqlite3.OperationalError("disk I/O error")
+
+            frontier._insert = broken_insert
+            with pytest.raises(sqlite3.OperationalError):
+                frontier.add(["https://example.com/a", "https://example.com/b"])
+            assert not dedup.seen("https://example.com/a")
+
+            frontier._insert = insert
+            assert frontier.add(["https://example.com/a", "https://example.com/b", "https://example.com/a"]) == 2
+            assert dedup.seen("https://example.com/a")
+
+
+def test_bloom_filter_rejects_bad_sizes():
+    """Capacity and error rate are validated up front"""
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=0)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, error_rate=1.5)
@@ -0,0 +1,157 @@
+"""
+Test the coordinator/worker protocol on localhost (fake scrapers, no browser required)
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from ga_scrap import Coordinator, Frontier, RemoteWorker
+
+from fakes import FakeScraper
+
+
+async def length(page, url):
+    if "bad" in url:
+        raise ValueError("bad page")
+    await asyncio.sleep(0.001)
+    return len(url)
+
+
+def make_frontier(tmp: str, urls) -> Frontier:
+    frontier = Frontier(str(Path(tmp) / "frontier.db"), max_attempts=2)
+    frontier.add(urls)
+    return frontier
+
+
+def test_several_workers_drain_the_frontier():
+    """Three workers share the frontier; failures are retried by the coordinator's frontier"""
+    urls = [f"https://example.com/{i}" for i in range(40)] + ["https://example.com/bad"]
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = make_frontier(tmp, urls)
+        with Coordinator(frontier, port=0, batch_size=5) as coordinator:
+            workers = [
+                RemoteWorker(coordinator.url, length, name=f"node{i}", upload_every=2,
+                             poll_interval=0.05, scraper_factory=FakeScraper)
+                for i in range(3)
+            ]
+
+            async def run_all():
+                return await asyncio.gather(*(worker.run() for worker in workers))
+
+            stats = asyncio.run(run_all())
+            status = coordinator.status()
+
+        assert sum(s["done"] for s in stats) == 40
+        assert sum(s["failed"] for s in stats) == 2
+        assert status["frontier"]["done"] == 40 and status["frontier"]["failed"] == 1
+        assert status["workers"] == []
+        results = {r["url"]: r["result"] for r in frontier.results()}
+        assert results["https://example.com/7"] == len("https://example.com/7")
+        frontier.close()
+
+
+def test_silent_worker_is_dropped_and_its_urls_requeued():
+    """A worker that stops heartbeating loses its leases long before they expire"""
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = make_frontier(tmp, [f"https://example.com/{i}" for i in range(6)])
+        with Coordinator(frontier, port=0, batch_size=4, lease_timeout=300, heartbeat_timeout=0.3) as coordinator:
+            client = RemoteWorker(coordinator.url)
+            worker_id = client._request("/register", {"name": "ghost"})["worker_id"]
+            assert len(client._request("/claim", {"worker_id": worker_id})["urls"]) == 4
+            assert frontier.stats()["in_flight"] == 4
+
+            deadline = time.time() + 5
+            while frontier.stats()["in_flight"] and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert frontier.stats()["pending"] == 6
+            assert all(w["worker_id"] != worker_id for w in coordinator.status()["workers"])
+
+            worker = RemoteWorker(coordinator.url, length, poll_interval=0.05, scraper_factory=FakeScraper)
+            assert asyncio.run(worker.run())["done"] == 6
+        frontier.close()
+
+
+def test_token_is_required():
+    """Requests without the shared secret are rejected"""
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = make_frontier(tmp, ["https://example.com/"])
+        with Coordinator(frontier, port=0, token="s3cret") as coordinator:
+            with pytest.raises(RuntimeError, match="401"):
+                RemoteWorker(coordinator.url)._request("/stats")
+            assert RemoteWorker(coordinator.url, token="s3cret")._request("/stats")["frontier"]["pending"] == 1
+        frontier.close()
+
+
+def test_dropped_worker_abandons_its_batch_and_rejoins():
+    """A worker told it is unknown stops crawling its requeued URLs and registers again"""
+    async def slow(page, url):
+        await asyncio.sleep(0.4)
+        return url
+
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = make_frontier(tmp, [f"https://example.com/{i}" for i in range(3)])
+        with Coordinator(frontier, port=0, batch_size=3, heartbeat_timeout=0.3) as coordinator:
+            worker = RemoteWorker(coordinator.url, slow, poll_interval=0.05, scraper_factory=FakeScraper)
+
+            async def scenario():
+                run = asyncio.ensure_future(worker.run())
+                while not worker._in_flight:
+                    await asyncio.sleep(0.01)
+                first_id = worker.worker_id
+                # What reap() does to a worker that missed its heartbeats
+                with coordinator._lock:
+                    frontier.release(coordinator.workers.pop(first_id)["leased"])
+                return first_id, await run
+
+            first_id, stats = asyncio.run(scenario())
+
+        assert stats["abandoned"] >= 1
+        assert worker.worker_id != first_id
+        assert frontier.stats()["done"] == 3
+        frontier.close()
+
+
+def test_late_upload_of_a_reaped_worker_is_rejected():
+    """A dropped worker is not re-created by its requests and cannot complete URLs it lost"""
+    urls = [f"https://example.com/{i}" for i in range(4)]
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = make_frontier(tmp, urls)
+        coordinator = Coordinator(frontier, port=0, batch_size=4, heartbeat_timeout=0.3)
+
+        first = coordinator.register({"name": "a"})["worker_id"]
+        assert sorted(coordinator.claim({"worker_id": first})["urls"]) == sorted(urls)
+        coordinator.workers[first]["last_seen"] -= 10
+        assert coordinator.reap() == [first]
+
+        second = coordinator.register({"name": "b"})["worker_id"]
+        assert sorted(coordinator.claim({"worker_id": second})["urls"]) == sorted(urls)
+
+        late = coordinator.upload({"worker_id": first, "results": [{"url": urls[0], "data": 1, "error": None}]})
+        assert late == {"accepted": 0, "rejected": 1, "known": False}
+        assert coordinator.heartbeat({"worker_id": first, "urls": urls})["known"] is False
+        assert coordinator.claim({"worker_id": first}) == {"urls": [], "finished": False, "known": False}
+        assert first not in coordinator.workers
+        assert frontier.stats()["in_flight"] == 4 and frontier.stats()["done"] == 0
+
+        stray = coordinator.upload({"worker_id": second, "results": [
+            {"url": url, "data": 1, "error": None} for url in urls + ["https://example.com/other"]
+        ]})
+        assert stray == {"accepted": 4, "rejected": 1, "known": True}
+        assert frontier.stats()["done"] == 4
+        frontier.close()
+
+
+def test_open_coordinator_without_token_warns(capsys):
+    """Listening on every interface without a shared secret is called out"""
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = make_frontier(tmp, ["https://example.com/"])
+        with Coordinator(frontier, host="0.0.0.0", port=0):
+            pass
+        frontier.close()
+
+    assert "without a token" in capsys.readouterr().out
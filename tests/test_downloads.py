@@ -0,0 +1,144 @@
+"""
+Test the download manager against a local HTTP server (no browser required)
+"""
+
+import asyncio
+import hashlib
+import ssl
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+from ga_scrap.downloads import DownloadManager
+
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves PAYLOAD with Range support and records request headers"""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+    paths = []
+
+    def do_GET(self):
+        RangeHandler.requests.append(dict(self.headers))
+        RangeHandler.paths.append(self.path)
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+        body = PAYLOAD[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_resume_checksum_and_skip():
+    """Partial files resume with Range, checksums are verified and finished files are skipped"""
+    server, base = _serve()
+    RangeHandler.requests = []
+    checksum = "sha256:" + hashlib.sha256(PAYLOAD).hexdigest()
+    url = f"{base}/files/data.bin"
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cookies = [{"name": "session", "value": "abc", "domain": "127.0.0.1", "path": "/"}]
+            manager = DownloadManager(tmp, chunk_size=64 * 1024, cookies=cookies)
+            partial = Path(tmp) / (manager.filename_for(url) + ".part")
+            partial.write_bytes(PAYLOAD[:1000])
+
+            result = asyncio.run(manager.download(url, checksum=checksum))
+            assert result["error"] is None and not result["skipped"]
+            assert Path(result["path"]).read_bytes() == PAYLOAD
+            assert RangeHandler.requests[0]["Range"] == "bytes=1000-"
+            assert RangeHandler.requests[0]["Cookie"] == "session=abc"
+            assert manager.stats["resumed"] == 1
+            manager.close()
+
+            # A new manager finds the download in the manifest
+            manager = DownloadManager(tmp)
+            assert asyncio.run(manager.download(url))["skipped"] is True
+            manager.close()
+
+            bad = DownloadManager(tmp, retries=0)
+            result = asyncio.run(bad.download(f"{base}/other.bin", checksum="sha256:" + "0" * 64))
+            assert "mismatch" in result["error"]
+            assert not list(Path(tmp).glob("other*"))
+            bad.close()
+    finally:
+        server.shutdown()
+
+
+def test_content_addressed_dedupe():
+    """Identical content from different URLs is stored once"""
+    server, base = _serve()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = DownloadManager(tmp, content_addressed=True, concurrency=2)
+            results = asyncio.run(manager.download_all([f"{base}/a.bin", {"url": f"{base}/b.bin"}]))
+            manager.close()
+
+            assert results[0]["path"] == results[1]["path"]
+            assert Path(results[0]["path"]).name == hashlib.sha256(PAYLOAD).hexdigest() + ".bin"
+            assert sorted(p.name for p in Path(tmp).glob("*.bin")) == [Path(results[0]["path"]).name]
+    finally:
+        server.shutdown()
+
+
+def test_duplicate_submissions_share_one_transfer():
+    """The same file submitted twice at once is fetched once; the second waits and skips"""
+    server, base = _serve()
+    RangeHandler.requests = []
+    url = f"{base}/files/same.bin"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = DownloadManager(tmp, concurrency=4, max_per_host=4, chunk_size=4096)
+            results = asyncio.run(manager.download_all([url, url, {"url": url}]))
+            manager.close()
+
+            assert len(RangeHandler.requests) == 1
+            assert [result["skipped"] for result in results] == [False, True, True]
+            assert {result["path"] for result in results} == {results[0]["path"]}
+            assert Path(results[0]["path"]).read_bytes() == PAYLOAD
+            assert not list(Path(tmp).glob("*.part"))
+    finally:
+        server.shutdown()
+
+
+def test_proxy_and_certificate_settings():
+    """Transfers go through the browser's proxy; ignore_https_errors skips certificate checks"""
+    server, base = _serve()
+    RangeHandler.requests, RangeHandler.paths = [], []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            proxy = {"server": base, "username": "user", "password": "pw", "bypass": ".internal.example"}
+            manager = DownloadManager(tmp, proxy=proxy, ignore_https_errors=True)
+            result = asyncio.run(manager.download("http://files.example/data.bin"))
+
+            assert result["error"] is None
+            assert RangeHandler.paths == ["http://files.example/data.bin"]
+            assert RangeHandler.requests[0]["Proxy-Authorization"] == "Basic dXNlcjpwdw=="
+
+            tunnel = manager._pool.connect("https", "secure.example:8443")
+            assert (tunnel.host, tunnel._tunnel_host, tunnel._tunnel_port) == ("127.0.0.1", "secure.example", 8443)
+            assert tunnel._context.verify_mode == ssl.CERT_NONE
+            assert manager._pool.connect("https", "cdn.internal.example").host == "cdn.internal.example"
+            manager.close()
+
+            strict = DownloadManager(tmp)
+            assert strict._pool.connect("https", "secure.example")._context.verify_mode == ssl.CERT_REQUIRED
+            strict.close()
+    finally:
+        server.shutdown()
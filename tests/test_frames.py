@@ -0,0 +1,164 @@
+"""
+Test frame-aware extraction (fake frames, no browser required)
+"""
+
+import asyncio
+import re
+
+from ga_scrap import GAScrap
+from ga_scrap.frames import parse_schema
+
+from fakes import FakePage
+
+
+class FakeFrame:
+    def __init__(self, url, name="", data=None, delay=0.0, error=None):
+        self.url = url
+        self.name = name
+        self.data = data or {}
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    def is_detached(self):
+        return False
+
+    async def evaluate(self, expression, arg=None):
+        self.calls.append(arg)
+        tracker.running += 1
+        tracker.peak = max(tracker.peak, tracker.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise RuntimeError(self.error)
+            return {name: self.data.get(name) for name, *_ in arg}
+        finally:
+            tracker.running -= 1
+
+
+class Tracker:
+    running = 0
+    peak = 0
+
+
+tracker = Tracker()
+
+
+def make_page():
+    return FakePage(frames=[
+        FakeFrame("https://shop.example/", data={"title": "Shop"}),
+        FakeFrame("https://shop.example/listing/1", "listing-1", {"title": "Lamp", "links": ["/a"]}, delay=0.05),
+        FakeFrame("https://widgets.partner.io/reviews", "reviews", {"title": "4.5 stars"}, delay=0.05),
+        FakeFrame("https://tpc.googlesyndication.com/ad", "ad", {"title": "Buy now"}),
+        FakeFrame("about:blank"),
+        FakeFrame("https://shop.example/listing/2", "listing-2", {}),
+    ])
+
+
+def make_scraper(page):
+    scraper = GAScrap(headless=True)
+    scraper.page = page
+    return scraper
+
+
+def test_parse_schema():
+    """'[]' marks all matches, '@attr' reads an attribute, attribute selectors stay intact"""
+    assert parse_schema({
+        "title": "h1",
+        "links": "a.item@href[]",
+        "names": "li [] ",
+        "email": 'a[href^="mailto:"]',
+    }) == [
+        ("title", "h1", None, False),
+        ("links", "a.item", "href", True),
+        ("names", "li", None, True),
+        ("email", 'a[href^="mailto:"]', None, False),
+    ]
+
+
+def test_filter_frames():
+    """Blank and ad frames are skipped; URL, name and origin filters narrow the rest"""
+    page = make_page()
+    scraper = make_scraper(page)
+
+    urls = lambda frames: [frame.url for frame in frames]
+
+    assert len(scraper.filter_frames()) == 4
+    assert len(scraper.filter_frames(skip_ads=False)) == 5
+    assert urls(scraper.filter_frames(same_origin=True, include_main=False)) == [
+        "https://shop.example/listing/1", "https://shop.example/listing/2",
+    ]
+    assert urls(scraper.filter_frames(url=re.compile(r"/listing/\d$"))) == urls(page.frames[1:2]) + urls(page.frames[5:6])
+    assert urls(scraper.filter_frames(url="partner")) == ["https://widgets.partner.io/reviews"]
+    assert urls(scraper.filter_frames(url=lambda frame: frame.name.endswith("2"))) == ["https://shop.example/listing/2"]
+    assert urls(scraper.filter_frames(name="reviews")) == ["https://widgets.partner.io/reviews"]
+
+
+def test_extract_runs_frames_concurrently_and_tags_results():
+    """Every frame gets one call with the parsed schema; empty frames are dropped"""
+    page = make_page()
+    scraper = make_scraper(page)
+    tracker.peak = 0
+
+    results = asyncio.run(scraper.extract_from_frames({"title": "h1", "links": "a@href[]"}))
+
+    assert [(result["frame_url"], result["frame_name"]) for result in results] == [
+        ("https://shop.example/", ""),
+        ("https://shop.example/listing/1", "listing-1"),
+        ("https://widgets.partner.io/reviews", "reviews"),
+    ]
+    assert results[1]["data"] == {"title": "Lamp", "links": ["/a"]}
+    assert all(result["error"] is None for result in results)
+    assert tracker.peak > 1
+    assert page.frames[1].calls == [[("title", "h1", None, False), ("links", "a", "href", True)]]
+    assert page.frames[3].calls == []
+
+
+def test_extract_records_failures_and_limits_concurrency():
+    """A failing or hanging frame is reported without losing the others"""
+    page = make_page()
+    page.frames[2].error = "Frame was detached"
+    page.frames[1].delay = 1.0
+    scraper = make_scraper(page)
+    tracker.peak = 0
+
+    results = asyncio.run(scraper.extract_from_frames({"title": "h1"}, timeout=0.2, concurrency=1, skip_empty=False))
+
+    by_url = {result["frame_url"]: result for result in results}
+    assert len(results) == 4
+    assert by_url["https://shop.example/"]["data"] == {"title": "Shop"}
+    assert "timed out" in by_url["https://shop.example/listing/1"]["error"]
+    assert by_url["https://widgets.partner.io/reviews"]["error"] == "Frame was detached"
+    assert by_url["https://shop.example/listing/2"]["data"] == {"title": None}
+    assert tracker.peak == 1
+
+
+FRAMES_HTML = """
+<h1>Main</h1>
+<iframe name="listing-1" srcdoc="<h1>Lamp</h1><a class='item' href='/a'>A</a><a class='item' href='/b'>B</a>"></iframe>
+<iframe name="empty" srcdoc="<p>nothing here</p>"></iframe>
+"""
+
+
+def test_schema_script_in_browser(run_in_browser):
+    """The in-page script reads text, attributes and lists inside real iframes"""
+    async def check(page):
+        scraper = GAScrap(headless=True)
+        scraper.page = page
+        schema = {"title": "h1", "links": "a.item@href[]", "names": "a.item[]"}
+        return (
+            await scraper.extract_from_frames(schema, include_main=False),
+            await scraper.extract_from_frames(schema, name="empty", skip_empty=False),
+            await scraper.extract_from_frames({"bad": "a[["}, name="empty"),
+        )
+
+    listing, empty, broken = run_in_browser(FRAMES_HTML, check)
+
+    assert listing == [{
+        "frame_url": "about:srcdoc",
+        "frame_name": "listing-1",
+        "data": {"title": "Lamp", "links": ["/a", "/b"], "names": ["A", "B"]},
+        "error": None,
+    }]
+    assert empty[0]["data"] == {"title": None, "links": [], "names": []}
+    assert broken[0]["data"] is None and broken[0]["error"]
@@ -0,0 +1,133 @@
+"""
+Test the SQLite crawl frontier (no browser required)
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from ga_scrap import GAScrap
+from ga_scrap.frontier import Frontier
+
+
+def test_claim_by_priority_and_dedupe():
+    """Duplicates are ignored and higher priorities are claimed first"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with Frontier(Path(tmp) / "frontier.db") as frontier:
+            assert frontier.add(["https://a.example/1", "https://a.example/2"]) == 2
+            assert frontier.add("https://a.example/1") == 0
+            frontier.add("https://a.example/urgent", priority=10)
+
+            assert frontier.claim(2) == ["https://a.example/urgent", "https://a.example/1"]
+            assert frontier.stats()["in_flight"] == 2
+            assert frontier.claim(10) == ["https://a.example/2"]
+            assert frontier.claim(10) == []
+
+
+def test_expired_leases_are_reclaimed():
+    """In-flight URLs come back once their lease expires"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with Frontier(Path(tmp) / "frontier.db") as frontier:
+            frontier.add("https://a.example/1")
+            assert frontier.claim(1, lease_timeout=0.01) == ["https://a.example/1"]
+            assert frontier.claim(1) == []
+            time.sleep(0.02)
+            assert frontier.claim(1) == ["https://a.example/1"]
+
+
+
+def test_release_requeues_only_in_flight_urls():
+    """Released URLs are claimable again at once; finished ones stay finished"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with Frontier(Path(tmp) / "frontier.db") as frontier:
+            frontier.add(["https://a.example/1", "https://a.example/2"])
+            frontier.claim(2, lease_timeout=300)
+            frontier.complete("https://a.example/2")
+            frontier.flush()
+
+            assert frontier.release(["https://a.example/1", "https://a.example/2"]) == 1
+            assert frontier.claim(10) == ["https://a.example/1"]
+
+def test_fail_retries_until_max_attempts():
+    """Failures are retried until max_attempts, then marked failed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with Frontier(Path(tmp) / "frontier.db", max_attempts=2) as frontier:
+            frontier.add("https://a.example/1")
+            frontier.claim(1)
+            assert frontier.fail("https://a.example/1", "timeout") == Frontier.PENDING
+            frontier.claim(1)
+            assert frontier.fail("https://a.example/1", "timeout") == Frontier.FAILED
+            failed = list(frontier.results(Frontier.FAILED))
+            assert failed[0]["error"] == "timeout"
+            assert failed[0]["attempts"] == 2
+
+
+def test_resume_after_restart():
+    """Results and queue state survive reopening the database"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "frontier.db"
+
+        frontier = Frontier(path, flush_every=10)
+        frontier.add([f"https://a.example/{i}" for i in range(5)])
+        claimed = frontier.claim(3)
+        frontier.complete(claimed[0], {"title": "first"})
+        frontier.close()
+
+        with Frontier(path) as resumed:
+            assert resumed.stats() == {"pending": 2, "in_flight": 2, "done": 1, "failed": 0}
+            assert resumed.requeue_in_flight() == 2
+            assert len(resumed.claim(10)) == 4
+            done = list(resumed.results())
+            assert done == [{"url": claimed[0], "result": {"title": "first"}, "error": None, "attempts": 1}]
+
+
+if __name__ == "__main__":
+    test_claim_by_priority_and_dedupe()
+    test_expired_leases_are_reclaimed()
+    test_fail_retries_until_max_attempts()
+    test_resume_after_restart()
+    print("✅ Frontier tests passed")
+
+
+class FakeCrawlPage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+def test_crawl_keeps_leases_of_queued_urls():
+    """URLs waiting in the politeness queue longer than the lease are not handed out twice"""
+    seen = []
+
+    async def handler(page, url):
+        seen.append(url)
+        return {"url": url}
+
+    async def run(frontier):
+        scraper = GAScrap(headless=True)
+        scraper.context = object()
+
+        async def new_page():
+            return FakeCrawlPage(scraper.context)
+
+        scraper._new_worker_page = new_page
+        urls = [f"https://a.example/{i}" for i in range(4)]
+        await scraper.crawl(urls, handler, concurrency=1, rate_per_host=3.0, frontier=frontier)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with Frontier(Path(tmp) / "frontier.db", lease_timeout=0.3) as frontier:
+            asyncio.run(run(frontier))
+            results = list(frontier.results())
+
+    assert sorted(seen) == [f"https://a.example/{i}" for i in range(4)]
+    assert [result["attempts"] for result in results] == [1, 1, 1, 1]
@@ -0,0 +1,45 @@
+"""
+Test handle-free text extraction and scoped element handles (fake page, no browser required)
+"""
+
+import asyncio
+
+from ga_scrap import GAScrap
+
+from fakes import FakePage
+
+
+def test_get_text_and_get_texts_take_no_handles():
+    """Text helpers read through locators and never create element handles"""
+    scraper = GAScrap(headless=True)
+    scraper.page = FakePage({"h1": ["Title"], "li": ["a", "b", "c"]})
+
+    assert asyncio.run(scraper.get_text("h1")) == "Title"
+    assert asyncio.run(scraper.get_text(".missing")) == ""
+    assert asyncio.run(scraper.get_texts("li")) == ["a", "b", "c"]
+    assert scraper.page.handle_queries == 0
+
+
+def test_query_elements_disposes_handles():
+    """Handles from query_elements() and handle scopes are disposed on exit, even after errors"""
+    scraper = GAScrap(headless=True)
+    scraper.page = FakePage({"li": ["a", "b"]})
+
+    async def scenario():
+        async with scraper.query_elements("li") as handles:
+            assert len(handles) == 2
+            assert not any(handle.disposed for handle in handles)
+        kept = handles
+
+        scoped = []
+        try:
+            async with scraper.handle_scope() as scope:
+                scoped = await scope.query_all("li")
+                scope.track(None)
+                raise RuntimeError("extraction failed")
+        except RuntimeError:
+            pass
+        return kept, scoped
+
+    kept, scoped = asyncio.run(scenario())
+    assert all(handle.disposed for handle in kept + scoped)
@@ -0,0 +1,113 @@
+"""
+Test subprocess hot reload supervision (no browser required)
+"""
+
+import asyncio
+import signal
+import tempfile
+import time
+from pathlib import Path
+
+from ga_scrap import HotReloader
+
+
+def _make_reloader(script: Path, **options) -> HotReloader:
+    """Create a reloader without leaving its signal handlers installed"""
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        return HotReloader(str(script), **options)
+    finally:
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+
+
+async def _wait_for(condition, timeout: float = 10.0):
+    """Poll until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.02)
+
+
+def _write_app(tmp: str) -> Path:
+    """App that announces itself and keeps running"""
+    script = Path(tmp) / "main.py"
+    script.write_text("import time\nprint('app started', flush=True)\ntime.sleep(60)\n")
+    return script
+
+
+def test_file_save_restarts_process():
+    """A save seen by the watchdog thread restarts the app through the loop"""
+    with tempfile.TemporaryDirectory() as tmp:
+        script = _write_app(tmp)
+        reloader = _make_reloader(script, debounce_delay=0.1)
+
+        async def scenario():
+            serve = asyncio.create_task(reloader._serve())
+            await _wait_for(lambda: reloader.process is not None)
+            first = reloader.process
+
+            (Path(tmp) / "helper.py").write_text("VALUE = 1\n")
+            await _wait_for(lambda: reloader.metrics["restarts"] == 1)
+
+            assert reloader.process is not first and first.returncode is not None
+            assert reloader.process.returncode is None
+            reloader._stop_event.set()
+            await serve
+
+        asyncio.run(scenario())
+
+        assert reloader.process is None
+        assert reloader.metrics["last_ms"] < 5000
+        assert not reloader.observer.is_alive()
+
+
+def test_burst_of_changes_restarts_once():
+    """Changes inside the debounce window are coalesced into a single restart"""
+    with tempfile.TemporaryDirectory() as tmp:
+        script = _write_app(tmp)
+        reloader = _make_reloader(script, debounce_delay=0.2)
+
+        async def scenario():
+            serve = asyncio.create_task(reloader._serve())
+            await _wait_for(lambda: reloader.process is not None)
+
+            for i in range(5):
+                script.write_text(f"import time\nprint({i}, flush=True)\ntime.sleep(60)\n")
+                reloader._on_change(str(script), time.perf_counter())
+                await asyncio.sleep(0.02)
+            await _wait_for(lambda: reloader.metrics["restarts"] == 1)
+            await asyncio.sleep(0.4)
+
+            reloader._stop_event.set()
+            await serve
+
+        asyncio.run(scenario())
+
+        assert reloader.metrics["restarts"] == 1
+        # Latency is measured from the first change of the burst
+        assert reloader.metrics["last_ms"] >= 200
+
+
+def test_unchanged_save_does_not_restart():
+    """Rewriting a file with identical content is ignored (content hash, not mtime)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        script = _write_app(tmp)
+        reloader = _make_reloader(script, debounce_delay=0.05)
+
+        async def scenario():
+            serve = asyncio.create_task(reloader._serve())
+            await _wait_for(lambda: reloader.process is not None)
+            first = reloader.process
+
+            script.write_text(script.read_text())
+            reloader._on_change(str(script), time.perf_counter())
+            await asyncio.sleep(0.3)
+            assert reloader.process is first
+
+            reloader._stop_event.set()
+            await serve
+
+        asyncio.run(scenario())
+
+        assert reloader.metrics["restarts"] == 0
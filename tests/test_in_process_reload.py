@@ -0,0 +1,151 @@
+"""
+Test in-process hot reload module handling (no browser required)
+"""
+
+import asyncio
+import py_compile
+import signal
+import sys
+import tempfile
+from pathlib import Path
+
+from ga_scrap import InProcessReloader, SimpleScraper
+
+
+def _make_reloader(app_dir: Path) -> InProcessReloader:
+    """Create a reloader without leaving its signal handlers installed"""
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        return InProcessReloader(str(app_dir / "main.py"))
+    finally:
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+
+
+def test_load_app_picks_up_changed_modules():
+    """Helper modules are re-imported fresh on every load"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app_dir = Path(tmp)
+        (app_dir / "reload_helper.py").write_text("VALUE = 1\n")
+        (app_dir / "main.py").write_text(
+            "import reload_helper\n\n"
+            "async def run(scraper):\n"
+            "    scraper.result = reload_helper.VALUE\n"
+        )
+        reloader = _make_reloader(app_dir)
+
+        try:
+            assert reloader._load_app().reload_helper.VALUE == 1
+            (app_dir / "reload_helper.py").write_text("VALUE = 2\n")
+            assert reloader._load_app().reload_helper.VALUE == 2
+        finally:
+            sys.modules.pop("reload_helper", None)
+            sys.path.remove(str(app_dir.resolve()))
+
+
+def test_execute_reuses_running_scraper():
+    """run(scraper) receives a SimpleScraper wrapping the long-lived GAScrap"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app_dir = Path(tmp)
+        (app_dir / "main.py").write_text(
+            "calls = []\n\n"
+            "async def run(scraper):\n"
+            "    calls.append(scraper)\n"
+        )
+        reloader = _make_reloader(app_dir)
+        host = object()
+        reloader.scraper = host
+
+        try:
+            asyncio.run(reloader._execute())
+            module = sys.modules[InProcessReloader.APP_MODULE]
+            (wrapper,) = module.calls
+            assert isinstance(wrapper, SimpleScraper)
+            assert wrapper.scraper is host and wrapper.started
+
+            # Leaving the wrapper must not stop the shared browser
+            asyncio.run(wrapper.stop())
+            assert wrapper.started
+        finally:
+            sys.modules.pop(InProcessReloader.APP_MODULE, None)
+            sys.path.remove(str(app_dir.resolve()))
+
+
+def test_import_graph_reloads_only_dependents():
+    """A changed module is reloaded with its importers, unrelated modules stay cached"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app_dir = Path(tmp)
+        (app_dir / "graph_utils.py").write_text("BASE = 1\n")
+        (app_dir / "graph_parsers.py").write_text("from graph_utils import BASE\nVALUE = BASE\n")
+        (app_dir / "graph_other.py").write_text("OTHER = 1\n")
+        (app_dir / "main.py").write_text("import graph_parsers\nimport graph_other\n")
+        reloader = _make_reloader(app_dir)
+        reloader.graph.scan()
+
+        try:
+            reloader._load_app()
+            other = sys.modules["graph_other"]
+
+            (app_dir / "graph_utils.py").write_text("BASE = 22\n")
+            affected = reloader.graph.update([app_dir / "graph_utils.py"])
+            assert affected == {"graph_utils", "graph_parsers", InProcessReloader.APP_MODULE}
+
+            module = reloader._load_app(affected)
+            assert module.graph_parsers.VALUE == 22
+            assert sys.modules["graph_other"] is other
+
+            # Non-code changes keep every module, including the main script
+            assert reloader.graph.update([app_dir / "config.yaml"]) == set()
+            assert reloader._load_app(set()) is module
+        finally:
+            for name in ("graph_utils", "graph_parsers", "graph_other", InProcessReloader.APP_MODULE):
+                sys.modules.pop(name, None)
+            sys.path.remove(str(app_dir.resolve()))
+
+
+def test_import_graph_skips_environments():
+    """Virtualenvs, node_modules and build output are never scanned as app code"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app_dir = Path(tmp)
+        for vendored in (".venv/lib/site-packages/fakelib/__init__.py", "node_modules/pkg/tool.py",
+                         "build/lib/generated.py", "venv/lib/other.py"):
+            (app_dir / vendored).parent.mkdir(parents=True, exist_ok=True)
+            (app_dir / vendored).write_text("VALUE = 1\n")
+        (app_dir / "rebuild.py").write_text("VALUE = 1\n")
+        (app_dir / "main.py").write_text("import rebuild\n")
+        reloader = _make_reloader(app_dir)
+
+        reloader.graph.scan()
+
+        assert set(reloader.graph.modules) == {"rebuild", InProcessReloader.APP_MODULE}
+        assert reloader.graph.module_name(app_dir / ".venv/lib/site-packages/fakelib/__init__.py") is None
+        assert sorted(path.name for path in reloader._watched_files()) == ["main.py", "rebuild.py"]
+
+
+def test_purge_leaves_installed_packages_alone():
+    """Packages imported from a project-local .venv stay loaded and keep their bytecode"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app_dir = Path(tmp)
+        site_packages = app_dir / ".venv" / "lib" / "site-packages"
+        (site_packages / "purge_fakelib").mkdir(parents=True)
+        (site_packages / "purge_fakelib" / "__init__.py").write_text("VALUE = 1\n")
+        (app_dir / "purge_helper.py").write_text("import purge_fakelib\nVALUE = purge_fakelib.VALUE\n")
+        (app_dir / "main.py").write_text("import purge_helper\n")
+        sys.path.insert(0, str(site_packages))
+        reloader = _make_reloader(app_dir)
+
+        try:
+            reloader._load_app()
+            fakelib = sys.modules["purge_fakelib"]
+            bytecode = Path(py_compile.compile(fakelib.__file__, cfile=fakelib.__cached__))
+
+            reloader._load_app()
+
+            assert sys.modules["purge_fakelib"] is fakelib
+            assert bytecode.exists()
+            assert "purge_helper" in sys.modules
+        finally:
+            for name in ("purge_fakelib", "purge_helper", InProcessReloader.APP_MODULE):
+                sys.modules.pop(name, None)
+            sys.path.remove(str(site_packages))
+            sys.path.remove(str(app_dir.resolve()))
@@ -0,0 +1,106 @@
+"""
+Test the recurring job scheduler (no browser required)
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from ga_scrap import JobScheduler, SyncGAScrap
+from ga_scrap.jobs import CronTrigger
+
+from fakes import FakePool
+
+
+async def _run_until(scheduler: JobScheduler, condition, timeout: float = 5.0):
+    """Run the scheduler until condition() is true"""
+    task = asyncio.create_task(scheduler.run())
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+    scheduler.stop()
+    await task
+
+
+def test_cron_next_fire_times():
+    """Steps, ranges, names and the day-of-month / day-of-week OR rule"""
+    friday = datetime(2025, 7, 18, 10, 7)
+    assert CronTrigger("*/15 * * * *").next_after(friday) == datetime(2025, 7, 18, 10, 15)
+    assert CronTrigger("0 9 * * mon-fri").next_after(friday) == datetime(2025, 7, 21, 9, 0)
+    assert CronTrigger("@monthly").next_after(friday) == datetime(2025, 8, 1, 0, 0)
+    assert CronTrigger("30 8 1 jan *").next_after(friday) == datetime(2026, 1, 1, 8, 30)
+    # 13th of the month OR a Friday
+    assert CronTrigger("0 0 13 * fri").next_after(datetime(2025, 7, 19)) == datetime(2025, 7, 25)
+    with pytest.raises(ValueError):
+        CronTrigger("0 0 30 2 *").next_after(friday)
+
+
+def test_interval_jobs_share_pool_and_persist_state():
+    """Async jobs get the pooled scraper, sync jobs a SyncGAScrap; state is saved"""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = Path(tmp) / "state.json"
+        scheduler = JobScheduler(state_path=str(state_path), pool=FakePool())
+        seen = []
+
+        @scheduler.job(0.05, start_now=True)
+        async def async_job(scraper):
+            seen.append(("async", scraper.options))
+
+        @scheduler.job(0.05, start_now=True, scraper_options={"timeout": 5000})
+        def sync_job(scraper):
+            seen.append(("sync", isinstance(scraper, SyncGAScrap)))
+
+        asyncio.run(_run_until(scheduler, lambda: len(seen) >= 6))
+
+        assert ("async", {}) in seen and ("sync", True) in seen
+        state = json.loads(state_path.read_text())
+        assert state["async_job"]["runs"] >= 2 and state["async_job"]["last_status"] == "ok"
+        assert "last_fire" in state["sync_job"]
+
+
+@pytest.mark.parametrize("policy, expected", [("run_all", 6), ("run_once", 1), ("skip", 0)])
+def test_missed_runs_policy(policy, expected):
+    """Runs missed while the scheduler was down are replayed according to the policy"""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = Path(tmp) / "state.json"
+        last_fire = datetime.now() - timedelta(minutes=65)
+        state_path.write_text(json.dumps({"hourly": {"last_fire": last_fire.isoformat(), "runs": 10}}))
+
+        runs = []
+        scheduler = JobScheduler(state_path=str(state_path), pool=FakePool())
+        scheduler.add_job(lambda scraper: runs.append(1), 600, name="hourly", misfire=policy)
+
+        async def scenario():
+            task = asyncio.create_task(scheduler.run())
+            await asyncio.sleep(0.5)
+            scheduler.stop()
+            await task
+
+        asyncio.run(scenario())
+
+        assert len(runs) == expected
+        assert json.loads(state_path.read_text())["hourly"]["runs"] == 10 + expected
+
+
+def test_job_never_overlaps_itself():
+    """A run that is still going when the trigger fires again is skipped"""
+    scheduler = JobScheduler(state_path=None, pool=FakePool())
+    active = []
+    overlaps = []
+
+    @scheduler.job(0.02, start_now=True)
+    async def slow(scraper):
+        overlaps.append(len(active))
+        active.append(1)
+        await asyncio.sleep(0.1)
+        active.pop()
+
+    asyncio.run(_run_until(scheduler, lambda: len(overlaps) >= 3))
+
+    assert overlaps == [0] * len(overlaps)
@@ -0,0 +1,61 @@
+"""
+Test the per-page locator cache (fake page, no browser required)
+"""
+
+import asyncio
+
+from ga_scrap import GAScrap
+from ga_scrap.locators import LocatorCache
+
+from fakes import FakePage
+
+
+def test_hits_eviction_and_kinds():
+    """Repeated lookups hit; kind and options are part of the key; LRU evicts the oldest"""
+    page = FakePage()
+    cache = LocatorCache(page, max_size=2)
+
+    first = cache.get("css", ".price")
+    assert cache.get("css", ".price") is first
+    assert cache.get("role", "button", name="Buy") is not cache.get("role", "button")
+    assert cache.get("css", ".price", first=True).description == "css=.price.first"
+
+    assert page.built == 4
+    assert cache.stats == {"hits": 1, "misses": 4, "evictions": 2, "invalidations": 0}
+    assert len(cache) == 2
+
+
+def test_main_frame_navigation_invalidates():
+    """Only main frame navigations drop the cached locators"""
+    page = FakePage()
+    cache = LocatorCache(page)
+    cache.get("css", "h1")
+
+    page.emit("framenavigated", object())
+    assert len(cache) == 1
+    page.emit("framenavigated", page.main_frame)
+    assert len(cache) == 0 and cache.stats["invalidations"] == 1
+
+    cache.get("css", "h1")
+    assert page.built == 2
+
+
+def test_scraper_helpers_share_the_cache():
+    """get_locator() and click() reuse cached locators; closed pages keep their counters"""
+    scraper = GAScrap(headless=True)
+    page = FakePage()
+    scraper.page = page
+
+    assert scraper.get_locator("#go") is scraper.get_locator("#go")
+    asyncio.run(scraper.click("#go"))
+    asyncio.run(scraper.click("#go"))
+    assert page.built == 2
+
+    scraper._on_page_close(page)
+    stats = scraper.get_locator_cache_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+    assert stats["pages"] == 0 and stats["hit_rate"] == 0.5
+
+    uncached = GAScrap(headless=True, locator_cache_size=0)
+    uncached.page = page
+    assert uncached.get_locator("#go") is not uncached.get_locator("#go")
@@ -0,0 +1,102 @@
+"""
+Test the per-host politeness scheduler (no browser required)
+"""
+
+import asyncio
+import time
+
+from ga_scrap import PolitenessScheduler, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills():
+    """Tokens refill at the configured rate up to the burst capacity"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert abs(bucket.wait_time() - 0.5) < 1e-9
+
+    clock.now = 0.5
+    assert bucket.try_acquire()
+
+
+def test_throttled_host_does_not_block_others():
+    """While one host waits for tokens, other hosts keep being served"""
+    scheduler = PolitenessScheduler(rate_per_host=1.0, max_per_host=1, max_concurrency=4)
+    scheduler.add_many([
+        "https://slow.example/1",
+        "https://slow.example/2",
+        "https://a.example/1",
+        "https://b.example/1",
+    ])
+    scheduler.close()
+
+    async def drain():
+        served = []
+        while True:
+            url = await asyncio.wait_for(scheduler.acquire(), timeout=0.2)
+            if url is None:
+                break
+            served.append(url)
+            scheduler.release(url)
+            if len(served) == 3:
+                return served
+        return served
+
+    served = asyncio.run(drain())
+    assert "https://slow.example/1" in served
+    assert "https://a.example/1" in served
+    assert "https://b.example/1" in served
+    assert "https://slow.example/2" not in served
+
+
+def test_per_host_concurrency_limit():
+    """A host never has more in-flight URLs than max_per_host"""
+    scheduler = PolitenessScheduler(rate_per_host=0, max_per_host=2, max_concurrency=10)
+    scheduler.add_many(f"https://one.example/{i}" for i in range(5))
+    scheduler.close()
+
+    async def take_without_release():
+        taken = []
+        for _ in range(3):
+            try:
+                taken.append(await asyncio.wait_for(scheduler.acquire(), timeout=0.05))
+            except asyncio.TimeoutError:
+                break
+        return taken
+
+    assert len(asyncio.run(take_without_release())) == 2
+
+
+def test_slot_limits_rate():
+    """slot() waits for the host's token bucket"""
+    scheduler = PolitenessScheduler(rate_per_host=20.0, max_per_host=1)
+
+    async def two_requests():
+        start = time.monotonic()
+        for _ in range(2):
+            async with scheduler.slot("https://example.com/file"):
+                pass
+        return time.monotonic() - start
+
+    assert asyncio.run(two_requests()) >= 0.04
+
+
+if __name__ == "__main__":
+    test_token_bucket_refills()
+    test_throttled_host_does_not_block_others()
+    test_per_host_concurrency_limit()
+    test_slot_limits_rate()
+    print("✅ Politeness scheduler tests passed")
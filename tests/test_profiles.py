@@ -0,0 +1,80 @@
+"""
+Test performance profiles (no browser required)
+"""
+
+import tempfile
+
+import pytest
+import yaml
+
+from ga_scrap import GAScrap
+from ga_scrap.config_manager import ConfigManager
+
+
+def test_profile_fills_in_launch_settings(monkeypatch):
+    """A profile provides launch args, blocking, viewport, listeners and timeout"""
+    monkeypatch.delenv("GA_SCRAP_PROFILE", raising=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = GAScrap(headless=True, downloads_path=tmp, profile="throughput")
+
+        assert scraper.listeners == "minimal"
+        assert scraper.timeout == 15000
+        assert scraper.viewport == {"width": 1280, "height": 720}
+        assert "image" in scraper.block_resources
+        args = scraper._build_launch_options()["args"]
+        assert "--disable-background-timer-throttling" in args
+        assert "--disable-gpu" in args
+        assert len(args) == len(set(args))
+
+
+def test_explicit_arguments_win_over_profile(monkeypatch):
+    """Arguments passed to GAScrap are not replaced by the profile"""
+    monkeypatch.setenv("GA_SCRAP_PROFILE", "low-memory")
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = GAScrap(headless=True, downloads_path=tmp, timeout=5000,
+                          block_resources=[], listeners="full", launch_args=["--lang=de"])
+
+        assert scraper.profile == "low-memory"
+        assert scraper.timeout == 5000
+        assert scraper.block_resources == []
+        assert scraper.listeners == "full"
+        assert scraper.recycle_policy["max_navigations"] == 200
+        assert "--renderer-process-limit=2" in scraper.launch_args
+        assert scraper.launch_args[-1] == "--lang=de"
+
+
+def test_explicit_default_values_win_over_profile(monkeypatch):
+    """Passing the built-in default value explicitly still overrides the profile"""
+    monkeypatch.delenv("GA_SCRAP_PROFILE", raising=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = GAScrap(headless=True, downloads_path=tmp, profile="fidelity", timeout=30000, slow_mo=0)
+        assert scraper.timeout == 30000 and scraper.slow_mo == 0
+
+        scraper = GAScrap(headless=True, downloads_path=tmp, profile="fidelity")
+        assert scraper.timeout == 60000 and scraper.slow_mo == 0
+
+        scraper = GAScrap(headless=True, downloads_path=tmp)
+        assert scraper.timeout == 30000 and scraper.viewport == {"width": 1920, "height": 1080}
+
+        scraper = GAScrap(headless=True, downloads_path=tmp, profile="low-memory", recycle_policy={})
+        assert scraper.recycle_policy == {}
+
+
+def test_user_config_overrides_profile(monkeypatch):
+    """config.yaml can tweak built-in profiles and define new ones"""
+    with tempfile.TemporaryDirectory() as tmp:
+        monkeypatch.setenv("HOME", tmp)
+        manager = ConfigManager()
+        manager.config_file.write_text(yaml.safe_dump({"profiles": {
+            "throughput": {"timeout": 9000},
+            "archive": {"listeners": "full", "block_resources": []}
+        }}))
+        manager.config = manager.load_config()
+
+        throughput = manager.get_profile("throughput")
+        assert throughput["timeout"] == 9000
+        assert throughput["listeners"] == "minimal"
+        assert "archive" in manager.list_profiles()
+        assert "fidelity" in manager.list_profiles()
+        with pytest.raises(ValueError):
+            manager.get_profile("missing")
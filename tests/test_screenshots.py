@@ -0,0 +1,95 @@
+"""
+Test the screenshot pipeline (no browser required)
+"""
+
+import asyncio
+import io
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ga_scrap import GAScrap
+from ga_scrap.screenshots import ScreenshotPipeline
+
+from fakes import FakePage
+
+
+def test_identical_frames_are_written_once():
+    """Duplicate frames return the earlier path and are not written again"""
+    async def run(tmp):
+        pipeline = ScreenshotPipeline(output_dir=tmp, format="jpeg", quality=50)
+        page = FakePage(screenshots=[b"frame-a", b"frame-a", b"frame-b"])
+        first = await pipeline.capture(page, "one")
+        second = await pipeline.capture(page, "two")
+        third = await pipeline.capture(page, "three.png")
+        await pipeline.close()
+        return pipeline, page, first, second, third
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline, page, first, second, third = asyncio.run(run(tmp))
+
+        assert first == second == Path(tmp) / "one.jpg"
+        assert third == Path(tmp) / "three.jpg"
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["one.jpg", "three.jpg"]
+        assert pipeline.stats["duplicates"] == 1 and pipeline.stats["written"] == 2
+        assert page.screenshot_options[0] == {"type": "jpeg", "quality": 50}
+
+
+def test_thumbnail_webp_encoding():
+    """Thumbnails are downscaled and re-encoded in the worker threads"""
+    Image = pytest.importorskip("PIL.Image")
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (1280, 720), (200, 30, 30)).save(buffer, format="PNG")
+
+    async def run(tmp):
+        pipeline = ScreenshotPipeline(output_dir=tmp, format="webp", thumbnail=(320, 320))
+        page = FakePage(screenshots=[buffer.getvalue()])
+        path = await pipeline.capture(page, "thumb", full_page=True)
+        await pipeline.close()
+        return page, path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        page, path = asyncio.run(run(tmp))
+        assert page.screenshot_options[0] == {"type": "png", "full_page": True}
+        with Image.open(path) as image:
+            assert image.format == "WEBP"
+            assert image.size == (320, 180)
+
+
+def test_dedupe_memory_is_bounded():
+    """Only the most recently seen frame hashes are remembered"""
+    async def run(tmp):
+        pipeline = ScreenshotPipeline(output_dir=tmp, max_seen=2)
+        page = FakePage(screenshots=[b"a", b"b", b"a", b"c", b"b"])
+        paths = [await pipeline.capture(page, f"shot{i}") for i in range(5)]
+        await pipeline.close()
+        return pipeline, paths
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline, paths = asyncio.run(run(tmp))
+
+    # 'a' was refreshed by its repeat, so 'b' was the one forgotten when 'c' came in
+    assert paths[2] == paths[0]
+    assert paths[4].name == "shot4.png"
+    assert len(pipeline._seen) == 2
+
+
+def test_reconfiguring_waits_for_queued_writes():
+    """Replacing the pipeline writes everything queued on the old one first"""
+    async def run(tmp):
+        scraper = GAScrap(headless=True, downloads_path=tmp)
+        scraper.page = FakePage(screenshots=[b"frame-%d" % i for i in range(20)])
+        await scraper.configure_screenshots(output_dir=tmp)
+        for i in range(20):
+            await scraper.capture_screenshot(f"old{i}")
+        old = scraper.screenshot_pipeline
+        await scraper.configure_screenshots(output_dir=tmp, format="jpeg")
+        return old, scraper.screenshot_pipeline
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old, new = asyncio.run(run(tmp))
+        assert old.stats["written"] == 20
+        assert len(list(Path(tmp).glob("old*.png"))) == 20
+        assert new is not old and new.format == "jpeg"
@@ -0,0 +1,122 @@
+"""
+Test the streaming result sinks (no browser required)
+"""
+
+import csv
+import gzip
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ga_scrap.sinks import NDJSONSink, GzipNDJSONSink, CSVSink, SQLiteSink, open_sink
+
+
+def test_ndjson_background_writer():
+    """Records written from the background thread are all on disk after close"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.jsonl"
+        with NDJSONSink(path, flush_every=7) as sink:
+            for i in range(100):
+                sink.write({"i": i})
+            sink.write_many({"i": i} for i in range(100, 150))
+            sink.flush()
+            assert len(path.read_text().splitlines()) == 150
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["i"] for line in lines] == list(range(150))
+
+
+def test_rotation_and_gzip():
+    """Rotation starts new numbered files; gzip output decompresses"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with GzipNDJSONSink(Path(tmp) / "out.jsonl.gz", rotate_records=40, background=False) as sink:
+            sink.write_many({"i": i} for i in range(100))
+
+        assert [p.name for p in sink.files] == ["out-00001.jsonl.gz", "out-00002.jsonl.gz", "out-00003.jsonl.gz"]
+        with gzip.open(sink.files[-1], "rt", encoding="utf-8") as f:
+            assert [json.loads(line)["i"] for line in f] == list(range(80, 100))
+
+
+def test_csv_sink_and_open_sink():
+    """CSV columns come from the first record and each rotated file has a header"""
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = open_sink(Path(tmp) / "out.csv", rotate_records=2)
+        assert isinstance(sink, CSVSink)
+        sink.write_many([{"a": 1, "b": 2}, {"a": 3, "b": 4, "extra": 5}, {"a": 6}])
+        sink.close()
+
+        with open(sink.files[0], newline="") as f:
+            assert list(csv.DictReader(f)) == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+        with open(sink.files[1], newline="") as f:
+            assert list(csv.DictReader(f)) == [{"a": "6", "b": ""}]
+
+
+def test_parquet_sink_schema_evolution():
+    """Row groups follow the inferred schema; new fields start a new part"""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open_sink(Path(tmp) / "out.parquet", row_group_size=3) as sink:
+            sink.write_many({"i": i, "title": f"t{i}", "tags": ["a"]} for i in range(6))
+            sink.write_many({"i": i, "title": None, "price": 9.5} for i in range(6, 9))
+
+        assert [p.name for p in sink.files] == ["out.parquet", "out-00002.parquet"]
+        assert not list(Path(tmp).glob("*.part"))
+
+        first = pq.ParquetFile(sink.files[0])
+        assert first.metadata.num_row_groups == 2
+        assert first.schema_arrow.names == ["i", "title", "tags"]
+
+        second = pq.read_table(sink.files[1])
+        assert second.column_names == ["i", "title", "tags", "price"]
+        assert second.column("price").to_pylist() == [9.5] * 3
+        assert str(second.schema.field("i").type) == "int64"
+
+
+def test_sqlite_sink_upsert_and_new_columns():
+    """Rows are upserted on the natural key and new fields become columns"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.db"
+        with SQLiteSink(path, table="items", key="url", flush_every=100) as sink:
+            sink.write_many({"url": f"https://a.example/{i % 500}", "n": i} for i in range(1000))
+            sink.write({"url": "https://a.example/1", "price": 9.5, "tags": ["x"]})
+
+        conn = sqlite3.connect(path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 500
+            row = conn.execute(
+                "SELECT n, price, tags FROM items WHERE url = 'https://a.example/1'"
+            ).fetchone()
+            assert row == (501, 9.5, '["x"]')
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+
+def test_sqlite_sink_rollback_and_existing_table():
+    """A failed batch leaves the schema cache intact; existing tables get the key index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE items (url, n CHECK (n >= 0))")
+        conn.execute("INSERT INTO items VALUES ('https://a.example/1', 1)")
+        conn.commit()
+        conn.close()
+
+        sink = SQLiteSink(path, table="items", key="url", background=False)
+        sink.write({"url": "https://a.example/2", "n": -1, "extra": "x"})
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.flush()
+        assert sink.columns == ["url", "n"]
+
+        sink.write({"url": "https://a.example/1", "n": 2, "extra": "y"})
+        sink.close()
+
+        conn = sqlite3.connect(path)
+        try:
+            assert conn.execute("SELECT url, n, extra FROM items").fetchall() == [("https://a.example/1", 2, "y")]
+        finally:
+            conn.close()
@@ -0,0 +1,100 @@
+"""
+Test single-call table extraction (fake page, no browser required)
+"""
+
+import asyncio
+
+import pytest
+
+from ga_scrap import GAScrap
+from ga_scrap.tables import read_tables
+
+from fakes import FakePage
+
+# What the in-page script returns for a table with a two-row header
+# (Name rowspan=2, Price colspan=2 over Min/Max), a rowspan body cell and
+# a spacer row, followed by a table without <thead>
+RAW_TABLES = [
+    {
+        "header": [["Name", "Price", "Price"], ["Name", "Min", "Max"]],
+        "body": [["A", "1", "2"], ["A", "3", "4"], ["", "", ""]],
+    },
+    {"header": [["x", "x", ""]], "body": [["1", "2", "3"]]},
+]
+
+
+def test_orientations_and_header_names():
+    """Stacked headers are joined, duplicates numbered, blanks named, spacer rows dropped"""
+    page = FakePage(rows={"table": RAW_TABLES})
+
+    records, generic = asyncio.run(read_tables(page))
+    columns = asyncio.run(read_tables(page, orient="columns"))[0]
+    rows = asyncio.run(read_tables(page, orient="rows"))[0]
+
+    assert records == [
+        {"Name": "A", "Price Min": "1", "Price Max": "2"},
+        {"Name": "A", "Price Min": "3", "Price Max": "4"},
+    ]
+    assert generic == [{"x": "1", "x_2": "2", "column_3": "3"}]
+    assert columns == {"Name": ["A", "A"], "Price Min": ["1", "3"], "Price Max": ["2", "4"]}
+    assert rows["headers"] == ["Name", "Price Min", "Price Max"] and len(rows["rows"]) == 2
+    assert len(page.evaluations) == 3
+
+    with pytest.raises(ValueError):
+        asyncio.run(read_tables(page, orient="matrix"))
+
+
+def test_scraper_reads_a_table_in_one_call():
+    """extract_table() makes a single browser call and passes the options as arguments"""
+    scraper = GAScrap(headless=True)
+    scraper.page = FakePage(rows={"#prices": RAW_TABLES})
+
+    table = asyncio.run(scraper.extract_table("#prices", header_rows=2))
+
+    assert table[0]["Price Max"] == "2"
+    assert len(scraper.page.evaluations) == 1
+    assert scraper.page.evaluations[0][2] == {"headerRows": 2, "limit": 1}
+
+
+TABLES_HTML = """
+<table id="prices">
+  <thead>
+    <tr><th rowspan="2">Name</th><th colspan="2">Price</th></tr>
+    <tr><th>Min</th><th>Max</th></tr>
+  </thead>
+  <tbody>
+    <tr><td rowspan="2">Lamp</td><td>1</td><td>2</td></tr>
+    <tr><td>3</td><td>4</td></tr>
+    <tr><td colspan="3"></td></tr>
+  </tbody>
+</table>
+<table id="th-row">
+  <tr><th>A</th><th>B</th></tr>
+  <tr><td>1</td><td>2</td></tr>
+</table>
+<table id="no-header">
+  <tr><td>x</td><td>y</td></tr>
+  <tr><td>1</td><td>2</td></tr>
+</table>
+"""
+
+
+def test_tables_script_in_browser(run_in_browser):
+    """The in-page script expands spans and detects <thead>, all-<th> and first-row headers"""
+    async def check(page):
+        return (
+            await read_tables(page),
+            await read_tables(page, "#no-header", orient="rows", header_rows=0),
+            await read_tables(page, limit=1),
+        )
+
+    (prices, th_row, no_header), (raw,), limited = run_in_browser(TABLES_HTML, check)
+
+    assert prices == [
+        {"Name": "Lamp", "Price Min": "1", "Price Max": "2"},
+        {"Name": "Lamp", "Price Min": "3", "Price Max": "4"},
+    ]
+    assert th_row == [{"A": "1", "B": "2"}]
+    assert no_header == [{"x": "1", "y": "2"}]
+    assert raw == {"headers": ["column_1", "column_2"], "rows": [["x", "y"], ["1", "2"]]}
+    assert limited == [prices]
@@ -0,0 +1,114 @@
+"""
+Test the multi-process worker pool (fake scrapers, no browser required)
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from ga_scrap import WorkerPool
+
+from fakes import FakeScraper
+
+
+class BrokenScraper(FakeScraper):
+    """Scraper whose browser never starts"""
+
+    async def start(self):
+        raise RuntimeError("no browser")
+
+
+async def shout(page, url):
+    if url.endswith("bad"):
+        raise ValueError("bad page")
+    return url.upper()
+
+
+async def crash_once(page, url):
+    # The first worker to see this URL dies; the chunk must be retried by another one
+    marker = Path(url.split("|")[1])
+    if url.startswith("crash") and not marker.exists():
+        marker.write_text(str(os.getpid()))
+        os._exit(1)
+    return os.getpid()
+
+
+def test_results_come_back_in_input_order():
+    """Chunks run on several workers, results are merged in input order"""
+    urls = [f"https://example.com/{i}" for i in range(9)] + ["https://example.com/0", "https://example.com/bad"]
+    pool = WorkerPool(workers=2, chunk_size=2, scraper_factory=FakeScraper)
+
+    results = pool.map(urls, shout)
+
+    assert [r["url"] for r in results] == urls
+    assert results[0]["data"] == "HTTPS://EXAMPLE.COM/0"
+    assert results[-1]["error"] == "bad page"
+    assert {r["worker"] for r in results} <= {0, 1}
+    assert pool.stats["results"] == 11 and pool.stats["failed"] == 1
+
+
+def test_streaming_reuses_started_workers():
+    """imap(ordered=False) streams; a started pool serves several calls"""
+    with WorkerPool(workers=2, chunk_size=3, scraper_factory=FakeScraper) as pool:
+        first = {r["data"] for r in pool.imap(["a", "b", "c", "d"], shout, ordered=False)}
+        second = pool.map(["e"], shout)
+
+    assert first == {"A", "B", "C", "D"}
+    assert second[0]["data"] == "E"
+
+
+def test_chunks_of_a_dead_worker_are_requeued():
+    """A worker crash hands its unfinished chunk to the remaining worker"""
+    with tempfile.TemporaryDirectory() as tmp:
+        marker = Path(tmp) / "crashed"
+        urls = [f"crash|{marker}"] + [f"ok{i}|{marker}" for i in range(5)]
+        pool = WorkerPool(workers=2, chunk_size=2, scraper_factory=FakeScraper)
+
+        results = pool.map(urls, crash_once)
+
+        assert [r["url"] for r in results] == urls
+        assert all(r["error"] is None for r in results)
+        assert results[0]["data"] != int(marker.read_text())
+        assert pool.stats["requeued"] >= 1
+
+
+def load_handler(marker):
+    # Runs while the worker unpickles its chunk: the first one dies before starting on it
+    if not Path(marker).exists():
+        Path(marker).write_text(str(os.getpid()))
+        os._exit(1)
+    return shout
+
+
+class DiesOnDelivery:
+    """Handler that kills the first worker receiving it"""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return load_handler, (self.marker,)
+
+
+def test_chunks_taken_by_a_worker_that_dies_at_once_are_requeued():
+    """A worker dying right after taking a chunk, before any result, still loses nothing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        marker = str(Path(tmp) / "died")
+        urls = [f"u{i}" for i in range(4)]
+        pool = WorkerPool(workers=2, chunk_size=1, prefetch=1, scraper_factory=FakeScraper)
+
+        results = pool.map(urls, DiesOnDelivery(marker))
+
+        assert [r["data"] for r in results] == ["U0", "U1", "U2", "U3"]
+        assert pool.stats["requeued"] == 1
+
+
+def test_all_workers_failing_raises():
+    """If no worker can start its browser the error is reported"""
+    pool = WorkerPool(workers=2, scraper_factory=BrokenScraper)
+    try:
+        pool.map(["a"], shout)
+    except RuntimeError as e:
+        assert "no browser" in str(e)
+    else:
+        raise AssertionError("expected RuntimeError")